@@ -0,0 +1,454 @@
+#!/usr/bin/env python3
+"""
+Indexed Article Database
+========================
+
+Embedded SQLite store that answers "do we already have this link?" or
+"latest 50 Technology articles" with an index lookup instead of loading and
+scanning every JSON file the fetchers write.
+
+- Key: NewsData article_id, or a hash of the canonical link for RSS/GDELT
+  articles that have no id
+- Indexes: canonical link, source, category (NewsData's category list is
+  split into one row per category) and publish date
+- Upserts: re-fetching an article updates it in place; fields the new record
+  lacks (e.g. full_content on a plain metadata refresh) keep their old value,
+  both in the indexed columns and in the stored article JSON
+- Full text: an FTS5 index over title, description and full_content
+
+Publish dates from every source (NewsData "2025-11-08 08:45:00", RSS
+"Sat, 08 Nov 2025 18:43:55 +0000", news-please datetimes) are normalized to
+UTC "YYYY-MM-DD HH:MM:SS" so they sort correctly.
+
+ArticleDatabase has the same append()/append_many() methods as
+article_store.ArticleStore, so it can be passed as `store=` to any fetcher.
+
+Usage:
+    from article_db import ArticleDatabase
+
+    db = ArticleDatabase()
+    db.upsert_many(articles)
+
+    db.has_link("https://www.bbc.co.uk/news/articles/abc?at_medium=RSS")
+    db.latest(category="technology", limit=50)
+    db.search("artificial intelligence")
+
+Run this file to import the existing JSON snapshots (fetched_articles.json,
+diverse_news.json, ...) into the database.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, List, Optional
+
+from metrics import get_metrics
+from url_utils import canonicalize_url
+
+DEFAULT_DB_PATH = os.getenv("ARTICLE_DB_PATH", "articles.sqlite3")
+DEFAULT_BATCH_SIZE = 500
+
+# JSON snapshots written by the fetchers' save_* helpers
+SNAPSHOT_FILES = [
+    "fetched_articles.json",
+    "fetched_articles_full.json",
+    "articles_with_content.json",
+    "diverse_news.json",
+    "news.json",
+]
+
+# Placeholder values NewsData returns for fields the free tier doesn't include
+PAID_PLAN_PREFIX = "ONLY AVAILABLE IN"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    article_id TEXT PRIMARY KEY,
+    link TEXT,
+    canonical_link TEXT,
+    source TEXT COLLATE NOCASE,
+    pub_date TEXT,
+    title TEXT,
+    description TEXT,
+    full_content TEXT,
+    data TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS articles_canonical_link ON articles (canonical_link);
+CREATE INDEX IF NOT EXISTS articles_source ON articles (source, pub_date);
+CREATE INDEX IF NOT EXISTS articles_pub_date ON articles (pub_date);
+
+CREATE TABLE IF NOT EXISTS article_categories (
+    category TEXT NOT NULL COLLATE NOCASE,
+    article_id TEXT NOT NULL,
+    pub_date TEXT,
+    PRIMARY KEY (category, article_id)
+);
+CREATE INDEX IF NOT EXISTS article_categories_latest ON article_categories (category, pub_date);
+"""
+
+# External-content FTS5 table kept in sync with `articles` by triggers
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, description, full_content,
+    content='articles', content_rowid='rowid'
+);
+CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts (rowid, title, description, full_content)
+    VALUES (new.rowid, new.title, new.description, new.full_content);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, description, full_content)
+    VALUES ('delete', old.rowid, old.title, old.description, old.full_content);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_fts_update AFTER UPDATE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, description, full_content)
+    VALUES ('delete', old.rowid, old.title, old.description, old.full_content);
+    INSERT INTO articles_fts (rowid, title, description, full_content)
+    VALUES (new.rowid, new.title, new.description, new.full_content);
+END;
+"""
+
+UPSERT = """
+INSERT INTO articles (
+    article_id, link, canonical_link, source, pub_date,
+    title, description, full_content, data, first_seen, updated
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (article_id) DO UPDATE SET
+    link = COALESCE(excluded.link, link),
+    canonical_link = COALESCE(excluded.canonical_link, canonical_link),
+    source = COALESCE(excluded.source, source),
+    pub_date = COALESCE(excluded.pub_date, pub_date),
+    title = COALESCE(excluded.title, title),
+    description = COALESCE(excluded.description, description),
+    full_content = COALESCE(excluded.full_content, full_content),
+    data = json_patch(data, ?),
+    updated = excluded.updated
+"""
+
+
+def _text(value) -> Optional[str]:
+    """A usable string field, or None for missing/placeholder values"""
+    if value is None or isinstance(value, (list, dict)):
+        return None
+    value = str(value).strip()
+    if not value or value == "N/A" or value.startswith(PAID_PLAN_PREFIX):
+        return None
+    return value
+
+
+def _patch(article: Dict) -> Dict:
+    """The fields of an article that should overwrite a stored copy (no missing/placeholder values)"""
+    return {
+        name: value for name, value in article.items()
+        if value is not None and (not isinstance(value, str) or _text(value) is not None)
+    }
+
+
+def _quote_terms(query: str) -> str:
+    """Plain-text query as FTS5 syntax: each whitespace-separated term as a quoted string"""
+    terms = ['"' + term.replace('"', '""') + '"' for term in query.split()]
+    return " ".join(terms) or '""'
+
+
+def normalize_pub_date(value) -> Optional[str]:
+    """
+    Normalize a publish date from any fetcher to UTC "YYYY-MM-DD HH:MM:SS"
+
+    Returns None if the value can't be parsed.
+    """
+    value = _text(value)
+    if not value:
+        return None
+
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            parsed = parsedate_to_datetime(value)  # RFC 822 dates from RSS
+        except (TypeError, ValueError, IndexError):
+            return None
+
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def article_key(article: Dict) -> Optional[str]:
+    """NewsData article_id, else a hash of the canonical link (None if neither exists)"""
+    article_id = _text(article.get("article_id"))
+    if article_id:
+        return article_id
+
+    link = _text(article.get("link"))
+    if link:
+        return "link:" + hashlib.sha1(canonicalize_url(link).encode("utf-8")).hexdigest()
+    return None
+
+
+def article_categories(article: Dict) -> List[str]:
+    """Categories as a list (NewsData sends a list, diverse_news_fetcher a string)"""
+    category = article.get("category")
+    if isinstance(category, str):
+        category = [category]
+    return [c.strip().lower() for c in category or [] if isinstance(c, str) and c.strip()]
+
+
+class ArticleDatabase:
+    """
+    SQLite article store with indexed lookups and full-text search
+    """
+
+    def __init__(self, path: str = DEFAULT_DB_PATH):
+        """
+        Args:
+            path: SQLite database file (":memory:" for a throwaway store)
+        """
+        self.path = path
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+        try:
+            self._conn.executescript(FTS_SCHEMA)
+            self.full_text = True
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5 - search() falls back to LIKE
+            self.full_text = False
+
+        self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def _row(self, article: Dict, now: float) -> Optional[tuple]:
+        key = article_key(article)
+        if key is None:
+            return None
+
+        link = _text(article.get("link"))
+        description = _text(article.get("description")) or _text(article.get("summary"))
+
+        return (
+            key,
+            link,
+            canonicalize_url(link) if link else None,
+            _text(article.get("source_id")) or _text(article.get("source")),
+            normalize_pub_date(
+                article.get("pubDate") or article.get("published") or article.get("publish_date")
+            ),
+            _text(article.get("title")),
+            description,
+            _text(article.get("full_content")),
+            json.dumps(article, ensure_ascii=False, default=str),
+            now,
+            now,
+            # Merged into the stored JSON on re-upsert, like the COALESCE'd columns
+            json.dumps(_patch(article), ensure_ascii=False, default=str),
+        )
+
+    def upsert_many(self, articles: Iterable[Dict], batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+        """
+        Insert or update articles in batches (one transaction per batch)
+
+        Articles without an article_id or link can't be keyed and are skipped.
+
+        Returns:
+            Number of articles written
+        """
+        written = 0
+        batch = []
+
+        for article in articles:
+            batch.append(article)
+            if len(batch) >= batch_size:
+                written += self._upsert_batch(batch)
+                batch = []
+
+        if batch:
+            written += self._upsert_batch(batch)
+        return written
+
+    def _upsert_batch(self, articles: List[Dict]) -> int:
+        now = time.time()
+        rows = []
+        categories = []
+
+        for article in articles:
+            row = self._row(article, now)
+            if row is None:
+                continue
+            rows.append(row)
+            categories.extend((category, row[0]) for category in article_categories(article))
+
+        if not rows:
+            return 0
+
+        with get_metrics().timer("save", target="sqlite"), self._lock, self._conn:
+            self._conn.executemany(UPSERT, rows)
+            # Copy the merged pub_date so (category, pub_date) serves "latest in category"
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO article_categories (category, article_id, pub_date) "
+                "SELECT ?, article_id, pub_date FROM articles WHERE article_id = ?",
+                categories,
+            )
+        return len(rows)
+
+    def append(self, article: Dict):
+        """Upsert one article (ArticleStore-compatible)"""
+        self.upsert_many([article])
+
+    def append_many(self, articles: Iterable[Dict]) -> int:
+        """Upsert articles (ArticleStore-compatible)"""
+        return self.upsert_many(articles)
+
+    def _fetch(self, sql: str, params: tuple = ()) -> List[Dict]:
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def get(self, article_id: str) -> Optional[Dict]:
+        """Article by NewsData article_id (or the "link:..." key of an RSS article)"""
+        found = self._fetch("SELECT data FROM articles WHERE article_id = ?", (article_id,))
+        return found[0] if found else None
+
+    def get_by_link(self, url: str) -> Optional[Dict]:
+        """Article stored under any spelling of this link (tracking params, redirects, ...)"""
+        found = self._fetch(
+            "SELECT data FROM articles WHERE canonical_link = ? ORDER BY updated DESC LIMIT 1",
+            (canonicalize_url(url),),
+        )
+        return found[0] if found else None
+
+    def has_link(self, url: str) -> bool:
+        """True if an article with this (canonical) link is stored"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM articles WHERE canonical_link = ? LIMIT 1", (canonicalize_url(url),)
+            ).fetchone()
+        return row is not None
+
+    def latest(
+        self,
+        category: Optional[str] = None,
+        source: Optional[str] = None,
+        limit: int = 50
+    ) -> List[Dict]:
+        """
+        Most recently published articles, optionally by category and/or source
+
+        Args:
+            category: Category name (case-insensitive, e.g. "technology")
+            source: NewsData source_id or RSS source name (case-insensitive)
+            limit: Max articles to return
+        """
+        if category:
+            sql = (
+                "SELECT a.data FROM article_categories c "
+                "JOIN articles a ON a.article_id = c.article_id "
+                "WHERE c.category = ?"
+            )
+            params = [category.strip().lower()]
+            if source:
+                sql += " AND a.source = ?"
+                params.append(source)
+            sql += " ORDER BY c.pub_date DESC LIMIT ?"
+        elif source:
+            sql = "SELECT data FROM articles WHERE source = ? ORDER BY pub_date DESC LIMIT ?"
+            params = [source]
+        else:
+            sql = "SELECT data FROM articles ORDER BY pub_date DESC LIMIT ?"
+            params = []
+
+        params.append(limit)
+        return self._fetch(sql, tuple(params))
+
+    def search(self, query: str, limit: int = 50) -> List[Dict]:
+        """
+        Full-text search over title, description and full_content, best match first
+
+        Args:
+            query: FTS5 query (plain words, "exact phrase", OR, prefix*). Text that
+                   isn't valid FTS5 syntax (e.g. "covid-19", "U.S.", "AT&T:") is
+                   searched as plain words instead of raising.
+            limit: Max articles to return
+        """
+        if not self.full_text:
+            pattern = f"%{query}%"
+            return self._fetch(
+                "SELECT data FROM articles WHERE title LIKE ? OR description LIKE ? "
+                "OR full_content LIKE ? ORDER BY pub_date DESC LIMIT ?",
+                (pattern, pattern, pattern, limit),
+            )
+
+        sql = (
+            "SELECT a.data FROM articles_fts f JOIN articles a ON a.rowid = f.rowid "
+            "WHERE articles_fts MATCH ? ORDER BY f.rank LIMIT ?"
+        )
+        try:
+            return self._fetch(sql, (query, limit))
+        except sqlite3.OperationalError:
+            # Not FTS5 syntax - match every term literally
+            return self._fetch(sql, (_quote_terms(query), limit))
+
+    def import_json(self, filename: str) -> int:
+        """
+        Upsert a JSON snapshot written by one of the save_* helpers
+
+        Handles plain article lists and diverse_news.json's {category: [articles]}.
+
+        Returns:
+            Number of articles written
+        """
+        with open(filename, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        if isinstance(data, dict):
+            articles = [
+                {**article, "category": article.get("category") or category}
+                for category, category_articles in data.items()
+                for article in category_articles
+            ]
+        else:
+            articles = data
+
+        return self.upsert_many(articles)
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    print("🗄️  Importing JSON snapshots into the article database\n")
+
+    db = ArticleDatabase()
+
+    for filename in SNAPSHOT_FILES:
+        if not os.path.exists(filename):
+            print(f"   - {filename}: not found")
+            continue
+        print(f"   ✓ {filename}: {db.import_json(filename)} articles")
+
+    print(f"\n✓ {len(db)} articles in {db.path}")
+
+    for article in db.latest(limit=5):
+        print(f"   {article.get('pubDate') or article.get('published', 'N/A')}  {article.get('title', 'N/A')[:70]}")
+
+
+if __name__ == "__main__":
+    main()
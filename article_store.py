@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Append-Only Article Store
+=========================
+
+JSON Lines storage for fetched articles, replacing the save_* helpers that
+rewrite a whole pretty-printed JSON array on every run.
+
+- Each article is one line, appended as it arrives: a write costs
+  O(new articles), and nothing has to be held in memory to persist it
+- Records go into an active segment (<name>-000001.jsonl.part); once it grows
+  past max_segment_bytes it is sealed and a new one is started
+- Sealing is atomic: the segment is fsynced and renamed (or gzip-compressed to
+  a temp file and renamed) so readers never see half a sealed segment
+- Sealed segments can be stored gzip-compressed (compress=True)
+
+Usage:
+    from article_store import ArticleStore
+
+    with ArticleStore("article_store", name="newsdata") as store:
+        store.append_many(articles)
+
+    for article in ArticleStore("article_store", name="newsdata").iter_articles():
+        ...
+
+The JSON snapshot files (fetched_articles.json, diverse_news.json, ...) are
+still written by the save_* helpers, since lib/news/news-topic-pool.ts reads
+them as JSON arrays.
+"""
+
+import gzip
+import json
+import os
+import re
+import shutil
+import threading
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from metrics import get_metrics
+
+DEFAULT_STORE_DIR = os.getenv("ARTICLE_STORE_DIR", "article_store")
+DEFAULT_SEGMENT_BYTES = 64 * 1024 * 1024  # Seal segments at 64 MB
+
+
+class ArticleStore:
+    """
+    Append-only JSONL article store with atomic segment rotation
+    """
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_STORE_DIR,
+        name: str = "articles",
+        compress: bool = False,
+        max_segment_bytes: int = DEFAULT_SEGMENT_BYTES
+    ):
+        """
+        Args:
+            directory: Directory holding the segments
+            name: Segment file prefix (one store per name)
+            compress: gzip segments when they are sealed
+            max_segment_bytes: Size at which the active segment is sealed
+        """
+        self.directory = directory
+        self.name = name
+        self.compress = compress
+        self.max_segment_bytes = max_segment_bytes
+
+        self._pattern = re.compile(rf"^{re.escape(name)}-(\d{{6}})\.jsonl(\.gz|\.part)?$")
+        self._lock = threading.Lock()
+        self._file = None
+        self._sequence = 0
+
+        os.makedirs(directory, exist_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _segment_path(self, sequence: int, suffix: str) -> str:
+        return os.path.join(self.directory, f"{self.name}-{sequence:06d}{suffix}")
+
+    def _scan(self) -> List[Tuple[int, str]]:
+        """(sequence, filename) of all segments, oldest first"""
+        found = []
+        for filename in os.listdir(self.directory):
+            match = self._pattern.match(filename)
+            if match:
+                found.append((int(match.group(1)), filename))
+        return sorted(found)
+
+    def _open_active(self):
+        """Reopen an unsealed segment left by a previous run, or start a new one"""
+        segments = self._scan()
+        active = [seq for seq, filename in segments if filename.endswith(".part")]
+        sealed = {seq for seq, filename in segments if not filename.endswith(".part")}
+
+        if active and active[-1] not in sealed:
+            self._sequence = active[-1]
+        else:
+            # A .part next to its sealed copy means a crash right after sealing
+            for seq in active:
+                if seq in sealed:
+                    os.remove(self._segment_path(seq, ".jsonl.part"))
+            self._sequence = (segments[-1][0] + 1) if segments else 1
+
+        path = self._segment_path(self._sequence, ".jsonl.part")
+
+        # Terminate a line torn by a crash so it doesn't swallow the next record
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            with open(path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                torn = f.read(1) != b"\n"
+        else:
+            torn = False
+
+        self._file = open(path, "a", encoding="utf-8")
+        if torn:
+            self._file.write("\n")
+
+    def append(self, article: Dict):
+        """Append one article"""
+        self.append_many([article])
+
+    def append_many(self, articles: Iterable[Dict]) -> int:
+        """
+        Append articles and flush them to disk
+
+        Returns:
+            Number of articles written
+        """
+        with get_metrics().timer("save", target="jsonl"):
+            lines = [json.dumps(article, ensure_ascii=False, default=str) + "\n" for article in articles]
+            if not lines:
+                return 0
+
+            with self._lock:
+                if self._file is None:
+                    self._open_active()
+
+                self._file.write("".join(lines))
+                self._file.flush()
+
+                if self._file.tell() >= self.max_segment_bytes:
+                    self._seal()
+
+        return len(lines)
+
+    def rotate(self):
+        """Seal the active segment now (the next append starts a new one)"""
+        with self._lock:
+            if self._file is None:
+                self._open_active()
+            self._seal()
+
+    def _seal(self):
+        """fsync, then atomically turn the .part segment into a sealed one"""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self._file = None
+
+        part_path = self._segment_path(self._sequence, ".jsonl.part")
+        if os.path.getsize(part_path) == 0:
+            os.remove(part_path)
+            return
+
+        if self.compress:
+            final_path = self._segment_path(self._sequence, ".jsonl.gz")
+            tmp_path = final_path + ".tmp"
+            with open(part_path, "rb") as src, gzip.open(tmp_path, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            os.replace(tmp_path, final_path)
+            os.remove(part_path)
+        else:
+            os.replace(part_path, self._segment_path(self._sequence, ".jsonl"))
+
+    def iter_articles(self) -> Iterator[Dict]:
+        """Yield every stored article, oldest first (sealed segments, then the active one)"""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+            segments = self._scan()
+
+        for _, filename in segments:
+            path = os.path.join(self.directory, filename)
+            opener = gzip.open if filename.endswith(".gz") else open
+
+            try:
+                f = opener(path, "rt", encoding="utf-8")
+            except FileNotFoundError:
+                # The active segment was sealed (renamed) since the scan
+                continue
+
+            with f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        # A torn last line from a crash mid-append
+                        continue
+
+    def close(self):
+        """Flush and close the active segment (it stays unsealed for the next run)"""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                self._file.close()
+                self._file = None
+
@@ -1,34 +1,364 @@
 #!/usr/bin/env python3
-import os
+"""
+Transcribe the exam PDFs into pdfs/<level>/FULL_TRANSCRIPT.md.
+
+When a level folder has a PDF, its embedded text layer is read page by page
+(pypdf) - no rasterization at all. Only pages without a usable text layer
+(scans) fall back to OCR of the page PNG; missing PNGs of those pages are
+rendered first. Folders with only pngs/ (or --ocr-only) are fully OCR'd.
+
+Rendering and OCR run on one process pool (one worker per core) and results
+are merged back in page order; a page that fails to render or OCR gets a
+placeholder in its transcript instead of stopping the run. Recognized text is
+cached per page under pdfs/.ocr_cache/, keyed by the SHA-256 of the image and
+the OCR language, so re-running only OCRs new or changed pages.
+
+Requires pypdf[crypto] (pypdf plus cryptography, for the AES-encrypted exam
+PDFs) for text layers, and the tesseract binary with German language data plus
+pytesseract and Pillow for OCR:
+
+    pip install "pypdf[crypto]" pytesseract Pillow
+
+A PDF whose text layer can't be read (pypdf missing, encryption it can't
+handle, damaged file) is skipped with a message and its folder's PNGs are
+OCR'd instead.
+"""
+
 import glob
+import hashlib
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Default pdfs/ tree next to this script (override on the command line)
+BASE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pdfs")
+
+FOLDERS = ["B1", "B2", "C1", "C2"]
+OCR_LANG = "deu"
+CACHE_DIR_NAME = ".ocr_cache"
+MIN_TEXT_CHARS = 40  # Less text than this means an image-only page
+
+OCR_NOTE = "This transcript contains OCR text from all PNG images in this folder."
+TEXT_LAYER_NOTE = "This transcript contains the PDF text layer, with OCR text for image-only pages."
+
+
+def page_number(png_file):
+    """Page number from a <name>_page_N.png filename"""
+    return int(png_file.split("_page_")[1].split(".")[0])
+
+
+def image_sha256(path):
+    """SHA-256 of an image file's bytes"""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def cache_path(cache_dir, digest, lang=OCR_LANG):
+    return os.path.join(cache_dir, f"{digest}-{lang}.txt")
+
+
+def load_cached_text(cache_dir, digest, lang=OCR_LANG):
+    """Cached OCR text for an image hash, or None"""
+    try:
+        with open(cache_path(cache_dir, digest, lang), "r", encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def store_cached_text(cache_dir, digest, text, lang=OCR_LANG):
+    """Cache OCR text for an image hash (written atomically)"""
+    path = cache_path(cache_dir, digest, lang)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def ocr_page(png_path, lang=OCR_LANG):
+    """
+    OCR one page image (runs in a worker process).
+
+    Args:
+        png_path (str): Path to the page PNG
+        lang (str): Tesseract language code
+
+    Returns:
+        str: Recognized text
+    """
+    # Imported here so fully cached runs don't need the OCR stack
+    import pytesseract
+    from PIL import Image
+
+    with Image.open(png_path) as image:
+        return pytesseract.image_to_string(image, lang=lang).strip()
+
+
+class TextLayerError(Exception):
+    """A PDF's text layer can't be read (pypdf missing, unsupported encryption, damaged file)"""
+
+
+def iter_pdf_text(pdf_path):
+    """
+    Yield (page_number, text) for each page's embedded text layer.
+
+    Pages are read one at a time, so only the current page is held in memory.
+    Image-only pages yield empty text.
+
+    Raises:
+        TextLayerError: The PDF can't be opened or decrypted
+    """
+    try:
+        from pypdf import PdfReader
+        from pypdf.errors import DependencyError, PdfReadError
+    except ImportError as e:
+        raise TextLayerError(f"pypdf is not installed: {e}") from e
+
+    try:
+        reader = PdfReader(pdf_path)
+        pages = reader.pages
+        len(pages)  # Decrypts (or fails to) here rather than on the first page
+    except (DependencyError, PdfReadError) as e:
+        raise TextLayerError(f"{type(e).__name__}: {e}") from e
+
+    for page_num, page in enumerate(pages, 1):
+        try:
+            text = page.extract_text() or ""
+        except DependencyError as e:
+            # Every page would fail the same way
+            raise TextLayerError(f"{type(e).__name__}: {e}") from e
+        except Exception as e:
+            print(f"  Could not read text layer of page {page_num}: {e}")
+            text = ""
+        yield page_num, text.strip()
+
+
+def find_pdf(folder_path):
+    """The PDF in a level folder, or None"""
+    pdf_files = sorted(f for f in os.listdir(folder_path) if f.lower().endswith('.pdf'))
+    return os.path.join(folder_path, pdf_files[0]) if pdf_files else None
+
+
+def page_png(pdf_path, png_dir, page_num):
+    """Path of the PNG pdf_to_png writes for one PDF page (it may not exist yet)"""
+    from pdf_to_png import page_path
+
+    return page_path(png_dir, os.path.splitext(os.path.basename(pdf_path))[0], page_num)
+
 
-# Base directory
-base_dir = "/Users/green/Desktop/Developer/goethe/pdfs"
-
-# For each folder (B1, B2, C1, C2)
-for folder in ["B1", "B2", "C1", "C2"]:
-    folder_path = os.path.join(base_dir, folder)
-    png_dir = os.path.join(folder_path, "pngs")
-    transcript_file = os.path.join(folder_path, "FULL_TRANSCRIPT.md")
-    
-    # Get all PNG files sorted
-    png_files = sorted(glob.glob(os.path.join(png_dir, "*.png")), 
-                      key=lambda x: int(x.split("_page_")[1].split(".")[0]))
-    
-    print(f"{folder}: {len(png_files)} pages found")
-    print(f"Creating transcript file: {transcript_file}")
-    
-    # Initialize transcript with header
-    with open(transcript_file, 'w') as f:
+def render_missing(executor, to_render, cache_dir, lang=OCR_LANG):
+    """
+    Render image-only pages whose PNG is missing, on the process pool.
+
+    Args:
+        executor: Process pool to render on
+        to_render (list): (pdf_path, png_dir, page_num, page) per missing PNG
+        cache_dir (str): OCR cache directory
+        lang (str): Tesseract language code
+
+    Returns:
+        list: The rendered pages whose text isn't cached yet
+    """
+    from pdf_to_png import render_pages
+
+    futures = {}
+    for pdf_path, png_dir, page_num, page in to_render:
+        os.makedirs(png_dir, exist_ok=True)
+        futures[executor.submit(render_pages, pdf_path, png_dir, page_num, page_num)] = page
+
+    uncached = []
+    for done, future in enumerate(as_completed(futures), 1):
+        page = futures[future]
+        name = os.path.basename(page[0])
+        try:
+            future.result()
+        except Exception as e:
+            print(f"  Render {done}/{len(futures)}: {name} failed: {e}")
+            page[2] = f"[Rendering failed: {e}]"
+            continue
+
+        print(f"  Render {done}/{len(futures)}: {name}")
+        page[1] = image_sha256(page[0])
+        page[2] = load_cached_text(cache_dir, page[1], lang)
+        if page[2] is None:
+            uncached.append(page)
+    return uncached
+
+
+def recognize(executor, pages, cache_dir, lang=OCR_LANG):
+    """
+    OCR pages on the process pool, caching the text, and fill in each page's text.
+
+    Args:
+        executor: Process pool to OCR on
+        pages (list): [png_file, digest, text] entries without text yet
+        cache_dir (str): OCR cache directory
+        lang (str): Tesseract language code
+    """
+    # Identical images (e.g. repeated answer sheets) are recognized once
+    unique = {}
+    for page in pages:
+        unique.setdefault(page[1], page[0])
+
+    futures = {executor.submit(ocr_page, png_file, lang): digest for digest, png_file in unique.items()}
+
+    recognized = {}
+    for done, future in enumerate(as_completed(futures), 1):
+        digest = futures[future]
+        name = os.path.basename(unique[digest])
+        try:
+            text = future.result()
+        except Exception as e:
+            # One bad page shouldn't cost the whole run; it isn't cached, so it's retried next time
+            print(f"  OCR {done}/{len(futures)}: {name} failed: {e}")
+            recognized[digest] = f"[OCR failed: {e}]"
+            continue
+
+        store_cached_text(cache_dir, digest, text, lang)
+        recognized[digest] = text
+        print(f"  OCR {done}/{len(futures)}: {name}")
+
+    for page in pages:
+        page[2] = recognized[page[1]]
+
+
+def write_transcript(folder, transcript_file, pages, note=OCR_NOTE):
+    """
+    Write a FULL_TRANSCRIPT.md file.
+
+    Args:
+        folder (str): Level name used in the heading (e.g. "C2")
+        transcript_file (str): Output path
+        pages (list): (png_file, text) per page, in page order
+        note (str): Line describing where the text came from
+    """
+    with open(transcript_file, 'w', encoding="utf-8") as f:
         f.write(f"# {folder} PDF Transcript\n\n")
-        f.write(f"Total pages: {len(png_files)}\n\n")
-        f.write("This transcript contains OCR text from all PNG images in this folder.\n\n")
-        
-        # Add placeholders for all pages
-        for i, png_file in enumerate(png_files):
-            page_num = i + 1
-            f.write(f"---\n\n# Page {page_num}\n\n[Content to be added from {os.path.basename(png_file)}]\n\n")
-    
-    print(f"✓ Initialized {folder} transcript\n")
-
-print("All transcripts initialized!")
+        f.write(f"Total pages: {len(pages)}\n\n")
+        f.write(f"{note}\n\n")
+
+        for page_num, (png_file, text) in enumerate(pages, 1):
+            body = text or f"[No text recognized in {os.path.basename(png_file)}]"
+            f.write(f"---\n\n# Page {page_num}\n\n{body}\n\n")
+
+
+def transcribe_folders(base_dir, folders=FOLDERS, lang=OCR_LANG, workers=None, text_layer=True):
+    """
+    Transcribe several folders, OCRing on one process pool, and write their transcripts.
+
+    Args:
+        base_dir (str): Directory containing the level folders
+        folders (list): Level folders to transcribe
+        lang (str): Tesseract language code
+        workers (int): Worker processes (default: one per core)
+        text_layer (bool): Use the PDF text layer where there is one
+    """
+    cache_dir = os.path.join(base_dir, CACHE_DIR_NAME)
+    os.makedirs(cache_dir, exist_ok=True)
+
+    # folder -> list of [png_file, digest, text]; text is None until recognized
+    plans = {}
+    notes = {}
+    uncached = []
+    to_render = []
+
+    for folder in folders:
+        folder_path = os.path.join(base_dir, folder)
+        png_dir = os.path.join(folder_path, "pngs")
+        pdf_path = find_pdf(folder_path) if text_layer and os.path.isdir(folder_path) else None
+
+        if pdf_path:
+            pages = []
+            folder_uncached = []
+            folder_render = []
+            try:
+                for page_num, text in iter_pdf_text(pdf_path):
+                    if len(text) >= MIN_TEXT_CHARS:
+                        pages.append([f"{os.path.basename(pdf_path)} page {page_num}", None, text])
+                        continue
+
+                    # Image-only page: OCR its PNG instead (rendered on the pool if missing)
+                    png_file = page_png(pdf_path, png_dir, page_num)
+                    if not os.path.exists(png_file):
+                        page = [png_file, None, None]
+                        pages.append(page)
+                        folder_render.append((pdf_path, png_dir, page_num, page))
+                        continue
+
+                    digest = image_sha256(png_file)
+                    page = [png_file, digest, load_cached_text(cache_dir, digest, lang)]
+                    pages.append(page)
+                    if page[2] is None:
+                        folder_uncached.append(page)
+            except TextLayerError as e:
+                print(f"{folder}: can't read the text layer of {os.path.basename(pdf_path)} "
+                      f"({e}), OCRing its PNGs instead")
+                pdf_path = None
+
+        if pdf_path:
+            uncached += folder_uncached
+            to_render += folder_render
+            missing = len(folder_render)
+            plans[folder] = pages
+            notes[folder] = TEXT_LAYER_NOTE
+            ocr_pages = sum(p[2] is None or p[1] is not None for p in pages)
+            print(f"{folder}: {len(pages)} pages in {os.path.basename(pdf_path)}, "
+                  f"{len(pages) - ocr_pages} from text layer, {ocr_pages} need OCR "
+                  f"({sum(p[2] is None for p in pages)} not cached, {missing} to render)")
+            continue
+
+        # Get all PNG files sorted
+        png_files = sorted(glob.glob(os.path.join(png_dir, "*.png")), key=page_number)
+
+        if not png_files:
+            print(f"{folder}: no pages found in {png_dir}")
+            continue
+
+        pages = []
+        for png_file in png_files:
+            digest = image_sha256(png_file)
+            page = [png_file, digest, load_cached_text(cache_dir, digest, lang)]
+            pages.append(page)
+            if page[2] is None:
+                uncached.append(page)
+
+        plans[folder] = pages
+        notes[folder] = OCR_NOTE
+        print(f"{folder}: {len(pages)} pages found, {sum(p[2] is None for p in pages)} to OCR")
+
+    if to_render or uncached:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            if to_render:
+                print(f"\nRendering {len(to_render)} image-only pages...")
+                uncached += render_missing(executor, to_render, cache_dir, lang)
+
+            if uncached:
+                print(f"\nRunning OCR on {len(uncached)} pages...")
+                recognize(executor, uncached, cache_dir, lang)
+
+    for folder, pages in plans.items():
+        transcript_file = os.path.join(base_dir, folder, "FULL_TRANSCRIPT.md")
+        write_transcript(
+            folder, transcript_file, [(png_file, text) for png_file, _, text in pages], note=notes[folder]
+        )
+        print(f"✓ Wrote {folder} transcript: {transcript_file}")
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if arg != "--ocr-only"]
+    ocr_only = "--ocr-only" in sys.argv[1:]
+
+    # Base directory containing the level folders
+    base_dir = args[0] if args else BASE_DIR
+
+    if not os.path.exists(base_dir):
+        print(f"Error: Base directory {base_dir} does not exist")
+        sys.exit(1)
+
+    transcribe_folders(base_dir, text_layer=not ocr_only)
+
+    print("\nAll transcripts written!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Dedup Index Scaling Benchmark
+=============================
+
+DedupIndex lookups must not slow down as the index grows: feed pollers keep
+one index for the life of the process, which can reach millions of stories.
+The index is filled with synthetic articles in steps up to --size, and after
+each step fresh articles are looked up and measured for:
+
+- candidates: fingerprints compared per lookup, which must stay below
+  --max-candidates at every size (a linear scan, or too few / too narrow
+  lookup tables, makes this grow with the index)
+- lookup time per article (SimHash included), for information
+- recall: near-duplicates (up to max_distance flipped fingerprint bits) of
+  indexed articles must all be found
+
+Usage:
+    python benchmarks/bench_dedup.py
+    python benchmarks/bench_dedup.py --size 1000000 --lookups 5000
+
+Exits with status 1 if a check fails, so it can guard CI.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dedup_index import DedupIndex, article_text, simhash  # noqa: E402
+
+DEFAULT_SIZE = 100_000
+DEFAULT_STEPS = 3            # Sizes measured: size / 10^(steps-1), ..., size
+DEFAULT_LOOKUPS = 2000
+DEFAULT_MAX_CANDIDATES = 1.0
+
+VOCABULARY = 20_000  # Distinct synthetic words, roughly a news corpus' working vocabulary
+
+
+def make_words(rnd: random.Random) -> list:
+    """Pronounceable pseudo-words, so texts share words about as often as real news"""
+    syllables = [c + v for c in "bcdfghklmnprstvz" for v in "aeiou"]
+    words = set()
+    while len(words) < VOCABULARY:
+        words.add("".join(rnd.choice(syllables) for _ in range(rnd.randint(2, 4))))
+    return sorted(words)
+
+
+def synthetic_article(rnd: random.Random, words: list, number: int) -> dict:
+    """An article with a random headline and summary (numbered so links differ)"""
+    title = " ".join(rnd.choice(words) for _ in range(8))
+    summary = " ".join(rnd.choice(words) for _ in range(30))
+    return {"title": title, "description": summary, "link": f"https://example.com/story/{number}"}
+
+
+def check_recall(index: DedupIndex, fingerprints: list, rnd: random.Random) -> int:
+    """Near-duplicates of indexed fingerprints that the index failed to find"""
+    missed = 0
+    for fingerprint in fingerprints:
+        flipped = fingerprint
+        for bit in rnd.sample(range(64), index.max_distance):
+            flipped ^= 1 << bit
+        missed += not index._near_duplicate(flipped)
+    return missed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scaling benchmark for DedupIndex lookups")
+    parser.add_argument("--size", type=int, default=DEFAULT_SIZE, help="Articles in the largest index")
+    parser.add_argument("--steps", type=int, default=DEFAULT_STEPS, help="Index sizes measured (x10 apart)")
+    parser.add_argument("--lookups", type=int, default=DEFAULT_LOOKUPS, help="Lookups per size")
+    parser.add_argument("--max-candidates", type=float, default=DEFAULT_MAX_CANDIDATES,
+                        help="Maximum mean fingerprints compared per lookup")
+    args = parser.parse_args()
+
+    sizes = [max(1, args.size // 10 ** step) for step in reversed(range(args.steps))]
+    rnd = random.Random(42)
+    words = make_words(rnd)
+    index = DedupIndex()
+    indexed = []
+    number = 0
+
+    print(f"🔎 Dedup index scaling ({args.lookups} lookups per size, "
+          f"budget {args.max_candidates:g} candidates per lookup)\n")
+    print(f"{'articles':>10} {'candidates':>11} {'lookup':>10} {'recall':>8}  checks")
+    print("-" * 60)
+
+    failures = 0
+
+    for size in sizes:
+        while len(indexed) < size:
+            article = synthetic_article(rnd, words, number)
+            number += 1
+            if index.add(article):
+                fingerprint = simhash(article_text(article))
+                if fingerprint is not None and len(indexed) < size:
+                    indexed.append(fingerprint)
+
+        lookups = [synthetic_article(rnd, words, number + i) for i in range(args.lookups)]
+        number += args.lookups
+
+        index.comparisons = 0
+        start = time.perf_counter()
+        for article in lookups:
+            index.check(article)
+        elapsed = time.perf_counter() - start
+        candidates = index.comparisons / len(lookups)
+
+        sample = rnd.sample(indexed, min(len(indexed), args.lookups))
+        missed = check_recall(index, sample, rnd)
+
+        problems = []
+        if candidates > args.max_candidates:
+            problems.append("too many candidates")
+        if missed:
+            problems.append(f"missed {missed} near-duplicates")
+
+        status = "✓" if not problems else "✗ " + "; ".join(problems)
+        print(f"{len(index):>10,} {candidates:>11.3f} {elapsed / len(lookups) * 1e6:>8.1f}µs "
+              f"{100 - 100 * missed / max(1, len(sample)):>7.1f}%  {status}")
+        failures += bool(problems)
+
+    print()
+    if failures:
+        print(f"✗ {failures} size(s) failed")
+        sys.exit(1)
+    print("✓ Lookups stay bounded as the index grows")
+
+
+if __name__ == "__main__":
+    main()
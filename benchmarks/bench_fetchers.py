@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Offline Fetcher Benchmark
+=========================
+
+Runs the main fetch and extract paths against the local fixture server
+(benchmarks/fixture_server.py) instead of BBC/Reuters/Google/NewsData, and
+reports for each scenario:
+
+- throughput (articles per second)
+- p50 / p99 latency of one full call
+- peak Python memory of one call (tracemalloc)
+- requests and bytes served
+
+Scenarios:
+- fetch_all_news                 diverse_news_fetcher, 16 feeds in parallel
+- fetch_news_paginated           NewsDataFetcher, cursor-chained API pages
+- repeated_latest_news           NewsDataFetcher, the same query repeated (response cache)
+- enrich_articles_with_content   NewsDataWithContent, streaming scrape + extract (cold cache)
+- fetch_and_extract              UnlimitedNewsFetcher, RSS + dedup + news-please
+                                 (RSS only if news-please is not installed)
+
+Feed and content caches and the credit ledger point at a temporary
+directory, so every run starts cold and nothing touches the real caches or
+today's NewsData quota.
+
+Usage:
+    python benchmarks/bench_fetchers.py
+    python benchmarks/bench_fetchers.py --latency 0.05 --jitter 0.05 --failure-rate 0.02
+    python benchmarks/bench_fetchers.py enrich_articles_with_content --workers 16 --json results.json
+    python benchmarks/bench_fetchers.py --metrics stages.prom   # per-stage timings (metrics.py)
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Must be set before the fetchers (and their caches) are imported
+_CACHE_DIR = tempfile.mkdtemp(prefix="news-bench-")
+os.environ["FEED_CACHE_DIR"] = os.path.join(_CACHE_DIR, "feeds")
+os.environ["CONTENT_CACHE_PATH"] = os.path.join(_CACHE_DIR, "content.sqlite3")
+os.environ["CREDIT_LEDGER_PATH"] = os.path.join(_CACHE_DIR, "credits.sqlite3")
+os.environ["NEWSDATA_DAILY_CREDITS"] = "1000000"  # The fixture API has no quota
+
+from fixture_server import FixtureServer  # noqa: E402
+
+import diverse_news_fetcher  # noqa: E402
+from content_cache import ContentCache  # noqa: E402
+from metrics import get_metrics  # noqa: E402
+from newsdata_fetcher import NewsDataFetcher  # noqa: E402
+from newsdata_with_scraping import NewsDataWithContent  # noqa: E402
+from rate_limiter import RateLimiter  # noqa: E402
+from response_cache import ResponseCache  # noqa: E402
+from unlimited_news_fetcher import UnlimitedNewsFetcher  # noqa: E402
+
+DEFAULT_ITERATIONS = 10
+NO_LIMIT = [(1_000_000, 1.0)]  # The fixture server has no rate limits to respect
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def fresh_content_cache() -> ContentCache:
+    """Empty content cache in the benchmark temp dir (cold-cache runs)"""
+    fd, path = tempfile.mkstemp(dir=_CACHE_DIR, suffix=".sqlite3")
+    os.close(fd)
+    return ContentCache(path=path)
+
+
+# ============================================================================
+# SCENARIOS - each returns (setup, run); run(state) returns the article count
+# ============================================================================
+
+def scenario_fetch_all_news(server: FixtureServer, args) -> tuple:
+    diverse_news_fetcher.NEWS_SOURCES = {
+        category: [(f"{category} {i}", server.feed_url(f"{category.lower()}-{i}")) for i in (1, 2)]
+        for category in ["World", "Business", "Technology", "Science",
+                         "Politics", "Sports", "Entertainment", "Health"]
+    }
+
+    def run(_):
+        news = diverse_news_fetcher.fetch_all_news(articles_per_source=5, max_workers=args.workers * 2)
+        return sum(len(articles) for articles in news.values())
+
+    return (lambda: None), run
+
+
+def scenario_fetch_news_paginated(server: FixtureServer, args) -> tuple:
+    def setup():
+        fetcher = NewsDataFetcher(api_key="benchmark")
+        fetcher.base_url = server.url("/api/1")
+        fetcher.rate_limiter = RateLimiter(NO_LIMIT)
+        fetcher.response_cache = ResponseCache()  # Cold: every page goes to the server
+        return fetcher
+
+    def run(fetcher):
+        return len(fetcher.fetch_news_paginated(query="benchmark", num_articles=100))
+
+    return setup, run
+
+
+def scenario_repeated_latest_news(server: FixtureServer, args) -> tuple:
+    shared_cache = ResponseCache()
+
+    def setup():
+        # A new fetcher per job, all sharing one response cache (as in one process)
+        fetcher = NewsDataFetcher(api_key="benchmark")
+        fetcher.base_url = server.url("/api/1")
+        fetcher.rate_limiter = RateLimiter(NO_LIMIT)
+        fetcher.response_cache = shared_cache
+        return fetcher
+
+    def run(fetcher):
+        return sum(
+            len(fetcher.fetch_latest_news(category="technology", country="us").get("results", []))
+            for _ in range(args.articles)
+        )
+
+    return setup, run
+
+
+def scenario_enrich_articles_with_content(server: FixtureServer, args) -> tuple:
+    lister = NewsDataFetcher(api_key="benchmark")
+    lister.base_url = server.url("/api/1")
+    lister.rate_limiter = RateLimiter(NO_LIMIT)
+    with contextlib.redirect_stdout(io.StringIO()):
+        articles = lister.fetch_news_paginated(query="enrich", num_articles=args.articles)
+
+    def setup():
+        fetcher = NewsDataWithContent(api_key="benchmark")
+        fetcher.content_cache = fresh_content_cache()
+        return fetcher
+
+    def run(fetcher):
+        enriched = fetcher.enrich_articles_with_content(
+            articles, scrape_delay=0, max_workers=args.workers
+        )
+        return sum(1 for article in enriched if article.get("content_available"))
+
+    return setup, run
+
+
+def scenario_fetch_and_extract(server: FixtureServer, args) -> tuple:
+    extract = importlib.util.find_spec("news_please") is not None
+
+    def setup():
+        fetcher = UnlimitedNewsFetcher()
+        fetcher.RSS_FEEDS = {"Fixture": server.feed_url("unlimited")}
+        fetcher.extract_limiter = RateLimiter(NO_LIMIT)
+        fetcher.content_cache = fresh_content_cache()
+        return fetcher
+
+    def run(fetcher):
+        articles = fetcher.fetch_and_extract(
+            "Fixture", num_articles=args.articles, scrape_content=extract, dedup=True
+        )
+        return len(articles)
+
+    return setup, run
+
+
+SCENARIOS: Dict[str, Callable] = {
+    "fetch_all_news": scenario_fetch_all_news,
+    "fetch_news_paginated": scenario_fetch_news_paginated,
+    "repeated_latest_news": scenario_repeated_latest_news,
+    "enrich_articles_with_content": scenario_enrich_articles_with_content,
+    "fetch_and_extract": scenario_fetch_and_extract,
+}
+
+
+# ============================================================================
+# HARNESS
+# ============================================================================
+
+def run_scenario(name: str, server: FixtureServer, args) -> Dict:
+    """Warm up once, time `iterations` calls, then measure peak memory of one more"""
+    setup, run = SCENARIOS[name](server, args)
+    with contextlib.redirect_stdout(io.StringIO()):
+        run(setup())  # Warm-up: pools, imports, lazy initialization
+
+    requests_before, bytes_before = server.requests, server.bytes_sent
+    latencies = []
+    articles = 0
+
+    for _ in range(args.iterations):
+        state = setup()
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            articles += run(state)
+            latencies.append(time.perf_counter() - start)
+
+    requests_made = server.requests - requests_before
+    bytes_served = server.bytes_sent - bytes_before
+
+    state = setup()
+    tracemalloc.start()
+    with contextlib.redirect_stdout(io.StringIO()):
+        run(state)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    total = sum(latencies)
+    return {
+        "scenario": name,
+        "iterations": args.iterations,
+        "articles": articles,
+        "articles_per_second": articles / total if total else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "mean_ms": statistics.mean(latencies) * 1000,
+        "peak_memory_kib": peak / 1024,
+        "requests": requests_made,
+        "bytes_served": bytes_served,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline benchmark of the news fetchers")
+    parser.add_argument("scenarios", nargs="*", help=f"Scenarios to run (default: all of {', '.join(SCENARIOS)})")
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS, help="Timed calls per scenario")
+    parser.add_argument("--articles", type=int, default=20, help="Articles per enrich/extract call")
+    parser.add_argument("--workers", type=int, default=8, help="Scraping workers (feeds use twice as many)")
+    parser.add_argument("--latency", type=float, default=0.02, help="Server latency per response (seconds)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency (seconds)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Share of HTTP 503 responses")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="Share of dropped connections")
+    parser.add_argument("--json", metavar="FILE", help="Also write the results as JSON")
+    parser.add_argument("--metrics", metavar="FILE",
+                        help="Write per-stage metrics of all runs (*.json snapshot, else Prometheus text)")
+    args = parser.parse_args()
+
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+    args.scenarios = args.scenarios or list(SCENARIOS)
+
+    server = FixtureServer(
+        latency=args.latency,
+        jitter=args.jitter,
+        failure_rate=args.failure_rate,
+        drop_rate=args.drop_rate,
+    )
+
+    print(f"🧪 Offline fetcher benchmark - {args.iterations} iterations, latency {args.latency * 1000:.0f}ms"
+          f" (+{args.jitter * 1000:.0f}ms jitter), {args.failure_rate:.0%} 503s, {args.drop_rate:.0%} drops")
+    if importlib.util.find_spec("news_please") is None:
+        print("   (news-please not installed: fetch_and_extract measures RSS + dedup only)")
+    print()
+    print(f"{'scenario':<30} {'art/s':>8} {'p50':>9} {'p99':>9} {'peak mem':>10} {'requests':>9} {'MB':>7}")
+    print("-" * 88)
+
+    results = []
+    get_metrics().reset()
+    with server:
+        for name in args.scenarios:
+            result = run_scenario(name, server, args)
+            results.append(result)
+            print(f"{name:<30} {result['articles_per_second']:>8.1f} {result['p50_ms']:>7.1f}ms "
+                  f"{result['p99_ms']:>7.1f}ms {result['peak_memory_kib']:>7.0f}KiB "
+                  f"{result['requests']:>9} {result['bytes_served'] / 1e6:>7.2f}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"settings": vars(args), "results": results}, f, indent=2)
+        print(f"\n✓ Saved results to {args.json}")
+
+    if args.metrics:
+        get_metrics().write(args.metrics)
+        print(f"✓ Saved stage metrics to {args.metrics}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Fetcher Import-Time Benchmark
+=============================
+
+Worker processes import the fetcher modules thousands of times a day, so
+importing them must stay cheap and side-effect free. Each module is imported
+in a fresh interpreter `--runs` times and checked for:
+
+- import time: median (and max) against --budget-ms
+- side effects: nothing may be printed at import
+- heavy dependencies: extractors such as news_please must not be loaded until
+  they are used
+
+Usage:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --runs 50 --budget-ms 150 unlimited_news_fetcher
+
+Exits with status 1 if any module fails a check, so it can guard CI.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = [
+    "http_session",
+    "newsdata_fetcher",
+    "newsdata_fetcher_full",
+    "newsdata_with_scraping",
+    "unlimited_news_fetcher",
+    "free_news_alternatives",
+    "diverse_news_fetcher",
+    "google_news_simple",
+    "simple_news_fetcher",
+    "fetch_news",
+    "feed_poller",
+]
+
+# Loaded on first use only - never by a plain import
+HEAVY_MODULES = ["news_please", "feedparser", "pdf2image", "pypdf", "pytesseract", "asyncio"]
+
+DEFAULT_RUNS = 20
+DEFAULT_BUDGET_MS = 300.0
+
+# Runs in the child interpreter: import one module with stdout captured
+PROBE = """
+import importlib, io, json, sys, time
+sys.path.insert(0, {root!r})
+captured = io.StringIO()
+real_stdout, sys.stdout = sys.stdout, captured
+start = time.perf_counter()
+importlib.import_module({module!r})
+elapsed = time.perf_counter() - start
+sys.stdout = real_stdout
+heavy = sorted(name for name in {heavy!r} if name in sys.modules)
+print(json.dumps({{"seconds": elapsed, "output": captured.getvalue(), "heavy": heavy}}))
+"""
+
+
+def measure_import(module: str) -> Dict:
+    """Import a module in a fresh interpreter and return its probe result"""
+    code = PROBE.format(root=ROOT, module=module, heavy=HEAVY_MODULES)
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        error = result.stderr.strip().splitlines()
+        raise RuntimeError(error[-1] if error else f"exit status {result.returncode}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def bench_module(module: str, runs: int) -> Dict:
+    """Import a module `runs` times and summarize"""
+    timings: List[float] = []
+    output = ""
+    heavy: List[str] = []
+
+    for _ in range(runs):
+        probe = measure_import(module)
+        timings.append(probe["seconds"] * 1000)
+        output = output or probe["output"]
+        heavy = heavy or probe["heavy"]
+
+    return {
+        "module": module,
+        "median_ms": statistics.median(timings),
+        "max_ms": max(timings),
+        "printed_lines": len(output.splitlines()),
+        "heavy": heavy,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time benchmark for the fetcher modules")
+    parser.add_argument("modules", nargs="*", default=MODULES, help="Modules to check (default: all fetchers)")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="Fresh imports per module")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help="Maximum median import time per module")
+    args = parser.parse_args()
+
+    print(f"⏱️  Import-time benchmark ({args.runs} fresh imports per module, "
+          f"budget {args.budget_ms:.0f} ms)\n")
+    print(f"{'module':<26} {'median':>9} {'max':>9}  checks")
+    print("-" * 80)
+
+    failures = 0
+
+    for module in args.modules:
+        try:
+            stats = bench_module(module, args.runs)
+        except RuntimeError as e:
+            print(f"{module:<26} {'-':>9} {'-':>9}  ✗ import failed: {e}")
+            failures += 1
+            continue
+
+        problems = []
+        if stats["median_ms"] > args.budget_ms:
+            problems.append("over budget")
+        if stats["printed_lines"]:
+            problems.append(f"prints {stats['printed_lines']} lines at import")
+        if stats["heavy"]:
+            problems.append(f"loads {', '.join(stats['heavy'])}")
+
+        status = "✓" if not problems else "✗ " + "; ".join(problems)
+        print(f"{module:<26} {stats['median_ms']:>7.1f}ms {stats['max_ms']:>7.1f}ms  {status}")
+        failures += bool(problems)
+
+    print()
+    if failures:
+        print(f"✗ {failures} module(s) failed")
+        sys.exit(1)
+    print("✓ All modules within budget")
+
+
+if __name__ == "__main__":
+    main()
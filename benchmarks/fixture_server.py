@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Local Fixture News Server
+=========================
+
+Stand-in for the RSS feeds, the NewsData API and publisher article pages, so
+the fetchers can be benchmarked offline and reproducibly.
+
+Endpoints:
+- /rss/<feed>.xml         RSS 2.0 feed with `items_per_feed` items
+- /api/1/latest           NewsData-style JSON pages, 10 results each, chained
+                          through the 'nextPage' cursor (built from the
+                          recorded fetched_articles.json)
+- /article/<id>.html      Article page (~`article_bytes` of HTML with nav,
+                          scripts and an <article> body)
+
+Every response can be delayed (latency + random jitter) and a share of them
+fail (HTTP 503 or a dropped connection), to see how the fetchers behave on a
+slow or flaky network.
+
+Usage:
+    with FixtureServer(latency=0.05, failure_rate=0.02) as server:
+        url = server.url("/rss/world-1.xml")
+
+    python benchmarks/fixture_server.py --port 8765 --latency 0.1
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from email.utils import formatdate
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Recorded NewsData response used as the template for API pages
+NEWSDATA_FIXTURE = os.path.join(ROOT, "fetched_articles.json")
+
+PAGE_SIZE = 10
+DEFAULT_ITEMS_PER_FEED = 20
+DEFAULT_ARTICLE_BYTES = 60 * 1024
+DEFAULT_API_PAGES = 20
+
+_WORD = re.compile(r"[A-Za-zÄÖÜäöüß]{3,}")
+
+
+def _vocabulary() -> List[str]:
+    """Words from the recorded articles, for realistic-looking generated text"""
+    words = set()
+    for filename in ("fetched_articles.json", "news.json", "articles_with_content.json"):
+        path = os.path.join(ROOT, filename)
+        if not os.path.exists(path):
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            for article in json.load(f):
+                words.update(_WORD.findall(f"{article.get('title', '')} {article.get('description', '')}"))
+    return sorted(words) or ["news", "report", "market", "science", "policy", "update", "world"]
+
+
+class FixtureData:
+    """
+    Deterministic generated fixtures (same seed -> same feeds, pages and articles)
+    """
+
+    def __init__(
+        self,
+        items_per_feed: int = DEFAULT_ITEMS_PER_FEED,
+        article_bytes: int = DEFAULT_ARTICLE_BYTES,
+        api_pages: int = DEFAULT_API_PAGES,
+        seed: int = 42
+    ):
+        """
+        Args:
+            items_per_feed: Items in every RSS feed
+            article_bytes: Approximate size of each article page
+            api_pages: Pages the NewsData endpoint serves before the cursor ends
+            seed: Random seed for the generated text
+        """
+        self.items_per_feed = items_per_feed
+        self.article_bytes = article_bytes
+        self.api_pages = api_pages
+        self.seed = seed
+        self.vocabulary = _vocabulary()
+
+        with open(NEWSDATA_FIXTURE, "r", encoding="utf-8") as f:
+            self.newsdata_template = json.load(f)
+
+        self._feeds: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def sentence(self, key: str, words: int) -> str:
+        """Reproducible pseudo-text for a key"""
+        rng = random.Random(f"{self.seed}:{key}")
+        text = " ".join(rng.choice(self.vocabulary) for _ in range(words))
+        return text[:1].upper() + text[1:]
+
+    def feed(self, name: str, base_url: str) -> bytes:
+        """RSS document for a feed (cached per feed name)"""
+        with self._lock:
+            if name in self._feeds:
+                return self._feeds[name]
+
+        items = []
+        for i in range(self.items_per_feed):
+            key = f"{name}-{i}"
+            items.append(
+                "<item>"
+                f"<title>{escape(self.sentence(key + ':title', 10))}</title>"
+                f"<link>{base_url}/article/{key}.html</link>"
+                f"<guid>{base_url}/article/{key}.html</guid>"
+                f"<pubDate>{formatdate(1762600000 - i * 600, usegmt=True)}</pubDate>"
+                f"<description>{escape(self.sentence(key + ':summary', 40))}</description>"
+                "</item>"
+            )
+
+        document = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<rss version="2.0"><channel>'
+            f"<title>{escape(name)}</title><link>{base_url}/</link>"
+            f"<description>Fixture feed {escape(name)}</description>"
+            + "".join(items)
+            + "</channel></rss>"
+        ).encode("utf-8")
+
+        with self._lock:
+            self._feeds[name] = document
+        return document
+
+    def newsdata_page(self, query: Dict[str, str], base_url: str) -> bytes:
+        """One NewsData /latest response; the cursor is the next page number"""
+        page = int(query.get("page") or 0)
+        size = min(int(query.get("size") or PAGE_SIZE), PAGE_SIZE)
+
+        results = []
+        for i in range(size):
+            number = page * PAGE_SIZE + i
+            article = dict(self.newsdata_template[number % len(self.newsdata_template)])
+            key = f"newsdata-{query.get('q', '')}-{number}"
+            article.update(
+                article_id=f"fixture{number:08d}",
+                title=self.sentence(key + ":title", 10),
+                description=self.sentence(key + ":summary", 40),
+                link=f"{base_url}/article/{key}.html",
+            )
+            results.append(article)
+
+        response = {"status": "success", "totalResults": self.api_pages * PAGE_SIZE, "results": results}
+        if page + 1 < self.api_pages:
+            response["nextPage"] = str(page + 1)
+        return json.dumps(response).encode("utf-8")
+
+    def article(self, key: str) -> bytes:
+        """Article page: boilerplate head and nav, scripts, then the <article> body"""
+        head = (
+            "<!DOCTYPE html><html><head><meta charset='utf-8'>"
+            f"<title>{escape(self.sentence(key + ':title', 10))}</title>"
+            "<style>body{font-family:sans-serif}.nav{display:flex}</style>"
+            "<script>window.dataLayer=window.dataLayer||[];function track(){}</script>"
+            "</head><body><nav class='nav'>"
+            + "".join(f"<a href='/section/{i}'>Section {i}</a>" for i in range(30))
+            + "</nav><main><article>"
+            f"<h1>{escape(self.sentence(key + ':title', 10))}</h1>"
+        )
+
+        paragraphs = []
+        size = len(head)
+        number = 0
+        while size < self.article_bytes * 0.8:
+            paragraph = f"<p>{escape(self.sentence(f'{key}:p{number}', 60))}</p>\n"
+            paragraphs.append(paragraph)
+            size += len(paragraph)
+            number += 1
+
+        tail = (
+            "</article><aside>"
+            + "".join(f"<div class='related'>{escape(self.sentence(f'{key}:r{i}', 8))}</div>" for i in range(40))
+            + "</aside></main><footer>Fixture footer</footer></body></html>"
+        )
+        return (head + "".join(paragraphs) + tail).encode("utf-8")
+
+
+class _QuietHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Clients that stop reading early (streamed extraction) reset the connection
+        if not isinstance(sys.exc_info()[1], (ConnectionResetError, BrokenPipeError)):
+            super().handle_error(request, client_address)
+
+
+class FixtureServer:
+    """
+    Threaded HTTP server serving FixtureData, with latency and failure injection
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        failure_rate: float = 0.0,
+        drop_rate: float = 0.0,
+        data: Optional[FixtureData] = None
+    ):
+        """
+        Args:
+            host: Interface to bind
+            port: Port (0 picks a free one)
+            latency: Seconds added before every response
+            jitter: Extra random delay, uniform in [0, jitter] seconds
+            failure_rate: Share of requests answered with HTTP 503
+            drop_rate: Share of requests whose connection is closed without a reply
+            data: Fixtures to serve (default: FixtureData())
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.drop_rate = drop_rate
+        self.data = data or FixtureData()
+
+        self.requests = 0
+        self.bytes_sent = 0
+        self._stats_lock = threading.Lock()
+        self._random = random.Random(7)
+
+        self._httpd = _QuietHTTPServer((host, port), self._handler_class())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, path: str) -> str:
+        """Absolute URL for a server path"""
+        return self.base_url + path
+
+    def feed_url(self, name: str) -> str:
+        return self.url(f"/rss/{name}.xml")
+
+    def start(self) -> "FixtureServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """Serve in the calling thread until interrupted"""
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FixtureServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def _roll(self) -> str:
+        """Decide this request's fate: "ok", "fail" or "drop" """
+        with self._stats_lock:
+            self.requests += 1
+            value = self._random.random()
+        if value < self.drop_rate:
+            return "drop"
+        if value < self.drop_rate + self.failure_rate:
+            return "fail"
+        return "ok"
+
+    def _delay(self):
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True  # Otherwise delayed ACKs add ~40ms per response
+
+            def log_message(self, format, *args):
+                pass  # Keep benchmark output clean
+
+            def do_GET(self):
+                fate = server._roll()
+                server._delay()
+
+                if fate == "drop":
+                    self.close_connection = True
+                    self.connection.close()
+                    return
+                if fate == "fail":
+                    self._send(503, b"Service Unavailable", "text/plain")
+                    return
+
+                parts = urlsplit(self.path)
+                query = {key: values[0] for key, values in parse_qs(parts.query).items()}
+
+                if parts.path.startswith("/rss/") and parts.path.endswith(".xml"):
+                    name = parts.path[len("/rss/"):-len(".xml")]
+                    self._send(200, server.data.feed(name, server.base_url), "application/rss+xml")
+                elif parts.path == "/api/1/latest":
+                    self._send(200, server.data.newsdata_page(query, server.base_url), "application/json")
+                elif parts.path.startswith("/article/") and parts.path.endswith(".html"):
+                    key = parts.path[len("/article/"):-len(".html")]
+                    self._send(200, server.data.article(key), "text/html; charset=utf-8")
+                else:
+                    self._send(404, b"Not Found", "text/plain")
+
+            def _send(self, status: int, body: bytes, content_type: str):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                with server._stats_lock:
+                    server.bytes_sent += len(body)
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve news fixtures locally")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random delay (seconds)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Share of HTTP 503 replies")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="Share of dropped connections")
+    args = parser.parse_args()
+
+    server = FixtureServer(
+        port=args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        failure_rate=args.failure_rate,
+        drop_rate=args.drop_rate,
+    )
+
+    print(f"🧪 Fixture server on {server.base_url}")
+    print(f"   RSS:      {server.feed_url('world-1')}")
+    print(f"   NewsData: {server.url('/api/1/latest?q=ai')}")
+    print(f"   Article:  {server.url('/article/example.html')}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
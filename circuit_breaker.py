@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Per-Host Circuit Breakers
+=========================
+
+Dead hosts (e.g. the retired feeds.reuters.com feeds) used to cost a full
+connect timeout, plus retries, on every request in every batch. A circuit
+breaker per host remembers that a host is down and fails fast instead:
+
+- closed     requests pass; `threshold` consecutive failures open the circuit
+- open       requests fail immediately with CircuitOpenError for `reset_timeout`
+- half-open  after the cool-down one probe request is let through; success
+             closes the circuit, failure re-opens it with a doubled cool-down
+             (up to `max_reset_timeout`)
+
+Failures are network errors, timeouts and 5xx responses - not 4xx or 429,
+which mean the host is up.
+
+http_session.http_get checks and updates the breakers on every request, so
+all fetchers get this without extra code.
+
+Breaker state is kept across runs in a small JSON file (next to the feed
+cache; CIRCUIT_BREAKER_PATH overrides it, "" disables it). One-shot fetchers
+only talk to each host once or twice per run, so without it a dead host would
+never reach the threshold and would cost its timeouts again on every run.
+With it, failures add up across runs, an open circuit stays open in the next
+run until its cool-down ends, and from then on a dead host costs one probe
+per cool-down. Only changes are written (a failure, or the first success
+after failures), so healthy hosts cost no file I/O. Failures older than
+FAILURE_MEMORY are forgotten.
+
+Usage:
+    from circuit_breaker import get_breaker
+
+    breaker = get_breaker("feeds.reuters.com")
+    if breaker.allow():
+        ...  # make the request, then breaker.record_success() / record_failure()
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+import requests
+
+DEFAULT_THRESHOLD = 5            # Consecutive failures that open a circuit
+DEFAULT_RESET_TIMEOUT = 30.0     # Seconds before the first probe
+DEFAULT_MAX_RESET_TIMEOUT = 600.0
+FAILURE_MEMORY = 24 * 3600       # Seconds a stored failure still counts in a later run
+DEFAULT_STATE_PATH = os.getenv(
+    "CIRCUIT_BREAKER_PATH",
+    os.path.join(os.getenv("FEED_CACHE_DIR", ".feed_cache"), "circuit_breakers.json")
+)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Host failed repeatedly; requests to it fail fast until its cool-down ends"""
+
+
+class CircuitBreaker:
+    """
+    Thread-safe breaker for one host
+    """
+
+    def __init__(
+        self,
+        threshold: int = DEFAULT_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        max_reset_timeout: float = DEFAULT_MAX_RESET_TIMEOUT,
+        on_change: Optional[Callable[["CircuitBreaker"], None]] = None
+    ):
+        """
+        Args:
+            threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a probe
+            max_reset_timeout: Upper bound for the doubled cool-down
+            on_change: Called after a failure, or a success that clears failures
+        """
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.on_change = on_change
+
+        self.state = CLOSED
+        self.failures = 0
+        self.trips = 0
+        self._cooldown = reset_timeout
+        self._opened_at = 0.0
+        self._probe_started: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """True if a request may be made now"""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+
+            now = time.monotonic()
+            if self.state == OPEN:
+                if now - self._opened_at < self._cooldown:
+                    return False
+                self.state = HALF_OPEN
+
+            # Half-open: one probe at a time (a probe that never reported back
+            # is replaced after another cool-down)
+            if self._probe_started is not None and now - self._probe_started < self._cooldown:
+                return False
+            self._probe_started = now
+            return True
+
+    def record_success(self):
+        with self._lock:
+            changed = self.failures > 0 or self.state != CLOSED
+            self.state = CLOSED
+            self.failures = 0
+            self._cooldown = self.reset_timeout
+            self._probe_started = None
+
+        if changed and self.on_change:
+            self.on_change(self)
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+
+            if self.state == HALF_OPEN:
+                # The probe failed - stay away twice as long
+                self._cooldown = min(self._cooldown * 2, self.max_reset_timeout)
+                self._open()
+            elif self.state == CLOSED and self.failures >= self.threshold:
+                self._open()
+
+        if self.on_change:
+            self.on_change(self)
+
+    def _open(self):
+        self.state = OPEN
+        self.trips += 1
+        self._opened_at = time.monotonic()
+        self._probe_started = None
+
+    def retry_in(self) -> float:
+        """Seconds until an open circuit lets a probe through (0 if not open)"""
+        with self._lock:
+            if self.state != OPEN:
+                return 0.0
+            return max(0.0, self._cooldown - (time.monotonic() - self._opened_at))
+
+    def to_state(self) -> Dict:
+        """JSON-serializable state, with wall-clock times so it survives a restart"""
+        with self._lock:
+            open_for = 0.0
+            if self.state != CLOSED:
+                open_for = max(0.0, self._cooldown - (time.monotonic() - self._opened_at))
+            return {
+                "failures": self.failures,
+                "open": self.state != CLOSED,
+                "open_until": time.time() + open_for,
+                "cooldown": self._cooldown,
+                "updated": time.time(),
+            }
+
+    def restore(self, state: Dict):
+        """Pick up a state saved by to_state() (in this or an earlier process)"""
+        with self._lock:
+            self.failures = int(state.get("failures", 0))
+            self._cooldown = min(float(state.get("cooldown", self.reset_timeout)), self.max_reset_timeout)
+            if state.get("open"):
+                # Still open for whatever is left of its cool-down (a probe is due if nothing is)
+                remaining = max(0.0, float(state.get("open_until", 0.0)) - time.time())
+                self.state = OPEN
+                self._opened_at = time.monotonic() - (self._cooldown - min(remaining, self._cooldown))
+            elif self.failures >= self.threshold:
+                self._open()
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+_settings = {
+    "threshold": DEFAULT_THRESHOLD,
+    "reset_timeout": DEFAULT_RESET_TIMEOUT,
+    "max_reset_timeout": DEFAULT_MAX_RESET_TIMEOUT,
+}
+_state = {"path": DEFAULT_STATE_PATH}
+_saved: Optional[Dict[str, Dict]] = None  # Stored states, read on first use
+_state_lock = threading.Lock()
+
+
+def configure_breakers(
+    threshold: Optional[int] = None,
+    reset_timeout: Optional[float] = None,
+    max_reset_timeout: Optional[float] = None,
+    state_path: Optional[str] = None
+):
+    """
+    Change breaker settings; existing breakers are dropped (all circuits close)
+
+    Args:
+        threshold: Consecutive failures that open a circuit
+        reset_timeout: Seconds a circuit stays open before a probe
+        max_reset_timeout: Upper bound for the doubled cool-down
+        state_path: JSON file the state is kept in across runs ("" disables it)
+    """
+    global _saved
+
+    with _breakers_lock:
+        for key, value in (
+            ("threshold", threshold),
+            ("reset_timeout", reset_timeout),
+            ("max_reset_timeout", max_reset_timeout),
+        ):
+            if value is not None:
+                _settings[key] = value
+        if state_path is not None:
+            _state["path"] = state_path
+            _saved = None
+        _breakers.clear()
+
+
+def _read_states(path: str) -> Dict[str, Dict]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            states = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(states, dict):
+        return {}
+
+    # Forget hosts that are closed and haven't failed in a long time
+    cutoff = time.time() - FAILURE_MEMORY
+    return {
+        host: state for host, state in states.items()
+        if isinstance(state, dict) and (
+            state.get("updated", 0) >= cutoff or state.get("open_until", 0) > time.time()
+        )
+    }
+
+
+def _save_state(host: str, breaker: CircuitBreaker):
+    """Write one host's state, merged with what other processes stored meanwhile"""
+    path = _state["path"]
+    if not path:
+        return
+
+    state = breaker.to_state()
+    with _state_lock:
+        states = _read_states(path)
+        if state["failures"] or state["open"]:
+            states[host] = state
+        else:
+            states.pop(host, None)
+
+        try:
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(states, f, indent=1, sort_keys=True)
+                os.replace(tmp_path, path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        except OSError as e:
+            print(f"⚠️  Could not save circuit breaker state to {path}: {e}")
+
+
+def get_breaker(host: str) -> CircuitBreaker:
+    """Return the breaker for a host, creating it on first use (with its stored state)"""
+    global _saved
+
+    breaker = _breakers.get(host)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.get(host)
+            if breaker is None:
+                if _saved is None:
+                    _saved = _read_states(_state["path"]) if _state["path"] else {}
+
+                breaker = CircuitBreaker(**_settings, on_change=lambda b: _save_state(host, b))
+                if host in _saved:
+                    breaker.restore(_saved[host])
+                _breakers[host] = breaker
+    return breaker
+
+
+def open_circuits() -> Dict[str, float]:
+    """Hosts whose circuit is open, with seconds until their next probe"""
+    with _breakers_lock:
+        breakers = dict(_breakers)
+    return {
+        host: breaker.retry_in()
+        for host, breaker in breakers.items()
+        if breaker.state == OPEN
+    }
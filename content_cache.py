@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Article Content Cache
+=====================
+
+Disk-backed cache of extracted article bodies, keyed by normalized URL.
+
+The same story stays in the top of a feed for hours, so successive runs keep
+re-downloading and re-extracting the same links. Every extractor checks this
+cache first and only goes to the network for links it has not seen (or whose
+entry has expired).
+
+- Storage: a single SQLite file (default .content_cache.sqlite3, override
+  with CONTENT_CACHE_PATH)
+- Expiry: entries older than `ttl` seconds are treated as missing
+- Size bound: when the stored bodies exceed `max_bytes`, expired and then
+  least recently used entries are evicted. The total size is kept as a running
+  count (read once at open), so a put costs an index lookup rather than a scan
+  of the table; it is recounted exactly only when it crosses `max_bytes`,
+  which also picks up entries other processes added meanwhile
+
+Usage:
+    from content_cache import get_content_cache
+
+    cache = get_content_cache()
+    content = cache.get(url, namespace="gdelt")
+    if content is None:
+        content = scrape(url)
+        cache.put(url, content, namespace="gdelt")
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+
+from metrics import get_metrics
+from url_utils import normalize_url
+
+DEFAULT_CACHE_PATH = os.getenv("CONTENT_CACHE_PATH", ".content_cache.sqlite3")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 256 MB of stored content
+DEFAULT_TTL = 24 * 60 * 60             # 1 day
+
+
+class ContentCache:
+    """
+    SQLite-backed URL -> extracted content cache with TTL and LRU eviction
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl: float = DEFAULT_TTL
+    ):
+        """
+        Args:
+            path: SQLite database file
+            max_bytes: Upper bound on the total size of cached values
+            ttl: Seconds an entry stays valid
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS content (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created REAL NOT NULL,
+                accessed REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS content_accessed ON content (accessed)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS content_created ON content (created)")
+        self._conn.commit()
+        self._total = self._stored_bytes()  # Running size of all values
+
+    def _stored_bytes(self) -> int:
+        return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM content").fetchone()[0]
+
+    @staticmethod
+    def _key(url: str, namespace: str) -> str:
+        return f"{namespace}:{normalize_url(url)}"
+
+    def get(self, url: str, namespace: str = "default") -> Optional[Any]:
+        """
+        Return the cached value for a URL, or None if missing or expired
+
+        Args:
+            url: Article URL (normalized before lookup)
+            namespace: Separates extractors that store different values
+        """
+        key = self._key(url, namespace)
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created, size FROM content WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None or now - row[1] > self.ttl:
+                if row is not None:
+                    self._conn.execute("DELETE FROM content WHERE key = ?", (key,))
+                    self._conn.commit()
+                    self._total -= row[2]
+                self.misses += 1
+                get_metrics().record_cache(f"content:{namespace}", hit=False)
+                return None
+
+            self._conn.execute("UPDATE content SET accessed = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+
+        get_metrics().record_cache(f"content:{namespace}", hit=True)
+        return json.loads(row[0])
+
+    def contains(self, url: str, namespace: str = "default") -> bool:
+        """True if a fresh entry exists (does not count as a hit or refresh LRU order)"""
+        key = self._key(url, namespace)
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT created FROM content WHERE key = ?", (key,)
+            ).fetchone()
+
+        return row is not None and time.time() - row[0] <= self.ttl
+
+    def put(self, url: str, value: Any, namespace: str = "default"):
+        """Store a JSON-serializable value for a URL, evicting LRU entries if needed"""
+        key = self._key(url, namespace)
+        payload = json.dumps(value, ensure_ascii=False, default=str)
+        size = len(payload.encode("utf-8"))
+        now = time.time()
+
+        with self._lock:
+            replaced = self._conn.execute("SELECT size FROM content WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO content (key, value, size, created, accessed) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, payload, size, now, now),
+            )
+            self._total += size - (replaced[0] if replaced else 0)
+            if self._total > self.max_bytes:
+                self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """Drop expired entries, then least recently used ones until under max_bytes"""
+        self._conn.execute("DELETE FROM content WHERE created < ?", (time.time() - self.ttl,))
+
+        # Exact recount: the running total misses other processes' writes
+        total = self._stored_bytes()
+        self._total = total
+        if total <= self.max_bytes:
+            return
+
+        while total > self.max_bytes:
+            oldest = self._conn.execute(
+                "SELECT key, size FROM content ORDER BY accessed ASC LIMIT 100"
+            ).fetchall()
+            if not oldest:
+                break
+
+            for key, size in oldest:
+                self._conn.execute("DELETE FROM content WHERE key = ?", (key,))
+                total -= size
+                if total <= self.max_bytes:
+                    break
+
+        self._total = total
+
+    def clear(self):
+        """Remove every entry"""
+        with self._lock:
+            self._conn.execute("DELETE FROM content")
+            self._conn.commit()
+            self._total = 0
+
+
+_content_cache: Optional[ContentCache] = None
+_content_cache_lock = threading.Lock()
+
+
+def get_content_cache() -> ContentCache:
+    """Return the process-wide content cache"""
+    global _content_cache
+
+    if _content_cache is None:
+        with _content_cache_lock:
+            if _content_cache is None:
+                _content_cache = ContentCache()
+    return _content_cache
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+NewsData Credit Ledger
+======================
+
+Durable record of the NewsData.io daily credit quota, shared by every
+fetcher instance, thread and process on this machine.
+
+An in-memory `credits_used` counter starts at 0 in every process, so four
+workers each believe they have 200 credits, and a restart forgets what was
+already spent. The ledger keeps the day's usage in SQLite instead:
+
+- Before a request, a credit is reserved atomically (BEGIN IMMEDIATE), so
+  parallel workers can use the whole quota but never overrun it
+- A successful response commits the reservation as a spent credit; a failed
+  request releases it
+- Reservations of a process that died mid-request expire after
+  `reservation_ttl` seconds
+- Usage is counted per quota day, which starts at `reset_hour` UTC (the
+  provider's reset boundary), so the quota refills by itself
+
+Settings (environment):
+    CREDIT_LEDGER_PATH       SQLite file (default .newsdata_credits.sqlite3)
+    NEWSDATA_DAILY_CREDITS   Daily quota (default 200, free tier)
+    NEWSDATA_RESET_HOUR_UTC  Hour (UTC) at which the quota resets (default 0)
+
+Usage:
+    from credit_ledger import get_credit_ledger
+
+    ledger = get_credit_ledger()
+    reservation = ledger.reserve()
+    if reservation is None:
+        ...  # Quota exhausted for today
+    try:
+        data = call_api()
+        if data.get("status") == "success":
+            ledger.commit(reservation)
+    finally:
+        ledger.release(reservation)  # No-op once committed
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterator, Optional, Tuple
+
+DEFAULT_LEDGER_PATH = os.getenv("CREDIT_LEDGER_PATH", ".newsdata_credits.sqlite3")
+DEFAULT_DAILY_CREDITS = int(os.getenv("NEWSDATA_DAILY_CREDITS", "200"))
+DEFAULT_RESET_HOUR = int(os.getenv("NEWSDATA_RESET_HOUR_UTC", "0"))
+RESERVATION_TTL = 20 * 60  # Covers a full wait on the 30-per-15-minutes rate window
+
+
+class CreditLedger:
+    """
+    SQLite-backed daily credit counter with atomic reservations
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_LEDGER_PATH,
+        limit: int = DEFAULT_DAILY_CREDITS,
+        reset_hour: int = DEFAULT_RESET_HOUR,
+        reservation_ttl: float = RESERVATION_TTL
+    ):
+        """
+        Args:
+            path: SQLite database file (shared by all processes using the quota)
+            limit: Credits per quota day
+            reset_hour: Hour (UTC, 0-23) at which a new quota day starts
+            reservation_ttl: Seconds after which an unfinished reservation is dropped
+        """
+        self.path = path
+        self.limit = limit
+        self.reset_hour = reset_hour
+        self.reservation_ttl = reservation_ttl
+
+        self._lock = threading.Lock()
+        # Reservations made by this instance -> (quota day, credits), so commit()
+        # charges the right amount even if the row expired while in flight
+        self._reserved: Dict[int, Tuple[str, int]] = {}
+        # Autocommit mode: transactions are opened explicitly with BEGIN IMMEDIATE
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS usage (
+                day TEXT PRIMARY KEY,
+                used INTEGER NOT NULL
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS reservations (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                day TEXT NOT NULL,
+                credits INTEGER NOT NULL,
+                created REAL NOT NULL
+            )
+        """)
+
+    def current_day(self, now: Optional[float] = None) -> str:
+        """Quota day (YYYY-MM-DD) a timestamp falls into"""
+        moment = datetime.fromtimestamp(time.time() if now is None else now, timezone.utc)
+        return (moment - timedelta(hours=self.reset_hour)).date().isoformat()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Write transaction that locks out other processes until it ends"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _spent_and_held(self, conn: sqlite3.Connection, day: str):
+        used = conn.execute("SELECT used FROM usage WHERE day = ?", (day,)).fetchone()
+        held = conn.execute(
+            "SELECT COALESCE(SUM(credits), 0) FROM reservations WHERE day = ?", (day,)
+        ).fetchone()
+        return (used[0] if used else 0), held[0]
+
+    def reserve(self, credits: int = 1) -> Optional[int]:
+        """
+        Hold credits for a request that is about to be made
+
+        Returns:
+            Reservation id, or None if today's quota can't cover it
+        """
+        now = time.time()
+        day = self.current_day(now)
+
+        with self._transaction() as conn:
+            # Drop reservations of crashed processes and of previous days
+            conn.execute(
+                "DELETE FROM reservations WHERE created < ? OR day != ?",
+                (now - self.reservation_ttl, day),
+            )
+            used, held = self._spent_and_held(conn, day)
+            if used + held + credits > self.limit:
+                return None
+
+            cursor = conn.execute(
+                "INSERT INTO reservations (day, credits, created) VALUES (?, ?, ?)",
+                (day, credits, now),
+            )
+            self._reserved[cursor.lastrowid] = (day, credits)
+            return cursor.lastrowid
+
+    def commit(self, reservation: int):
+        """Count a reservation as spent (the API charged for the request)"""
+        with self._transaction() as conn:
+            # Taken from memory rather than the row: a reservation that expired
+            # while in flight was still spent, with its own credits on its own day
+            charge = self._reserved.pop(reservation, None)
+            conn.execute("DELETE FROM reservations WHERE id = ?", (reservation,))
+            if charge is None:
+                return  # Already committed or released
+
+            conn.execute(
+                "INSERT INTO usage (day, used) VALUES (?, ?) "
+                "ON CONFLICT(day) DO UPDATE SET used = used + excluded.used",
+                charge,
+            )
+
+    def release(self, reservation: Optional[int]):
+        """Return reserved credits that were not spent (no-op if already committed)"""
+        if reservation is None:
+            return
+        with self._transaction() as conn:
+            self._reserved.pop(reservation, None)
+            conn.execute("DELETE FROM reservations WHERE id = ?", (reservation,))
+
+    def used(self) -> int:
+        """Credits spent in the current quota day, by all processes"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT used FROM usage WHERE day = ?", (self.current_day(),)
+            ).fetchone()
+        return row[0] if row else 0
+
+    def remaining(self) -> int:
+        """Credits that can still be reserved today"""
+        now = time.time()
+        day = self.current_day(now)
+
+        with self._lock:
+            used, _ = self._spent_and_held(self._conn, day)
+            held = self._conn.execute(
+                "SELECT COALESCE(SUM(credits), 0) FROM reservations WHERE day = ? AND created >= ?",
+                (day, now - self.reservation_ttl),
+            ).fetchone()[0]
+        return max(0, self.limit - used - held)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_ledger: Optional[CreditLedger] = None
+_ledger_lock = threading.Lock()
+
+
+def get_credit_ledger() -> CreditLedger:
+    """Return the process-wide credit ledger (opened on first use)"""
+    global _ledger
+
+    if _ledger is None:
+        with _ledger_lock:
+            if _ledger is None:
+                _ledger = CreditLedger()
+    return _ledger
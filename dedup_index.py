@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Cross-Source Article Deduplication
+==================================
+
+The same story reaches us through Google News, NEWS_SOURCES, RSS_FEEDS, GDELT
+and NewsData. DedupIndex drops repeats before anything expensive (scraping,
+storing) happens, using two keys per article:
+
+1. Canonical link - tracking parameters stripped, www./fragments removed and
+   Google News redirect URLs unwrapped (see url_utils.canonicalize_url)
+2. Content fingerprint - a 64-bit SimHash of title + summary, so rewritten
+   headlines and copies of one story on two feeds (e.g. BBC World and BBC top
+   stories) are caught even when the links differ
+
+Near-duplicate lookup uses block-pair tables: the fingerprint is split into
+max_distance + 2 blocks (5 blocks of 12-13 bits for the default distance 3).
+Fingerprints within max_distance differing bits can differ in at most
+max_distance blocks, so at least 2 blocks are identical. Every pair of blocks
+gets its own table (10 tables), keyed by the bits of those two blocks. A
+lookup then only compares against the entries in 10 buckets of 25+ bit keys:
+about 10 * n / 2^25 candidates for n fingerprints. That is still well under
+one comparison per lookup at millions of articles, so lookups don't slow down
+as the index grows. benchmarks/bench_dedup.py checks this.
+
+Usage:
+    from dedup_index import DedupIndex
+
+    index = DedupIndex()
+    fresh = index.filter(articles)   # Keeps first occurrence of each story
+"""
+
+import hashlib
+import re
+import threading
+from collections import Counter
+from itertools import combinations
+from typing import Dict, List, Optional, Set, Union
+
+from url_utils import canonicalize_url
+
+SIMHASH_BITS = 64
+DEFAULT_MAX_DISTANCE = 3
+MAX_DISTANCE = 3          # More would mean many tables with short, crowded keys
+MIN_FEATURES = 6          # Texts shorter than this are too noisy to fingerprint
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+# " - BBC News", " | Reuters": publisher suffixes that differ between feeds
+_PUBLISHER_SUFFIX = re.compile(r"\s+[-|–—]\s+[^-|–—]{1,40}$")
+
+
+def _hash64(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def _features(text: str) -> List[str]:
+    """Words plus word bigrams, lowercased"""
+    words = _WORD.findall(text.lower())
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def simhash(text: str) -> Optional[int]:
+    """
+    64-bit SimHash of a text (None if the text is too short to be meaningful)
+
+    Similar texts get fingerprints that differ in only a few bits.
+    """
+    features = _features(text)
+    if len(features) < MIN_FEATURES:
+        return None
+
+    # One bit-string row per feature occurrence; a fingerprint bit is set when
+    # most rows have it set (column counting runs in C via zip/str.count)
+    rows = []
+    for feature, count in Counter(features).items():
+        rows.extend([format(_hash64(feature), "064b")] * count)
+
+    half = len(rows) / 2
+    fingerprint = 0
+    for position, column in enumerate(zip(*rows)):
+        if column.count("1") > half:
+            fingerprint |= 1 << (SIMHASH_BITS - 1 - position)
+    return fingerprint
+
+
+def table_masks(max_distance: int) -> List[int]:
+    """
+    Bit masks of the lookup tables: one per pair of the max_distance + 2 blocks
+
+    Two fingerprints within max_distance bits agree on at least one of them.
+    """
+    blocks = max_distance + 2
+    bounds = [SIMHASH_BITS * i // blocks for i in range(blocks + 1)]
+    block_masks = [((1 << (high - low)) - 1) << low for low, high in zip(bounds, bounds[1:])]
+    return [a | b for a, b in combinations(block_masks, 2)]
+
+
+def article_text(article: Dict, max_chars: int = 500) -> str:
+    """Title (without publisher suffix) plus the start of the summary"""
+    title = _PUBLISHER_SUFFIX.sub("", article.get("title") or "")
+    body = article.get("description") or article.get("summary") or article.get("full_content") or ""
+    return f"{title} {re.sub(r'<[^>]+>', ' ', body)[:max_chars]}"
+
+
+class DedupIndex:
+    """
+    In-memory index of seen articles (canonical links + SimHash fingerprints)
+    """
+
+    def __init__(self, max_distance: int = DEFAULT_MAX_DISTANCE):
+        """
+        Args:
+            max_distance: Max differing fingerprint bits for a near-duplicate (0-3)
+        """
+        if not 0 <= max_distance <= MAX_DISTANCE:
+            raise ValueError(f"max_distance must be between 0 and {MAX_DISTANCE}")
+
+        self.max_distance = max_distance
+        self.duplicates = 0
+        self.comparisons = 0  # Fingerprints compared by lookups so far
+
+        self._links: Set[int] = set()  # 64-bit hashes keep millions of links small
+        self._masks = table_masks(max_distance)
+        # Bucket -> one fingerprint, or a list once a second one lands there
+        # (almost all buckets hold one, and a bare int is far smaller than a list)
+        self._tables: List[Dict[int, Union[int, List[int]]]] = [{} for _ in self._masks]
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._links)
+
+    def _near_duplicate(self, fingerprint: int) -> bool:
+        for mask, table in zip(self._masks, self._tables):
+            bucket = table.get(fingerprint & mask)
+            if bucket is None:
+                continue
+            candidates = bucket if isinstance(bucket, list) else (bucket,)
+            self.comparisons += len(candidates)
+            for other in candidates:
+                if bin(fingerprint ^ other).count("1") <= self.max_distance:
+                    return True
+        return False
+
+    def _index(self, fingerprint: int):
+        for mask, table in zip(self._masks, self._tables):
+            key = fingerprint & mask
+            bucket = table.get(key)
+            if bucket is None:
+                table[key] = fingerprint
+            elif isinstance(bucket, list):
+                bucket.append(fingerprint)
+            else:
+                table[key] = [bucket, fingerprint]
+
+    def _link_key(self, article: Dict) -> Optional[int]:
+        link = article.get("link")
+        if not link or link == "N/A":
+            return None
+        return _hash64(canonicalize_url(link))
+
+    def check(self, article: Dict) -> Optional[str]:
+        """
+        Return why an article is a duplicate ("link" or "content"), or None if new
+
+        Does not add the article to the index.
+        """
+        link_key = self._link_key(article)
+        fingerprint = simhash(article_text(article))
+
+        with self._lock:
+            if link_key is not None and link_key in self._links:
+                return "link"
+            if fingerprint is not None and self._near_duplicate(fingerprint):
+                return "content"
+        return None
+
+    def add(self, article: Dict) -> bool:
+        """
+        Index an article unless it duplicates one already seen
+
+        Returns:
+            True if the article was new, False if it was a duplicate
+        """
+        link_key = self._link_key(article)
+        fingerprint = simhash(article_text(article))
+
+        with self._lock:
+            if (link_key is not None and link_key in self._links) or (
+                fingerprint is not None and self._near_duplicate(fingerprint)
+            ):
+                self.duplicates += 1
+                return False
+
+            if link_key is not None:
+                self._links.add(link_key)
+            if fingerprint is not None:
+                self._index(fingerprint)
+            return True
+
+    def filter(self, articles: List[Dict]) -> List[Dict]:
+        """Return only the articles not seen before (first occurrence wins), indexing them"""
+        return [article for article in articles if self.add(article)]
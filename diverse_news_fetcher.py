@@ -7,10 +7,13 @@ Fetch news from multiple sources across different categories.
 100% FREE - No API keys, no limits.
 """
 
-import feedparser
+from http_session import fetch_feed
 import json
-from typing import List, Dict
-import time
+from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dedup_index import DedupIndex
+from article_store import ArticleStore
+from metrics import get_metrics
 
 # Diverse free RSS feeds (tested & working)
 NEWS_SOURCES = {
@@ -49,11 +52,11 @@ NEWS_SOURCES = {
 }
 
 
-def fetch_from_source(name: str, url: str, limit: int = 3) -> List[Dict]:
+def fetch_from_source(name: str, url: str, limit: int = 3, timeout: float = 10) -> List[Dict]:
     """Fetch articles from a single RSS feed"""
 
     try:
-        feed = feedparser.parse(url)
+        feed = fetch_feed(url, timeout=timeout)
 
         articles = []
         for entry in feed.entries[:limit]:
@@ -73,8 +76,31 @@ def fetch_from_source(name: str, url: str, limit: int = 3) -> List[Dict]:
         return []
 
 
-def fetch_all_news(articles_per_source: int = 2) -> Dict[str, List[Dict]]:
-    """Fetch from all categories and sources"""
+def fetch_all_news(
+    articles_per_source: int = 2,
+    max_workers: int = 16,
+    feed_timeout: float = 10,
+    dedup: bool = True,
+    store: Optional[ArticleStore] = None
+) -> Dict[str, List[Dict]]:
+    """
+    Fetch from all categories and sources
+
+    Every feed is on its own host, so all feeds are downloaded concurrently
+    and a full refresh takes about as long as the slowest single feed.
+
+    Args:
+        articles_per_source: Articles to keep from each feed
+        max_workers: Feeds downloaded at the same time
+        feed_timeout: Per-feed request timeout in seconds
+        dedup: Drop stories already returned by another feed (same canonical
+               link or near-identical title/summary)
+        store: Optional ArticleStore; each feed's articles are appended (with
+               their category) as soon as they are collected
+
+    Returns:
+        {category: [articles]} in NEWS_SOURCES order
+    """
 
     print("""
 ╔════════════════════════════════════════════════════════════════╗
@@ -84,26 +110,45 @@ def fetch_all_news(articles_per_source: int = 2) -> Dict[str, List[Dict]]:
 ╚════════════════════════════════════════════════════════════════╝
 """)
 
-    all_news = {}
-
-    for category, sources in NEWS_SOURCES.items():
-        print(f"\n📰 {category.upper()}")
-        print("-" * 60)
-
-        category_articles = []
-
-        for source_name, url in sources:
-            articles = fetch_from_source(source_name, url, limit=articles_per_source)
-
-            if articles:
-                print(f"   ✓ {source_name}: {len(articles)} articles")
-                category_articles.extend(articles)
-            else:
-                print(f"   ✗ {source_name}: failed")
-
-            time.sleep(0.5)  # Be polite
-
-        all_news[category] = category_articles
+    # Submit every feed at once, then collect in NEWS_SOURCES order
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            category: [
+                (source_name, executor.submit(
+                    fetch_from_source, source_name, url, articles_per_source, feed_timeout
+                ))
+                for source_name, url in sources
+            ]
+            for category, sources in NEWS_SOURCES.items()
+        }
+
+        all_news = {}
+        dedup_index = DedupIndex() if dedup else None
+
+        for category, source_futures in futures.items():
+            print(f"\n📰 {category.upper()}")
+            print("-" * 60)
+
+            category_articles = []
+
+            for source_name, future in source_futures:
+                articles = future.result()
+
+                if articles and dedup_index:
+                    fetched = len(articles)
+                    articles = dedup_index.filter(articles)
+                    if len(articles) < fetched:
+                        print(f"   ≈ {source_name}: {fetched - len(articles)} duplicates dropped")
+
+                if articles:
+                    print(f"   ✓ {source_name}: {len(articles)} articles")
+                    category_articles.extend(articles)
+                    if store:
+                        store.append_many({**article, "category": category} for article in articles)
+                else:
+                    print(f"   ✗ {source_name}: failed")
+
+            all_news[category] = category_articles
 
     return all_news
 
@@ -140,7 +185,7 @@ def display_news(news: Dict[str, List[Dict]]):
 def save_news(news: Dict[str, List[Dict]], filename: str = "diverse_news.json"):
     """Save to JSON file"""
 
-    with open(filename, "w", encoding="utf-8") as f:
+    with get_metrics().timer("save", target="json"), open(filename, "w", encoding="utf-8") as f:
         json.dump(news, f, indent=2, ensure_ascii=False)
 
     total = sum(len(articles) for articles in news.values())
@@ -149,7 +194,7 @@ def save_news(news: Dict[str, List[Dict]], filename: str = "diverse_news.json"):
 
 def main():
     # Fetch all news
-    news = fetch_all_news(articles_per_source=3)
+    news = fetch_all_news(articles_per_source=3, store=ArticleStore(name="diverse_news"))
 
     # Display
     total = display_news(news)
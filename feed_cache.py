@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Conditional GET Feed Cache
+==========================
+
+Persistent on-disk state for RSS/Atom feeds so polls cost a header exchange
+instead of a full download + parse when nothing changed.
+
+For every feed URL we keep one small JSON file with:
+- the ETag and Last-Modified headers of the last 200 response
+- the parsed entries and channel info from that response
+
+The next fetch replays them as If-None-Match / If-Modified-Since. A
+304 Not Modified reply is answered straight from the stored entries, with no
+XML download and no feedparser run.
+
+Used by http_session.fetch_feed(); the cache directory defaults to
+.feed_cache/ and can be moved with the FEED_CACHE_DIR environment variable.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import Dict, Optional
+
+DEFAULT_CACHE_DIR = os.getenv("FEED_CACHE_DIR", ".feed_cache")
+
+
+class FeedCache:
+    """
+    One JSON file per feed URL, written atomically
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        """
+        Args:
+            cache_dir: Directory holding the per-feed state files
+        """
+        self.cache_dir = cache_dir
+        self._memory: Dict[str, Dict] = {}  # url -> state, avoids re-reading files
+        self._lock = threading.Lock()
+
+    def _path(self, url: str) -> str:
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def _load(self, url: str) -> Optional[Dict]:
+        """Return the stored state for a URL, or None"""
+        with self._lock:
+            if url in self._memory:
+                return self._memory[url]
+
+        try:
+            with open(self._path(url), "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if state.get("url") != url:
+            return None
+
+        with self._lock:
+            self._memory[url] = state
+        return state
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Headers that turn the next GET of `url` into a conditional request"""
+        state = self._load(url)
+        if not state:
+            return {}
+
+        headers = {}
+        if state.get("etag"):
+            headers["If-None-Match"] = state["etag"]
+        if state.get("modified"):
+            headers["If-Modified-Since"] = state["modified"]
+        return headers
+
+    def load_feed(self, url: str):
+        """
+        Rebuild the last stored feed for a 304 response
+
+        Returns:
+            feedparser.FeedParserDict shaped like feedparser.parse() output, or None
+        """
+        state = self._load(url)
+        if not state:
+            return None
+
+        import feedparser  # Deferred so importing the cache stays cheap
+
+        return feedparser.FeedParserDict(
+            feed=feedparser.FeedParserDict(state.get("feed", {})),
+            entries=[feedparser.FeedParserDict(entry) for entry in state.get("entries", [])],
+            etag=state.get("etag"),
+            modified=state.get("modified"),
+            href=url,
+            status=304,
+            bozo=0,
+        )
+
+    def store(self, url: str, etag: Optional[str], modified: Optional[str], feed):
+        """
+        Remember validators and parsed entries of a 200 response
+
+        Feeds that send neither ETag nor Last-Modified can't be revalidated,
+        so nothing is written for them.
+        """
+        if not etag and not modified:
+            return
+
+        state = {
+            "url": url,
+            "etag": etag,
+            "modified": modified,
+            "feed": dict(feed.get("feed", {})),
+            "entries": [dict(entry) for entry in feed.get("entries", [])],
+        }
+
+        payload = json.dumps(state, ensure_ascii=False, default=str)
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        # Write to a temp file first so a crash never leaves half a JSON file
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, self._path(url))
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        # Keep the in-memory copy identical to what a later run reads from disk
+        with self._lock:
+            self._memory[url] = json.loads(payload)
+
+
+_feed_cache: Optional[FeedCache] = None
+_feed_cache_lock = threading.Lock()
+
+
+def get_feed_cache() -> FeedCache:
+    """Return the process-wide feed cache"""
+    global _feed_cache
+
+    if _feed_cache is None:
+        with _feed_cache_lock:
+            if _feed_cache is None:
+                _feed_cache = FeedCache()
+    return _feed_cache
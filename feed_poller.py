@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+Adaptive Feed Poller
+====================
+
+Resident poller for every RSS feed we know about (UnlimitedNewsFetcher.RSS_FEEDS,
+diverse_news_fetcher.NEWS_SOURCES and google_news_simple.GOOGLE_NEWS_FEEDS).
+
+Instead of re-running every source on a fixed hourly sweep, each feed has its
+own timer:
+
+- The refresh interval is learned from the feed's entry timestamps: a feed
+  that publishes every 5 minutes is polled about every 5 minutes, a journal
+  that posts twice a day is polled a few times a day
+- A poll that finds nothing new backs the interval off; feeds without usable
+  timestamps adapt from that signal alone
+- Failed polls retry with exponential backoff, so dead feeds stop costing a
+  timeout every few minutes
+- Requests are conditional GETs (http_session.fetch_feed), so an unchanged
+  feed costs a 304 and no parsing
+
+Only entries not seen before in that feed, and not duplicates of a story from
+another feed (DedupIndex), are handed to the store. Learned intervals and seen
+links are kept in a state file, so a restart carries on where it stopped.
+
+Usage:
+    python feed_poller.py                # Run until Ctrl+C / SIGTERM
+    python feed_poller.py --once         # Poll every due feed once and exit
+    python feed_poller.py --db           # Store in ArticleDatabase instead of ArticleStore
+"""
+
+import argparse
+import calendar
+import json
+import os
+import signal
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from article_store import ArticleStore
+from dedup_index import DedupIndex
+from http_session import fetch_feed
+
+DEFAULT_STATE_PATH = os.getenv("FEED_POLLER_STATE", ".feed_poller_state.json")
+
+MIN_INTERVAL = 2 * 60          # Never poll a feed more often than every 2 minutes
+MAX_INTERVAL = 6 * 60 * 60     # ... or less often than every 6 hours
+INITIAL_INTERVAL = 15 * 60     # First guess for a feed we know nothing about
+QUIET_BACKOFF = 1.5            # Interval multiplier after a poll with nothing new
+BUSY_SPEEDUP = 0.75            # Interval multiplier when there are new entries but no timestamps
+SMOOTHING = 0.5                # Weight of the newest estimate against the current interval
+RATE_WINDOW = 10               # Newest entries used to estimate the publishing rate
+SEEN_PER_FEED = 300            # Links remembered per feed
+DEDUP_WINDOW = 24 * 60 * 60    # Cross-feed dedup index is rebuilt once a day
+
+# Printed by main() only, so importing this module has no side effects
+BANNER = """
+╔════════════════════════════════════════════════════════════════╗
+║         ADAPTIVE FEED POLLER                                   ║
+║                                                                ║
+║  Every feed on its own timer, learned from its publish rate   ║
+╚════════════════════════════════════════════════════════════════╝
+"""
+
+
+def known_feeds() -> List[Dict]:
+    """
+    Every feed from RSS_FEEDS, NEWS_SOURCES and GOOGLE_NEWS_FEEDS, one entry per URL
+
+    Returns:
+        [{"name", "url", "category"}] in source order
+    """
+    from diverse_news_fetcher import NEWS_SOURCES
+    from google_news_simple import GOOGLE_NEWS_FEEDS
+    from unlimited_news_fetcher import UnlimitedNewsFetcher
+
+    feeds = []
+    for name, url in UnlimitedNewsFetcher.RSS_FEEDS.items():
+        feeds.append({"name": name, "url": url, "category": "general"})
+    for category, sources in NEWS_SOURCES.items():
+        for name, url in sources:
+            feeds.append({"name": name, "url": url, "category": category.lower()})
+    for category, url in GOOGLE_NEWS_FEEDS.items():
+        feeds.append({"name": f"Google News {category}", "url": url, "category": category})
+
+    unique = {}
+    for feed in feeds:
+        unique.setdefault(feed["url"], feed)
+    return list(unique.values())
+
+
+def entry_timestamp(entry) -> Optional[float]:
+    """Publish (or update) time of a feed entry as a Unix timestamp, or None"""
+    parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+    if not parsed:
+        return None
+    try:
+        return float(calendar.timegm(parsed))
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def publish_gap(timestamps: List[float], now: float) -> Optional[float]:
+    """
+    Typical seconds between entries, from the newest RATE_WINDOW timestamps
+
+    A feed that has gone quiet for longer than its usual gap is treated as
+    publishing at most every half of that silence.
+
+    Returns:
+        Estimated gap in seconds, or None with fewer than two usable timestamps
+    """
+    recent = sorted((ts for ts in timestamps if ts <= now + 300), reverse=True)[:RATE_WINDOW]
+    if len(recent) < 2:
+        return None
+
+    gap = (recent[0] - recent[-1]) / (len(recent) - 1)
+    return max(gap, (now - recent[0]) / 2)
+
+
+def next_interval(
+    current: float,
+    gap: Optional[float],
+    new_entries: int,
+    min_interval: float = MIN_INTERVAL,
+    max_interval: float = MAX_INTERVAL
+) -> float:
+    """
+    Refresh interval after a successful poll
+
+    Args:
+        current: Interval used so far
+        gap: Estimated seconds between entries (publish_gap), or None
+        new_entries: Entries this poll that had not been seen before
+        min_interval: Lower bound
+        max_interval: Upper bound
+
+    Returns:
+        New interval in seconds
+    """
+    if new_entries == 0:
+        interval = current * QUIET_BACKOFF
+    elif gap is not None:
+        # Aim for about one new entry per poll
+        interval = SMOOTHING * gap + (1 - SMOOTHING) * current
+    else:
+        interval = current * BUSY_SPEEDUP
+
+    return min(max(interval, min_interval), max_interval)
+
+
+def load_state(state_path: str) -> Dict:
+    """Feed state by URL (empty if missing or unreadable)"""
+    try:
+        with open(state_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(state_path: str, state: Dict):
+    """Write the feed state atomically"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(state_path)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, state_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+class FeedPoller:
+    """
+    Polls each feed on its own adaptive schedule and stores new articles
+    """
+
+    def __init__(
+        self,
+        feeds: Optional[List[Dict]] = None,
+        store=None,
+        state_path: str = DEFAULT_STATE_PATH,
+        workers: int = 8,
+        min_interval: float = MIN_INTERVAL,
+        max_interval: float = MAX_INTERVAL,
+        feed_timeout: float = 10
+    ):
+        """
+        Args:
+            feeds: [{"name", "url", "category"}] (default: known_feeds())
+            store: ArticleStore / ArticleDatabase (anything with append_many)
+            state_path: JSON file with learned intervals and seen links
+            workers: Feeds downloaded at the same time
+            min_interval: Shortest refresh interval in seconds
+            max_interval: Longest refresh interval in seconds
+            feed_timeout: Per-feed request timeout in seconds
+        """
+        self.feeds = feeds if feeds is not None else known_feeds()
+        self.store = store
+        self.state_path = state_path
+        self.workers = workers
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.feed_timeout = feed_timeout
+
+        self.polls = 0
+        self.new_articles = 0
+        self.dedup_index = DedupIndex()
+        self._dedup_started = time.time()
+        self._stop = threading.Event()
+
+        saved = load_state(state_path) if state_path else {}
+        self.state = {}
+        for feed in self.feeds:
+            entry = saved.get(feed["url"], {})
+            self.state[feed["url"]] = {
+                "name": feed["name"],
+                "category": feed["category"],
+                "interval": entry.get("interval", INITIAL_INTERVAL),
+                "next_due": entry.get("next_due", 0.0),
+                "failures": entry.get("failures", 0),
+                "seen": entry.get("seen", []),
+                "polls": entry.get("polls", 0),
+                "new_articles": entry.get("new_articles", 0),
+            }
+
+    def due_feeds(self, now: Optional[float] = None) -> List[str]:
+        """URLs of feeds whose next poll is due, most overdue first"""
+        now = time.time() if now is None else now
+        due = [url for url, entry in self.state.items() if entry["next_due"] <= now]
+        return sorted(due, key=lambda url: self.state[url]["next_due"])
+
+    def seconds_until_due(self) -> float:
+        """Seconds until the next feed is due (0 if one already is)"""
+        if not self.state:
+            return self.max_interval
+        return max(0.0, min(entry["next_due"] for entry in self.state.values()) - time.time())
+
+    def poll_feed(self, url: str) -> List[Dict]:
+        """
+        Poll one feed and reschedule it
+
+        Returns:
+            Articles not seen before in this feed (before cross-feed dedup)
+        """
+        entry = self.state[url]
+        now = time.time()
+
+        try:
+            feed = fetch_feed(url, timeout=self.feed_timeout)
+            if feed.get("status", 200) >= 400:
+                raise IOError(f"HTTP {feed['status']}")
+        except Exception as e:
+            entry["failures"] += 1
+            # Exponential backoff on errors, without touching the learned interval
+            delay = min(entry["interval"] * 2 ** entry["failures"], self.max_interval)
+            entry["next_due"] = now + delay
+            print(f"   ✗ {entry['name']}: {type(e).__name__} (retry in {delay / 60:.0f} min)")
+            return []
+
+        seen = set(entry["seen"])
+        timestamps = []
+        articles = []
+
+        for item in feed.entries:
+            timestamp = entry_timestamp(item)
+            if timestamp is not None:
+                timestamps.append(timestamp)
+
+            link = item.get("link")
+            if not link or link in seen:
+                continue
+            seen.add(link)
+            entry["seen"].append(link)
+            articles.append({
+                "title": item.get("title", "N/A"),
+                "link": link,
+                "published": item.get("published", "N/A"),
+                "summary": item.get("summary", "N/A")[:200],
+                "source": entry["name"],
+                "category": entry["category"],
+            })
+
+        entry["seen"] = entry["seen"][-SEEN_PER_FEED:]
+        entry["interval"] = next_interval(
+            entry["interval"], publish_gap(timestamps, now), len(articles),
+            self.min_interval, self.max_interval
+        )
+        entry["next_due"] = now + entry["interval"]
+        entry["failures"] = 0
+        entry["polls"] += 1
+        entry["new_articles"] += len(articles)
+        return articles
+
+    def run_once(self) -> int:
+        """
+        Poll every due feed (concurrently), store new articles and save the state
+
+        Returns:
+            Number of new articles stored
+        """
+        due = self.due_feeds()
+        if not due:
+            return 0
+
+        if time.time() - self._dedup_started > DEDUP_WINDOW:
+            self.dedup_index = DedupIndex()
+            self._dedup_started = time.time()
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            results = list(executor.map(self.poll_feed, due))
+
+        stored = 0
+        for url, articles in zip(due, results):
+            articles = self.dedup_index.filter(articles)
+            if articles and self.store:
+                self.store.append_many(articles)
+            stored += len(articles)
+
+            entry = self.state[url]
+            if entry["failures"] == 0:
+                print(f"   {'✓' if articles else '·'} {entry['name']}: {len(articles)} new, "
+                      f"next in {entry['interval'] / 60:.0f} min")
+
+        self.polls += len(due)
+        self.new_articles += stored
+        if self.state_path:
+            save_state(self.state_path, self.state)
+        return stored
+
+    def run(self):
+        """Poll until stop() is called"""
+        while not self._stop.is_set():
+            due = len(self.due_feeds())
+            if due:
+                print(f"\n🔄 {time.strftime('%H:%M:%S')} polling {due} feed(s)")
+                stored = self.run_once()
+                print(f"   {stored} new article(s), {self.new_articles} since start")
+
+            self._stop.wait(self.seconds_until_due())
+
+    def stop(self):
+        """Ask run() to return after the current round"""
+        self._stop.set()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Poll all RSS feeds on adaptive per-feed schedules")
+    parser.add_argument("--once", action="store_true", help="Poll due feeds once and exit")
+    parser.add_argument("--db", action="store_true", help="Store articles in ArticleDatabase (SQLite)")
+    parser.add_argument("--workers", type=int, default=8, help="Feeds downloaded at the same time")
+    parser.add_argument("--state", default=DEFAULT_STATE_PATH, help="State file with learned intervals")
+    parser.add_argument("--min-interval", type=float, default=MIN_INTERVAL, help="Shortest interval (seconds)")
+    parser.add_argument("--max-interval", type=float, default=MAX_INTERVAL, help="Longest interval (seconds)")
+    args = parser.parse_args()
+
+    print(BANNER)
+
+    if args.db:
+        from article_db import ArticleDatabase
+        store = ArticleDatabase()
+    else:
+        store = ArticleStore(name="poller")
+
+    poller = FeedPoller(
+        store=store,
+        state_path=args.state,
+        workers=args.workers,
+        min_interval=args.min_interval,
+        max_interval=args.max_interval,
+    )
+    print(f"📡 {len(poller.feeds)} feeds, intervals {args.min_interval / 60:.0f} min - "
+          f"{args.max_interval / 3600:.1f} h, state in {args.state}")
+
+    signal.signal(signal.SIGTERM, lambda *_: poller.stop())
+
+    try:
+        if args.once:
+            stored = poller.run_once()
+            print(f"\n✓ {stored} new article(s) from {poller.polls} feed(s)")
+        else:
+            poller.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        store.close()
+        print(f"\n✓ Stopped after {poller.polls} polls, {poller.new_articles} new articles")
+
+
+if __name__ == "__main__":
+    main()
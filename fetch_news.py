@@ -7,18 +7,21 @@ Fetch news articles from free RSS feeds.
 No API keys, no limits, no authentication required.
 """
 
-import feedparser
+from http_session import fetch_feed
 import json
-from typing import List, Dict
+from typing import List, Dict, Optional
+from article_store import ArticleStore
+from metrics import get_metrics
 
 
-def fetch_news(rss_url: str, limit: int = 10) -> List[Dict]:
+def fetch_news(rss_url: str, limit: int = 10, store: Optional[ArticleStore] = None) -> List[Dict]:
     """
     Fetch articles from any RSS feed
 
     Args:
         rss_url: RSS feed URL
         limit: Number of articles to fetch
+        store: Optional ArticleStore to append the articles to
 
     Returns:
         List of articles
@@ -27,7 +30,7 @@ def fetch_news(rss_url: str, limit: int = 10) -> List[Dict]:
     print(f"📰 Fetching from: {rss_url}")
 
     try:
-        feed = feedparser.parse(rss_url)
+        feed = fetch_feed(rss_url)
 
         articles = []
         for entry in feed.entries[:limit]:
@@ -39,6 +42,9 @@ def fetch_news(rss_url: str, limit: int = 10) -> List[Dict]:
             }
             articles.append(article)
 
+        if store:
+            store.append_many(articles)
+
         print(f"✓ Got {len(articles)} articles\n")
         return articles
 
@@ -59,7 +65,7 @@ def show(articles: List[Dict]):
 def save(articles: List[Dict], filename: str = "news.json"):
     """Save to JSON"""
 
-    with open(filename, "w") as f:
+    with get_metrics().timer("save", target="json"), open(filename, "w") as f:
         json.dump(articles, f, indent=2)
     print(f"Saved {len(articles)} articles to {filename}")
 
@@ -12,13 +12,16 @@ Options:
 4. news-please (Python library for news extraction)
 """
 
-import feedparser
-import requests
+from http_session import fetch_feed, stream_html, DEFAULT_MAX_HTML_BYTES
+from content_cache import get_content_cache
+from metrics import get_metrics
 from typing import List, Dict, Optional
+import re
 import time
 from urllib.parse import urlparse
 
-print("""
+# Printed by main() only, so importing this module has no side effects
+BANNER = """
 ╔══════════════════════════════════════════════════════════════════════════════╗
 ║                    FREE NEWS SOURCES - TRULY UNLIMITED                       ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
@@ -107,7 +110,14 @@ Common Crawl (Free):
 ╔══════════════════════════════════════════════════════════════════════════════╗
 ║                        IMPLEMENTATION BELOW                                   ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
-""")
+"""
+
+# Compiled once instead of on every scraped page
+_SCRIPT_TAG = re.compile(r'<script[^>]*>.*?</script>', re.DOTALL)
+_STYLE_TAG = re.compile(r'<style[^>]*>.*?</style>', re.DOTALL)
+_PARAGRAPH = re.compile(r'<p[^>]*>(.*?)</p>', re.DOTALL)
+_ANY_TAG = re.compile(r'<[^>]+>')
+_BLANK_LINES = re.compile(r'\n\s*\n')
 
 
 class GDELTNewsFetcher:
@@ -117,6 +127,9 @@ class GDELTNewsFetcher:
 
     GDELT_RSS_URL = "https://feeds.gdeltproject.org/gcnews/gcnews.rss"
 
+    def __init__(self):
+        self.content_cache = get_content_cache()
+
     def fetch_latest_news(self, limit: int = 20) -> List[Dict]:
         """
         Fetch latest news from GDELT RSS feed (updated every 60 seconds)
@@ -131,7 +144,7 @@ class GDELTNewsFetcher:
         try:
             print(f"📡 Fetching from GDELT: {self.GDELT_RSS_URL}\n")
 
-            feed = feedparser.parse(self.GDELT_RSS_URL)
+            feed = fetch_feed(self.GDELT_RSS_URL)
 
             if not feed.entries:
                 print("❌ Could not fetch GDELT feed")
@@ -155,43 +168,55 @@ class GDELTNewsFetcher:
             print(f"❌ Error: {e}")
             return []
 
-    def scrape_article_content(self, url: str, timeout: int = 5) -> Optional[str]:
+    def scrape_article_content(
+        self,
+        url: str,
+        timeout: int = 5,
+        max_bytes: int = DEFAULT_MAX_HTML_BYTES
+    ) -> Optional[str]:
         """
         Scrape full article content from URL
 
         For production use: pip install news-please
         news_please automatically handles article extraction
+
+        Non-HTML responses are skipped and at most `max_bytes` of the page are
+        downloaded. Results are cached by normalized URL, so re-runs skip links
+        already scraped.
         """
 
+        cached = self.content_cache.get(url, namespace="gdelt")
+        if cached is not None:
+            return cached
+
         try:
             headers = {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
             }
 
-            response = requests.get(url, timeout=timeout, headers=headers)
-            response.raise_for_status()
-
             # Try to extract text content
-            import re
+            html = "".join(stream_html(url, timeout=timeout, max_bytes=max_bytes, headers=headers))
 
-            html = response.text
+            with get_metrics().timer("extract", extractor="gdelt_regex"):
+                # Remove script and style tags
+                html = _SCRIPT_TAG.sub('', html)
+                html = _STYLE_TAG.sub('', html)
 
-            # Remove script and style tags
-            html = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL)
-            html = re.sub(r'<style[^>]*>.*?</style>', '', html, flags=re.DOTALL)
+                # Extract text from paragraphs
+                paragraphs = _PARAGRAPH.findall(html)
+                content = '\n'.join(paragraphs)
 
-            # Extract text from paragraphs
-            paragraphs = re.findall(r'<p[^>]*>(.*?)</p>', html, re.DOTALL)
-            content = '\n'.join(paragraphs)
+                # Remove HTML tags
+                content = _ANY_TAG.sub('', content)
+                # Decode HTML entities
+                content = content.replace('&nbsp;', ' ').replace('&amp;', '&')
+                # Remove extra whitespace
+                content = _BLANK_LINES.sub('\n', content).strip()
 
-            # Remove HTML tags
-            content = re.sub(r'<[^>]+>', '', content)
-            # Decode HTML entities
-            content = content.replace('&nbsp;', ' ').replace('&amp;', '&')
-            # Remove extra whitespace
-            content = re.sub(r'\n\s*\n', '\n', content).strip()
-
-            return content[:2000] if content else None
+            content = content[:2000] if content else None
+            if content:
+                self.content_cache.put(url, content, namespace="gdelt")
+            return content
 
         except Exception as e:
             print(f"    ⚠️  Could not scrape: {type(e).__name__}")
@@ -253,7 +278,7 @@ class NewsRSSFetcher:
         try:
             print(f"📡 Fetching from {feed_name}: {url}\n")
 
-            feed = feedparser.parse(url)
+            feed = fetch_feed(url)
 
             articles = []
             for entry in feed.entries[:limit]:
@@ -291,6 +316,8 @@ class NewsRSSFetcher:
 # ============================================================================
 
 def main():
+    print(BANNER)
+
     print("\n" + "="*100)
     print("DEMO: GDELT (Unlimited, Free News Source)")
     print("="*100)
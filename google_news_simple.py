@@ -7,9 +7,11 @@ Just fetch articles from Google News RSS feeds.
 No API keys, no limits, completely free.
 """
 
-import feedparser
+from http_session import fetch_feed
 import json
-from typing import List, Dict
+from typing import List, Dict, Optional
+from article_store import ArticleStore
+from metrics import get_metrics
 import time
 
 # Google News RSS feeds (free, no auth needed)
@@ -24,13 +26,18 @@ GOOGLE_NEWS_FEEDS = {
 }
 
 
-def fetch_google_news(category: str = "top_stories", limit: int = 10) -> List[Dict]:
+def fetch_google_news(
+    category: str = "top_stories",
+    limit: int = 10,
+    store: Optional[ArticleStore] = None
+) -> List[Dict]:
     """
     Fetch articles from Google News RSS feed
 
     Args:
         category: news category (top_stories, world, business, technology, etc.)
         limit: number of articles to fetch
+        store: optional ArticleStore to append the articles to
 
     Returns:
         List of articles
@@ -42,7 +49,7 @@ def fetch_google_news(category: str = "top_stories", limit: int = 10) -> List[Di
     print(f"   URL: {url}\n")
 
     try:
-        feed = feedparser.parse(url)
+        feed = fetch_feed(url)
 
         articles = []
         for entry in feed.entries[:limit]:
@@ -55,6 +62,9 @@ def fetch_google_news(category: str = "top_stories", limit: int = 10) -> List[Di
             }
             articles.append(article)
 
+        if store:
+            store.append_many(articles)
+
         return articles
 
     except Exception as e:
@@ -83,7 +93,7 @@ def display_articles(articles: List[Dict], show_summary: bool = True):
 def save_articles(articles: List[Dict], filename: str = "google_news.json"):
     """Save articles to JSON file"""
 
-    with open(filename, "w", encoding="utf-8") as f:
+    with get_metrics().timer("save", target="json"), open(filename, "w", encoding="utf-8") as f:
         json.dump(articles, f, indent=2, ensure_ascii=False)
 
     print(f"\n✓ Saved {len(articles)} articles to {filename}")
@@ -111,9 +121,10 @@ def main():
     all_articles = []
 
     categories = ["technology", "business", "science"]
+    store = ArticleStore(name="google_news")
 
     for category in categories:
-        articles = fetch_google_news(category=category, limit=5)
+        articles = fetch_google_news(category=category, limit=5, store=store)
         all_articles.extend(articles)
         time.sleep(1)  # Be polite - wait between requests
 
@@ -0,0 +1,465 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP Session
+===================
+
+One pooled requests.Session used by every fetcher module.
+
+Instead of a bare requests.get() per call (new TCP + TLS handshake every
+time), all NewsData, scraping and RSS traffic goes through a single session
+that keeps connections alive per host. Enriching hundreds of links from the
+same handful of publishers then pays the handshake once per host, not once
+per article.
+
+Usage:
+    from http_session import http_get, fetch_feed
+
+    response = http_get("https://example.com/article", timeout=5)
+    feed = fetch_feed("http://feeds.bbc.co.uk/news/rss.xml")  # Conditional GET via feed_cache
+
+Tuning (call once at startup, before the first request):
+    configure_session(pool_connections=64, pool_maxsize=20, retries=3, timeout=15)
+
+Failures are handled here for every caller:
+- Timeouts, connection errors, 429 and 5xx responses are retried with
+  exponential backoff and jitter; a Retry-After header is honored (a reply
+  asking for more than MAX_RETRY_AFTER seconds is returned as is)
+- Callers whose quota counts every request (e.g. the NewsData rate windows)
+  pass before_attempt, which runs before each attempt, retries included
+- Per-host circuit breakers (circuit_breaker.py) make requests to a host that
+  keeps failing raise CircuitOpenError at once instead of waiting for timeouts.
+  Their state is kept across runs, and network errors from a host whose last
+  request already failed are not retried
+
+Every request is instrumented (see metrics.py): connect time of new
+connections, time to first byte, body download time and bytes per host,
+status codes and errors per host, feed parse time and feed cache hits.
+"""
+
+import codecs
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from circuit_breaker import CircuitOpenError, get_breaker
+from feed_cache import get_feed_cache
+from metrics import get_metrics, host_of
+
+DEFAULT_TIMEOUT = 10          # Seconds, used when a caller passes no timeout
+DEFAULT_POOL_CONNECTIONS = 32  # Number of distinct hosts kept in the pool
+DEFAULT_POOL_MAXSIZE = 10     # Keep-alive connections per host
+DEFAULT_RETRIES = 2           # Retries per GET after a timeout, connection error, 429 or 5xx
+DEFAULT_BACKOFF = 0.5         # Seconds before the first retry, doubled for each further one
+MAX_BACKOFF = 30.0            # Longest backoff between two attempts
+MAX_RETRY_AFTER = 60.0        # Longer Retry-After requests are not waited for
+
+RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+DEFAULT_MAX_HTML_BYTES = 1024 * 1024  # Stop reading article pages after 1 MB
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
+_config = {
+    "pool_connections": DEFAULT_POOL_CONNECTIONS,
+    "pool_maxsize": DEFAULT_POOL_MAXSIZE,
+    "retries": DEFAULT_RETRIES,
+    "backoff": DEFAULT_BACKOFF,
+    "timeout": DEFAULT_TIMEOUT,
+}
+_session: Optional[requests.Session] = None
+_lock = threading.Lock()
+
+
+def configure_session(
+    pool_connections: Optional[int] = None,
+    pool_maxsize: Optional[int] = None,
+    retries: Optional[int] = None,
+    timeout: Optional[float] = None,
+    backoff: Optional[float] = None
+):
+    """
+    Change pool sizes, retries or the default timeout
+
+    Args:
+        pool_connections: Number of per-host pools to keep
+        pool_maxsize: Max keep-alive connections per host
+        retries: Retries for failed GETs (timeouts, connection errors, 429, 5xx)
+        timeout: Default request timeout in seconds
+        backoff: Seconds before the first retry (doubled per retry, with jitter)
+
+    The current session (if any) is closed; the next request builds a new one.
+    """
+    global _session
+
+    with _lock:
+        for key, value in (
+            ("pool_connections", pool_connections),
+            ("pool_maxsize", pool_maxsize),
+            ("retries", retries),
+            ("timeout", timeout),
+            ("backoff", backoff),
+        ):
+            if value is not None:
+                _config[key] = value
+
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    """Records the "connect" stage (DNS lookup + TCP) of each new connection"""
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            get_metrics().observe("connect", time.perf_counter() - start, host=self.host)
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    """Records the "connect" stage (DNS lookup + TCP + TLS) of each new connection"""
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            get_metrics().observe("connect", time.perf_counter() - start, host=self.host)
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _InstrumentedAdapter(HTTPAdapter):
+    """HTTPAdapter whose pools time connection setup"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+def _build_session() -> requests.Session:
+    """Create a session with keep-alive pools mounted"""
+    adapter = _InstrumentedAdapter(
+        pool_connections=_config["pool_connections"],
+        pool_maxsize=_config["pool_maxsize"],
+        max_retries=0,  # Retries are done by http_get, which sees every attempt
+    )
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
+
+def get_session() -> requests.Session:
+    """Return the shared session, creating it on first use"""
+    global _session
+
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def _retryable(error: requests.exceptions.RequestException) -> bool:
+    """Timeouts and connection failures are worth another attempt; bad URLs etc. are not"""
+    return isinstance(error, (
+        requests.exceptions.ConnectionError,
+        requests.exceptions.Timeout,
+        requests.exceptions.ChunkedEncodingError,
+    ))
+
+
+def _retry_after(response: requests.Response) -> Optional[float]:
+    """Seconds requested by a Retry-After header (delta or HTTP date), or None"""
+    value = response.headers.get("Retry-After", "").strip()
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def retry_wait(error: requests.exceptions.RequestException) -> Optional[float]:
+    """
+    How long to wait before repeating a request http_get gave up on
+
+    Args:
+        error: The exception http_get (or raise_for_status on its response) raised
+
+    Returns:
+        Seconds the server asked for (0 if it didn't say), or None if repeating
+        the request is pointless (4xx, open circuit, Retry-After too long)
+    """
+    if isinstance(error, CircuitOpenError):
+        return None
+
+    response = getattr(error, "response", None)
+    if response is not None:
+        if response.status_code not in RETRY_STATUSES:
+            return None
+        wait = _retry_after(response)
+        if wait is not None and wait > MAX_RETRY_AFTER:
+            return None
+        return wait or 0.0
+
+    return 0.0 if _retryable(error) else None
+
+
+def _backoff(attempt: int) -> float:
+    """Exponential backoff with jitter: somewhere in [d/2, d] for d = backoff * 2^attempt"""
+    delay = min(_config["backoff"] * 2 ** attempt, MAX_BACKOFF)
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def http_get(
+    url: str,
+    timeout: Optional[float] = None,
+    before_attempt: Optional[Callable[[], object]] = None,
+    **kwargs
+) -> requests.Response:
+    """
+    GET a URL through the shared session, with retries and the host's circuit breaker
+
+    Args:
+        url: URL to fetch
+        timeout: Request timeout in seconds (default from configure_session)
+        before_attempt: Called before every attempt, retries included (e.g. a
+                        rate limiter's acquire, so each request takes a slot)
+        **kwargs: Passed through to requests (params, headers, stream, ...)
+
+    Returns:
+        requests.Response (the last attempt's, if every retry got 429/5xx)
+
+    Raises:
+        CircuitOpenError: The host's circuit is open (it kept failing)
+        requests.exceptions.RequestException: Network errors, after the retries
+    """
+    if timeout is None:
+        timeout = _config["timeout"]
+
+    metrics = get_metrics()
+    host = host_of(url)
+    breaker = get_breaker(host)
+    attempts = _config["retries"] + 1
+    # The last request(s) to this host failed too (maybe in an earlier run): one
+    # more network error is taken as an answer rather than retried
+    failing = breaker.failures > 0
+
+    for attempt in range(attempts):
+        if not breaker.allow():
+            metrics.record_error(host, "CircuitOpen")
+            raise CircuitOpenError(f"{host} is failing, skipped for {breaker.retry_in():.0f}s: {url}")
+
+        if before_attempt is not None:
+            before_attempt()
+
+        start = time.perf_counter()
+
+        try:
+            response = get_session().get(url, timeout=timeout, **kwargs)
+        except requests.exceptions.RequestException as e:
+            metrics.record_error(host, type(e).__name__)
+            if not _retryable(e):
+                raise
+            breaker.record_failure()
+            if attempt == attempts - 1 or failing:
+                raise
+            metrics.record_retry(host, type(e).__name__)
+            time.sleep(_backoff(attempt))
+            continue
+
+        # elapsed = request sent -> headers parsed (includes connect on a new connection)
+        metrics.observe("ttfb", response.elapsed.total_seconds(), host=host)
+        metrics.record_request(host, response.status_code)
+        if response.status_code >= 400:
+            metrics.record_error(host, f"HTTP {response.status_code}")
+
+        # 429 means the host is up but wants us to slow down
+        if response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+
+        if response.status_code in RETRY_STATUSES and attempt < attempts - 1:
+            retry_after = _retry_after(response)
+            if retry_after is None or retry_after <= MAX_RETRY_AFTER:
+                response.close()
+                metrics.record_retry(host, f"HTTP {response.status_code}")
+                time.sleep(max(retry_after or 0.0, _backoff(attempt)))
+                continue
+
+        if not kwargs.get("stream"):
+            # Body already read by requests; streamed bodies are timed by the reader
+            download = time.perf_counter() - start - response.elapsed.total_seconds()
+            metrics.observe("download", max(download, 0.0), host=host)
+            metrics.add_bytes(host, len(response.content))
+
+        return response
+
+
+def fetch_feed(url: str, timeout: Optional[float] = None, use_cache: bool = True):
+    """
+    Download an RSS/Atom feed through the shared session and parse it
+
+    Replaces feedparser.parse(url), which opens its own connection every call.
+    With use_cache, the request is sent as a conditional GET (ETag /
+    Last-Modified from feed_cache) and a 304 reply is served from the stored
+    entries without downloading or parsing anything.
+
+    Args:
+        url: Feed URL
+        timeout: Request timeout in seconds
+        use_cache: Revalidate against the on-disk feed cache
+
+    Returns:
+        feedparser result (same object feedparser.parse returns)
+    """
+    cache = get_feed_cache() if use_cache else None
+    headers = cache.conditional_headers(url) if cache else {}
+
+    response = http_get(url, timeout=timeout, headers=headers)
+    metrics = get_metrics()
+
+    if response.status_code == 304 and cache:
+        cached = cache.load_feed(url)
+        if cached is not None:
+            metrics.record_cache("feed", hit=True)
+            return cached
+        # Validators without stored entries - fetch the full feed again
+        response = http_get(url, timeout=timeout)
+
+    if cache:
+        metrics.record_cache("feed", hit=False)
+
+    import feedparser  # Deferred: only feed readers pay for the import
+
+    with metrics.timer("parse", source="rss"):
+        feed = feedparser.parse(response.content, response_headers=dict(response.headers))
+    feed["status"] = response.status_code
+    feed["href"] = response.url
+
+    if cache and response.status_code == 200:
+        try:
+            cache.store(
+                url,
+                etag=response.headers.get("ETag"),
+                modified=response.headers.get("Last-Modified"),
+                feed=feed,
+            )
+        except OSError as e:
+            print(f"   ⚠️  Could not update feed cache: {e}")
+
+    return feed
+
+
+class ResponseRejected(requests.exceptions.RequestException):
+    """Response was skipped before download (not HTML, or larger than the byte budget)"""
+
+
+def stream_html(
+    url: str,
+    timeout: Optional[float] = None,
+    max_bytes: int = DEFAULT_MAX_HTML_BYTES,
+    headers: Optional[Dict[str, str]] = None,
+    chunk_size: int = 16384
+) -> Iterator[str]:
+    """
+    Stream an HTML page as decoded text chunks, within a byte budget
+
+    - Non-HTML responses (PDFs, images, feeds...) are rejected from the headers
+    - A Content-Length above max_bytes is rejected before any body is read
+    - Otherwise at most max_bytes of body are read, then the download stops
+
+    Use with contextlib.closing() (or exhaust it) so the connection is released
+    as soon as the consumer stops early.
+
+    Args:
+        url: Page URL
+        timeout: Request timeout in seconds
+        max_bytes: Maximum body bytes to download
+        headers: Extra request headers
+        chunk_size: Bytes per network read
+
+    Yields:
+        Decoded text chunks
+
+    Raises:
+        ResponseRejected: Wrong content type or declared size over budget
+        requests.exceptions.RequestException: Network or HTTP errors
+    """
+    metrics = get_metrics()
+    host = host_of(url)
+
+    with http_get(url, timeout=timeout, headers=headers, stream=True) as response:
+        response.raise_for_status()
+
+        content_type = response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+        if content_type and content_type not in HTML_CONTENT_TYPES:
+            metrics.record_error(host, "ResponseRejected")
+            raise ResponseRejected(f"Not HTML ({content_type}): {url}")
+
+        declared = response.headers.get("Content-Length")
+        if declared and declared.isdigit() and int(declared) > max_bytes:
+            metrics.record_error(host, "ResponseRejected")
+            raise ResponseRejected(f"Too large ({declared} bytes > {max_bytes}): {url}")
+
+        decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+        remaining = max_bytes
+        chunks = response.iter_content(chunk_size=chunk_size)
+        received = 0
+        downloading = 0.0  # Time spent in network reads only, not in the consumer
+
+        try:
+            while True:
+                start = time.perf_counter()
+                chunk = next(chunks, None)
+                downloading += time.perf_counter() - start
+                if chunk is None:
+                    break
+                received += len(chunk)
+
+                if len(chunk) >= remaining:
+                    yield decoder.decode(chunk[:remaining], final=True)
+                    return
+                remaining -= len(chunk)
+                yield decoder.decode(chunk)
+
+            yield decoder.decode(b"", final=True)
+        finally:
+            metrics.observe("download", downloading, host=host)
+            metrics.add_bytes(host, received)
+
+
+def close_session():
+    """Close all pooled connections (e.g. before a worker process exits)"""
+    global _session
+
+    with _lock:
+        if _session is not None:
+            _session.close()
+            _session = None
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Fetcher Instrumentation
+=======================
+
+Process-wide timings and counters for every fetch path, so it is clear which
+stage dominates wall time.
+
+Stages (seconds, with count / sum / max per label set):
+- connect   new connection: DNS lookup + TCP (+ TLS for https), per host
+- ttfb      request sent -> response headers received, per host
+- download  reading the response body, per host
+- parse     feedparser / JSON decoding, per source
+- extract   article text extraction, per extractor
+- save      writing articles to disk, per target
+
+Counters:
+- requests per host and status, bytes downloaded per host
+- errors per host and error type (network errors, HTTP >= 400, rejected pages,
+  requests skipped by an open circuit breaker)
+- retries per host and reason
+- cache lookups per cache, as hits and misses
+
+The network stages are recorded centrally in http_session, so NewsDataFetcher,
+NewsDataWithContent, UnlimitedNewsFetcher, GDELTNewsFetcher and the RSS
+functions are all covered without extra code.
+
+Usage:
+    from metrics import get_metrics
+
+    metrics = get_metrics()
+    with metrics.timer("extract", extractor="html_parser"):
+        ...
+
+    metrics.write("news_metrics.prom")   # Prometheus text format
+    metrics.write("news_metrics.json")   # JSON snapshot
+
+Set NEWS_METRICS_PATH to have the metrics written automatically when the
+process exits (".json" for JSON, anything else for Prometheus text).
+"""
+
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+from urllib.parse import urlsplit
+
+METRIC_PREFIX = "news"
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def host_of(url: str) -> str:
+    """Host label for a URL"""
+    return (urlsplit(url).hostname or "unknown").lower()
+
+
+def _labels(labels: Dict[str, object]) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+class Metrics:
+    """
+    Thread-safe collector for stage timings and counters
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Drop everything recorded so far"""
+        with self._lock:
+            self._stages: Dict[Tuple[str, Labels], list] = {}   # -> [count, sum, max]
+            self._requests: Dict[Tuple[str, str], int] = {}      # (host, status)
+            self._bytes: Dict[str, int] = {}                     # host
+            self._errors: Dict[Tuple[str, str], int] = {}        # (host, error)
+            self._retries: Dict[Tuple[str, str], int] = {}       # (host, reason)
+            self._cache: Dict[Tuple[str, str], int] = {}         # (cache, "hit"/"miss")
+            self.started = time.time()
+
+    # ------------------------------------------------------------------ record
+
+    def observe(self, stage: str, seconds: float, **labels):
+        """Record one duration for a stage"""
+        key = (stage, _labels(labels))
+        with self._lock:
+            entry = self._stages.get(key)
+            if entry is None:
+                self._stages[key] = [1, seconds, seconds]
+            else:
+                entry[0] += 1
+                entry[1] += seconds
+                if seconds > entry[2]:
+                    entry[2] = seconds
+
+    @contextmanager
+    def timer(self, stage: str, **labels) -> Iterator[None]:
+        """Time the enclosed block as one observation of `stage`"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start, **labels)
+
+    def record_request(self, host: str, status: int):
+        with self._lock:
+            key = (host, str(status))
+            self._requests[key] = self._requests.get(key, 0) + 1
+
+    def add_bytes(self, host: str, count: int):
+        with self._lock:
+            self._bytes[host] = self._bytes.get(host, 0) + count
+
+    def record_error(self, host: str, error: str):
+        with self._lock:
+            key = (host, error)
+            self._errors[key] = self._errors.get(key, 0) + 1
+
+    def record_retry(self, host: str, reason: str):
+        with self._lock:
+            key = (host, reason)
+            self._retries[key] = self._retries.get(key, 0) + 1
+
+    def record_cache(self, cache: str, hit: bool):
+        with self._lock:
+            key = (cache, "hit" if hit else "miss")
+            self._cache[key] = self._cache.get(key, 0) + 1
+
+    # ------------------------------------------------------------------ export
+
+    def snapshot(self) -> Dict:
+        """Everything recorded so far as plain JSON-serializable data"""
+        with self._lock:
+            stages = [
+                {
+                    "stage": stage,
+                    "labels": dict(labels),
+                    "count": count,
+                    "seconds": total,
+                    "mean_seconds": total / count,
+                    "max_seconds": maximum,
+                }
+                for (stage, labels), (count, total, maximum) in sorted(self._stages.items())
+            ]
+
+            caches = {}
+            for (cache, result), count in self._cache.items():
+                caches.setdefault(cache, {"hits": 0, "misses": 0})[result + "s"] = count
+            for counts in caches.values():
+                lookups = counts["hits"] + counts["misses"]
+                counts["hit_rate"] = counts["hits"] / lookups if lookups else 0.0
+
+            hosts = {}
+
+            def host_entry(host):
+                return hosts.setdefault(host, {"requests": {}, "bytes": 0, "errors": {}, "retries": {}})
+
+            for (host, status), count in self._requests.items():
+                host_entry(host)["requests"][status] = count
+            for host, count in self._bytes.items():
+                host_entry(host)["bytes"] = count
+            for (host, error), count in self._errors.items():
+                host_entry(host)["errors"][error] = count
+            for (host, reason), count in self._retries.items():
+                host_entry(host)["retries"][reason] = count
+
+            totals = {}
+            for (stage, _), (_, total, _) in self._stages.items():
+                totals[stage] = totals.get(stage, 0.0) + total
+
+            return {
+                "started": self.started,
+                "generated": time.time(),
+                "stage_totals_seconds": dict(sorted(totals.items(), key=lambda item: -item[1])),
+                "stages": stages,
+                "caches": caches,
+                "hosts": dict(sorted(hosts.items())),
+            }
+
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition format (e.g. for the node_exporter textfile collector)"""
+        p = METRIC_PREFIX
+        lines = []
+
+        with self._lock:
+            lines += [
+                f"# HELP {p}_stage_seconds Time spent per fetch stage",
+                f"# TYPE {p}_stage_seconds summary",
+            ]
+            for (stage, labels), (count, total, _) in sorted(self._stages.items()):
+                label_text = _format_labels((("stage", stage),) + labels)
+                lines.append(f"{p}_stage_seconds_count{label_text} {count}")
+                lines.append(f"{p}_stage_seconds_sum{label_text} {total:.6f}")
+
+            lines += [
+                f"# HELP {p}_stage_max_seconds Slowest single observation per fetch stage",
+                f"# TYPE {p}_stage_max_seconds gauge",
+            ]
+            for (stage, labels), (_, _, maximum) in sorted(self._stages.items()):
+                lines.append(f"{p}_stage_max_seconds{_format_labels((('stage', stage),) + labels)} {maximum:.6f}")
+
+            for name, help_text, label_names, values in (
+                ("requests_total", "HTTP responses by host and status", ("host", "status"), self._requests),
+                ("errors_total", "Failed requests by host and error", ("host", "error"), self._errors),
+                ("retries_total", "Retried requests by host and reason", ("host", "reason"), self._retries),
+                ("cache_lookups_total", "Cache lookups by cache and result", ("cache", "result"), self._cache),
+            ):
+                lines += [f"# HELP {p}_{name} {help_text}", f"# TYPE {p}_{name} counter"]
+                for key, count in sorted(values.items()):
+                    lines.append(f"{p}_{name}{_format_labels(tuple(zip(label_names, key)))} {count}")
+
+            lines += [f"# HELP {p}_bytes_total Response body bytes downloaded", f"# TYPE {p}_bytes_total counter"]
+            for host, count in sorted(self._bytes.items()):
+                lines.append(f"{p}_bytes_total{_format_labels((('host', host),))} {count}")
+
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str):
+        """Write a JSON snapshot (*.json) or Prometheus text file, atomically"""
+        if path.endswith(".json"):
+            payload = json.dumps(self.snapshot(), indent=2)
+        else:
+            payload = self.to_prometheus()
+
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+_metrics: Optional[Metrics] = None
+_metrics_lock = threading.Lock()
+
+
+def get_metrics() -> Metrics:
+    """Return the process-wide metrics collector"""
+    global _metrics
+
+    if _metrics is None:
+        with _metrics_lock:
+            if _metrics is None:
+                _metrics = Metrics()
+
+                path = os.getenv("NEWS_METRICS_PATH")
+                if path:
+                    atexit.register(_metrics.write, path)
+    return _metrics
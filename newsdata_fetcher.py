@@ -15,30 +15,53 @@ Multiple requests increase your article count linearly (1 credit per request).
 
 import os
 import json
+import time
+import itertools
 import requests
+import weakref
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict
 from dotenv import load_dotenv
-import time
+from http_session import http_get, retry_wait
+from rate_limiter import NEWSDATA_RATE_LIMITER
+from credit_ledger import get_credit_ledger
+from response_cache import get_response_cache
+from article_store import ArticleStore
+from metrics import get_metrics
 
 # Load environment variables
 load_dotenv()
 
+PAGE_RETRIES = 3         # Extra attempts for a page that failed with a retryable error
+PAGE_RETRY_DELAY = 2.0   # Seconds before the first page retry, doubled for each further one
+
 class NewsDataFetcher:
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, store: Optional[ArticleStore] = None):
         """
         Initialize NewsData API client
 
         Args:
             api_key: NewsData API key (uses NEWSDATA_API_KEY from .env if not provided)
+            store: Optional ArticleStore that fetched pages are appended to as they arrive
         """
         self.api_key = api_key or os.getenv("NEWSDATA_API_KEY")
         if not self.api_key:
             raise ValueError("NewsData API key not found. Set NEWSDATA_API_KEY in .env")
 
         self.base_url = "https://newsdata.io/api/1"
-        self.credits_used = 0
-        self.credits_limit = 200
+        self.ledger = get_credit_ledger()  # Daily quota shared by all instances and processes
+        self.response_cache = get_response_cache()  # Repeats within a few minutes cost nothing
+        self.rate_limiter = NEWSDATA_RATE_LIMITER  # Shared 10/sec + 30/15min windows
+        self.store = store
+
+    @property
+    def credits_used(self) -> int:
+        """Credits spent today by every fetcher sharing the credit ledger"""
+        return self.ledger.used()
+
+    @property
+    def credits_limit(self) -> int:
+        return self.ledger.limit
 
     def fetch_latest_news(
         self,
@@ -48,7 +71,8 @@ class NewsDataFetcher:
         language: str = "en",
         limit_results: int = 10,
         full_content: bool = False,
-        timeout: int = 10
+        timeout: int = 10,
+        page: Optional[str] = None
     ) -> Dict:
         """
         Fetch latest news from NewsData API
@@ -61,6 +85,7 @@ class NewsDataFetcher:
             limit_results: Max articles to fetch (1-10, free tier max)
             full_content: Include full article text (True/False) - requires paid plan
             timeout: Request timeout in seconds
+            page: Pagination cursor (the 'nextPage' value of a previous response)
 
         Returns:
             dict with articles and metadata
@@ -70,6 +95,77 @@ class NewsDataFetcher:
         The 'description' field contains the article summary on free tier.
         """
 
+        params = self._build_params(query, category, country, language, limit_results, full_content, page)
+
+        cached = self.response_cache.get("latest", params)
+        if cached is not None:
+            return cached
+
+        # Reserve the credit up front so parallel workers can't overshoot the quota
+        reservation = self.ledger.reserve()
+        if reservation is None:
+            return {"status": "error", "message": f"Daily credit limit reached ({self.credits_limit})"}
+
+        try:
+            # Every attempt, retries included, takes a slot in the API rate windows
+            # (blocks only when one of them is full)
+            response = http_get(
+                f"{self.base_url}/latest",
+                params=params,
+                timeout=timeout,
+                before_attempt=self.rate_limiter.acquire
+            )
+            response.raise_for_status()
+
+            with get_metrics().timer("parse", source="newsdata"):
+                data = response.json()
+
+            # Track credit usage
+            if data.get("status") == "success":
+                self.ledger.commit(reservation)
+                reservation = None
+                self.response_cache.put("latest", params, data)
+                print(f"✓ Request successful | Credits used: {self.credits_used}/{self.credits_limit}")
+
+            return data
+
+        except requests.exceptions.RequestException as e:
+            print(f"✗ API Error: {e}")
+            return self._error_result(e)
+
+        finally:
+            self.ledger.release(reservation)  # Not charged
+
+    @staticmethod
+    def _error_result(error: requests.exceptions.RequestException) -> Dict:
+        """
+        Error result for a failed request
+
+        "retry_after" holds the seconds to wait before asking again (0 if the
+        server didn't say), or None if asking again is pointless.
+        """
+        return {"status": "error", "message": str(error), "retry_after": retry_wait(error)}
+
+    @staticmethod
+    def _page_retry_delay(result: Dict, attempt: int) -> Optional[float]:
+        """Seconds to wait before requesting a failed page again, or None to give up"""
+        wait = result.get("retry_after")
+        if result.get("status") == "success" or wait is None or attempt >= PAGE_RETRIES:
+            return None
+        return max(wait, PAGE_RETRY_DELAY * 2 ** attempt)
+
+    def _build_params(
+        self,
+        query: Optional[str],
+        category: Optional[str],
+        country: Optional[str],
+        language: str,
+        limit_results: int,
+        full_content: bool,
+        page: Optional[str]
+    ) -> Dict:
+        """Build the /latest query parameters"""
+
         params = {
             "apikey": self.api_key,
             "language": language,
@@ -83,32 +179,15 @@ class NewsDataFetcher:
             params["country"] = country
         if limit_results:
             params["size"] = min(limit_results, 10)  # Max 10 per request
+        if page:
+            params["page"] = page
 
         # Note: full_content parameter requires paid plan
         # Free tier will return "ONLY AVAILABLE IN PAID PLANS" regardless
         if full_content:
             params["full_content"] = 1
 
-        try:
-            response = requests.get(
-                f"{self.base_url}/latest",
-                params=params,
-                timeout=timeout
-            )
-            response.raise_for_status()
-
-            data = response.json()
-
-            # Track credit usage
-            if data.get("status") == "success":
-                self.credits_used += 1
-                print(f"✓ Request successful | Credits used: {self.credits_used}/{self.credits_limit}")
-
-            return data
-
-        except requests.exceptions.RequestException as e:
-            print(f"✗ API Error: {e}")
-            return {"status": "error", "message": str(e)}
+        return params
 
     def fetch_news_paginated(
         self,
@@ -121,6 +200,11 @@ class NewsDataFetcher:
         """
         Fetch multiple pages of news (makes multiple requests)
 
+        Each request passes the 'nextPage' cursor from the previous response,
+        so every credit spent returns a new page of results. A page that fails
+        with a network error, 429 or 5xx is requested again with the same
+        cursor (up to PAGE_RETRIES times, honoring Retry-After) before giving up.
+
         Args:
             query: Search keyword
             category: News category
@@ -137,27 +221,42 @@ class NewsDataFetcher:
 
         print(f"\n📰 Fetching ~{num_articles} articles ({pages_needed} requests)...")
 
+        next_page = None  # Cursor returned by the API as 'nextPage'
+
         for page in range(pages_needed):
-            if self.credits_used >= self.credits_limit:
+            if self.ledger.remaining() <= 0:
                 print(f"⚠️  Daily credit limit reached ({self.credits_limit})")
                 break
 
-            result = self.fetch_latest_news(
-                query=query,
-                category=category,
-                country=country,
-                limit_results=10,
-                full_content=full_content
-            )
+            # A failed page is asked for again with the same cursor, a few times
+            for attempt in itertools.count():
+                result = self.fetch_latest_news(
+                    query=query,
+                    category=category,
+                    country=country,
+                    limit_results=10,
+                    page=next_page,
+                    full_content=full_content
+                )
+
+                delay = self._page_retry_delay(result, attempt)
+                if delay is None:
+                    break
+                print(f"  → Page {page + 1}: Error - {result.get('message')} (retrying in {delay:.0f}s)")
+                time.sleep(delay)
 
             if result.get("status") == "success":
                 page_articles = result.get("results", [])
                 articles.extend(page_articles)
+                if self.store:
+                    self.store.append_many(page_articles)
                 print(f"  → Page {page + 1}: Got {len(page_articles)} articles")
 
-                # Respect rate limits: 10 credits per second
-                if page < pages_needed - 1:
-                    time.sleep(1)  # Be safe, wait 1 second between requests
+                # Thread the cursor into the next request; no cursor means no more results
+                next_page = result.get("nextPage")
+                if not next_page:
+                    print("  → No more pages available")
+                    break
             else:
                 print(f"  → Page {page + 1}: Error - {result.get('message')}")
                 break
@@ -166,7 +265,7 @@ class NewsDataFetcher:
 
     def save_articles_to_json(self, articles: List[Dict], filename: str = "articles.json"):
         """Save articles to JSON file"""
-        with open(filename, "w", encoding="utf-8") as f:
+        with get_metrics().timer("save", target="json"), open(filename, "w", encoding="utf-8") as f:
             json.dump(articles, f, indent=2, ensure_ascii=False)
         print(f"✓ Saved {len(articles)} articles to {filename}")
 
@@ -184,6 +283,193 @@ class NewsDataFetcher:
             print(f"   Description: {article.get('description', 'N/A')[:100]}...")
 
 
+class AsyncNewsDataFetcher(NewsDataFetcher):
+    """
+    asyncio variant of NewsDataFetcher for fanning out many queries at once
+
+    Same methods as NewsDataFetcher, but awaitable. Requests run on worker
+    threads through the shared pooled session, at most `max_concurrency` at a
+    time, and wait on the shared NewsData rate windows without blocking the
+    event loop. Credits are reserved in the shared credit ledger before each
+    request, so concurrent queries never overrun credits_limit.
+
+    Usage:
+        fetcher = AsyncNewsDataFetcher(max_concurrency=10)
+        results = asyncio.run(fetcher.fetch_many([
+            {"query": "ai", "category": "technology", "country": "us"},
+            {"query": "climate", "category": "science"},
+        ]))
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_concurrency: int = 10,
+        store: Optional[ArticleStore] = None
+    ):
+        """
+        Args:
+            api_key: NewsData API key (uses NEWSDATA_API_KEY from .env if not provided)
+            max_concurrency: Requests in flight at the same time
+            store: Optional ArticleStore that fetched pages are appended to as they arrive
+        """
+        super().__init__(api_key, store=store)
+        self.max_concurrency = max_concurrency
+        # One semaphore per event loop, so the fetcher works across asyncio.run() calls
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _semaphore(self) -> "asyncio.Semaphore":
+        """Concurrency limit for the running event loop"""
+        import asyncio  # Already loaded by the running event loop; keeps sync imports light
+
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def fetch_latest_news(
+        self,
+        query: Optional[str] = None,
+        category: Optional[str] = None,
+        country: Optional[str] = None,
+        language: str = "en",
+        limit_results: int = 10,
+        full_content: bool = False,
+        timeout: int = 10,
+        page: Optional[str] = None
+    ) -> Dict:
+        """Awaitable NewsDataFetcher.fetch_latest_news (same arguments and result)"""
+        import asyncio
+
+        params = self._build_params(query, category, country, language, limit_results, full_content, page)
+
+        cached = self.response_cache.get("latest", params)
+        if cached is not None:
+            return cached
+
+        async with self._semaphore():
+            # Reserve the credit up front so parallel requests can't overshoot the limit.
+            # Ledger calls are SQLite transactions, so they run off the event loop.
+            reservation = await asyncio.to_thread(self.ledger.reserve)
+            if reservation is None:
+                return {"status": "error", "message": f"Daily credit limit reached ({self.credits_limit})"}
+
+            # The first attempt's rate slot is awaited here; retries inside
+            # http_get take theirs on the worker thread
+            attempts = itertools.count()
+
+            def before_attempt():
+                if next(attempts):
+                    self.rate_limiter.acquire()
+
+            try:
+                await self.rate_limiter.acquire_async()
+
+                response = await asyncio.to_thread(
+                    http_get,
+                    f"{self.base_url}/latest",
+                    params=params,
+                    timeout=timeout,
+                    before_attempt=before_attempt
+                )
+                response.raise_for_status()
+
+                with get_metrics().timer("parse", source="newsdata"):
+                    data = response.json()
+
+                if data.get("status") == "success":
+                    await asyncio.to_thread(self.ledger.commit, reservation)
+                    reservation = None
+                    self.response_cache.put("latest", params, data)
+                    used = await asyncio.to_thread(self.ledger.used)
+                    print(f"✓ Request successful | Credits used: {used}/{self.credits_limit}")
+
+                return data
+
+            except requests.exceptions.RequestException as e:
+                print(f"✗ API Error: {e}")
+                return self._error_result(e)
+
+            finally:
+                if reservation is not None:
+                    await asyncio.to_thread(self.ledger.release, reservation)  # Not charged
+
+    async def fetch_news_paginated(
+        self,
+        query: Optional[str] = None,
+        category: Optional[str] = None,
+        country: Optional[str] = None,
+        num_articles: int = 50,
+        full_content: bool = False
+    ) -> List[Dict]:
+        """
+        Awaitable NewsDataFetcher.fetch_news_paginated
+
+        Pages of one query follow the 'nextPage' cursor and are therefore
+        sequential; run several queries concurrently with fetch_many().
+        """
+        import asyncio
+
+        articles = []
+        pages_needed = (num_articles + 9) // 10
+        next_page = None
+
+        for page in range(pages_needed):
+            for attempt in itertools.count():
+                result = await self.fetch_latest_news(
+                    query=query,
+                    category=category,
+                    country=country,
+                    limit_results=10,
+                    full_content=full_content,
+                    page=next_page
+                )
+
+                delay = self._page_retry_delay(result, attempt)
+                if delay is None:
+                    break
+                print(f"  → {query or category or country} page {page + 1}: Error - "
+                      f"{result.get('message')} (retrying in {delay:.0f}s)")
+                await asyncio.sleep(delay)
+
+            if result.get("status") != "success":
+                print(f"  → {query or category or country} page {page + 1}: Error - {result.get('message')}")
+                break
+
+            page_articles = result.get("results", [])
+            articles.extend(page_articles)
+            if self.store:
+                self.store.append_many(page_articles)
+
+            next_page = result.get("nextPage")
+            if not next_page:
+                break
+
+        return articles[:num_articles]
+
+    async def fetch_many(self, queries: List[Dict], num_articles: int = 10) -> List[List[Dict]]:
+        """
+        Run many queries concurrently
+
+        Args:
+            queries: List of keyword dicts for fetch_news_paginated
+                     (query / category / country / full_content)
+            num_articles: Articles to collect per query
+
+        Returns:
+            One list of articles per query, in the same order as `queries`
+        """
+        import asyncio
+
+        return await asyncio.gather(*(
+            self.fetch_news_paginated(num_articles=num_articles, **spec)
+            for spec in queries
+        ))
+
+
 # ============================================================================
 # EXAMPLE USAGE
 # ============================================================================
@@ -191,8 +477,11 @@ class NewsDataFetcher:
 def main():
     print("🚀 NewsData.io API Client\n")
 
-    # Initialize client
-    fetcher = NewsDataFetcher()
+    # Initialize client (every fetched page is also appended to article_store/)
+    fetcher = NewsDataFetcher(store=ArticleStore(name="newsdata"))
+    # The ledger counts the whole day across processes; this run's spend is the difference
+    credits_before = fetcher.credits_used
+    articles_fetched = 0
 
     # Example 1: Single request (1 credit = 10 articles)
     print("\n" + "="*100)
@@ -208,6 +497,7 @@ def main():
 
     if result.get("status") == "success":
         articles = result.get("results", [])
+        articles_fetched += len(articles)
         print(f"Got {len(articles)} articles with 1 credit")
         fetcher.print_articles_summary(articles, max_display=2)
 
@@ -222,6 +512,7 @@ def main():
         num_articles=30,
         full_content=False
     )
+    articles_fetched += len(multi_articles)
     fetcher.print_articles_summary(multi_articles, max_display=3)
 
     # Example 3: Save to file
@@ -232,9 +523,13 @@ def main():
     print("\n" + "="*100)
     print("CREDIT USAGE SUMMARY")
     print("="*100)
-    print(f"Credits Used: {fetcher.credits_used}/{fetcher.credits_limit}")
-    print(f"Articles Retrieved: {len(multi_articles)}")
-    print(f"Efficiency: {len(multi_articles) / fetcher.credits_used:.1f} articles/credit")
+    credits_spent = fetcher.credits_used - credits_before
+    print(f"Credits Used: {credits_spent} this run, {fetcher.credits_used}/{fetcher.credits_limit} today")
+    print(f"Articles Retrieved: {articles_fetched}")
+    if credits_spent > 0:
+        print(f"Efficiency: {articles_fetched / credits_spent:.1f} articles/credit")
+    else:
+        print("Efficiency: no credits spent (every response came from the cache)")
     print(f"Daily Capacity: {(fetcher.credits_limit - fetcher.credits_used) * 10} articles remaining")
 
 
@@ -25,25 +25,46 @@ What IS available on free tier:
 
 import os
 import json
+import time
+import itertools
 import requests
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict
 from dotenv import load_dotenv
-import time
+from http_session import http_get, retry_wait
+from rate_limiter import NEWSDATA_RATE_LIMITER
+from credit_ledger import get_credit_ledger
+from response_cache import get_response_cache
+from article_store import ArticleStore
+from metrics import get_metrics
 
 # Load environment variables
 load_dotenv()
 
+PAGE_RETRIES = 3         # Extra attempts for a page that failed with a retryable error
+PAGE_RETRY_DELAY = 2.0   # Seconds before the first page retry, doubled for each further one
+
 class NewsDataFetcher:
-    def __init__(self, api_key: Optional[str] = None):
-        """Initialize NewsData API client"""
+    def __init__(self, api_key: Optional[str] = None, store: Optional[ArticleStore] = None):
+        """Initialize NewsData API client (fetched pages are appended to `store` if given)"""
         self.api_key = api_key or os.getenv("NEWSDATA_API_KEY")
         if not self.api_key:
             raise ValueError("NewsData API key not found. Set NEWSDATA_API_KEY in .env")
 
         self.base_url = "https://newsdata.io/api/1"
-        self.credits_used = 0
-        self.credits_limit = 200
+        self.ledger = get_credit_ledger()
+        self.response_cache = get_response_cache()
+        self.rate_limiter = NEWSDATA_RATE_LIMITER
+        self.store = store
+
+    @property
+    def credits_used(self) -> int:
+        """Credits spent today by every fetcher sharing the credit ledger"""
+        return self.ledger.used()
+
+    @property
+    def credits_limit(self) -> int:
+        return self.ledger.limit
 
     def fetch_latest_news(
         self,
@@ -52,7 +73,8 @@ class NewsDataFetcher:
         country: Optional[str] = None,
         language: str = "en",
         limit_results: int = 10,
-        timeout: int = 10
+        timeout: int = 10,
+        page: Optional[str] = None
     ) -> Dict:
         """Fetch latest news from NewsData API"""
 
@@ -69,26 +91,45 @@ class NewsDataFetcher:
             params["country"] = country
         if limit_results:
             params["size"] = min(limit_results, 10)  # Max 10 per request
+        if page:
+            params["page"] = page
+
+        cached = self.response_cache.get("latest", params)
+        if cached is not None:
+            return cached
+
+        reservation = self.ledger.reserve()
+        if reservation is None:
+            return {"status": "error", "message": f"Daily credit limit reached ({self.credits_limit})"}
 
         try:
-            response = requests.get(
+            # Every attempt, retries included, takes a rate window slot
+            response = http_get(
                 f"{self.base_url}/latest",
                 params=params,
-                timeout=timeout
+                timeout=timeout,
+                before_attempt=self.rate_limiter.acquire
             )
             response.raise_for_status()
 
-            data = response.json()
+            with get_metrics().timer("parse", source="newsdata"):
+                data = response.json()
 
             # Track credit usage
             if data.get("status") == "success":
-                self.credits_used += 1
+                self.ledger.commit(reservation)
+                reservation = None
+                self.response_cache.put("latest", params, data)
 
             return data
 
         except requests.exceptions.RequestException as e:
             print(f"✗ API Error: {e}")
-            return {"status": "error", "message": str(e)}
+            # retry_after: seconds to wait before asking again, None if pointless
+            return {"status": "error", "message": str(e), "retry_after": retry_wait(e)}
+
+        finally:
+            self.ledger.release(reservation)
 
     def fetch_news_paginated(
         self,
@@ -104,25 +145,41 @@ class NewsDataFetcher:
 
         print(f"\n📰 Fetching ~{num_articles} articles ({pages_needed} requests)...")
 
+        next_page = None
+
         for page in range(pages_needed):
-            if self.credits_used >= self.credits_limit:
+            if self.ledger.remaining() <= 0:
                 print(f"⚠️  Daily credit limit reached ({self.credits_limit})")
                 break
 
-            result = self.fetch_latest_news(
-                query=query,
-                category=category,
-                country=country,
-                limit_results=10,
-            )
+            # A failed page is asked for again with the same cursor, a few times
+            for attempt in itertools.count():
+                result = self.fetch_latest_news(
+                    query=query,
+                    category=category,
+                    country=country,
+                    limit_results=10,
+                    page=next_page,
+                )
+
+                wait = result.get("retry_after")
+                if result.get("status") == "success" or wait is None or attempt >= PAGE_RETRIES:
+                    break
+                delay = max(wait, PAGE_RETRY_DELAY * 2 ** attempt)
+                print(f"  ✗ Page {page + 1}: Error - {result.get('message')} (retrying in {delay:.0f}s)")
+                time.sleep(delay)
 
             if result.get("status") == "success":
                 page_articles = result.get("results", [])
                 articles.extend(page_articles)
+                if self.store:
+                    self.store.append_many(page_articles)
                 print(f"  ✓ Page {page + 1}: Got {len(page_articles)} articles (Credit {self.credits_used}/{self.credits_limit})")
 
-                if page < pages_needed - 1:
-                    time.sleep(1)
+                next_page = result.get("nextPage")
+                if not next_page:
+                    print("  ✓ No more pages available")
+                    break
             else:
                 print(f"  ✗ Page {page + 1}: Error - {result.get('message')}")
                 break
@@ -131,7 +188,7 @@ class NewsDataFetcher:
 
     def save_articles_to_json(self, articles: List[Dict], filename: str = "articles.json"):
         """Save articles to JSON file"""
-        with open(filename, "w", encoding="utf-8") as f:
+        with get_metrics().timer("save", target="json"), open(filename, "w", encoding="utf-8") as f:
             json.dump(articles, f, indent=2, ensure_ascii=False)
         print(f"✓ Saved {len(articles)} articles to {filename}")
 
@@ -179,7 +236,7 @@ def main():
     print("    What you CAN access: title, description, link, source, date, image\n")
 
     # Initialize client
-    fetcher = NewsDataFetcher()
+    fetcher = NewsDataFetcher(store=ArticleStore(name="newsdata_full"))
 
     # Fetch articles
     print("\n" + "="*100)
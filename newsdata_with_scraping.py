@@ -16,24 +16,53 @@ This gives you best of both worlds:
 import os
 import json
 import requests
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 from dotenv import load_dotenv
-import time
+from http_session import http_get, stream_html, DEFAULT_MAX_HTML_BYTES
+from content_cache import get_content_cache
+from html_extractor import extract_article_text
+from dedup_index import DedupIndex
+from article_store import ArticleStore
+from metrics import get_metrics
+from rate_limiter import RateLimiter, DomainThrottle, NEWSDATA_RATE_LIMITER
+from credit_ledger import get_credit_ledger
+from response_cache import get_response_cache
 from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 
 # Load environment variables
 load_dotenv()
 
 class NewsDataWithContent:
-    def __init__(self, api_key: Optional[str] = None):
-        """Initialize with NewsData API key"""
+    def __init__(self, api_key: Optional[str] = None, store: Optional[ArticleStore] = None):
+        """
+        Initialize with NewsData API key
+
+        Args:
+            api_key: NewsData API key (uses NEWSDATA_API_KEY from .env if not provided)
+            store: Optional ArticleStore that enriched articles are appended to as they finish
+        """
         self.api_key = api_key or os.getenv("NEWSDATA_API_KEY")
         if not self.api_key:
             raise ValueError("NewsData API key not found. Set NEWSDATA_API_KEY in .env")
 
         self.newsdata_url = "https://newsdata.io/api/1"
-        self.credits_used = 0
-        self.credits_limit = 200
+        self.ledger = get_credit_ledger()  # Daily quota shared with NewsDataFetcher
+        self.response_cache = get_response_cache()  # Also shared with NewsDataFetcher
+        self.rate_limiter = NEWSDATA_RATE_LIMITER  # Shared 10/sec + 30/15min windows
+        self.content_cache = get_content_cache()
+        self.dedup_index = DedupIndex()
+        self.store = store
+
+    @property
+    def credits_used(self) -> int:
+        """Credits spent today by every fetcher sharing the credit ledger"""
+        return self.ledger.used()
+
+    @property
+    def credits_limit(self) -> int:
+        return self.ledger.limit
 
     def fetch_from_newsdata(
         self,
@@ -58,17 +87,32 @@ class NewsDataWithContent:
         if limit_results:
             params["size"] = min(limit_results, 10)
 
+        cached = self.response_cache.get("latest", params)
+        if cached is not None:
+            return cached.get("results", [])
+
+        reservation = self.ledger.reserve()
+        if reservation is None:
+            print(f"⚠️  Daily credit limit reached ({self.credits_limit})")
+            return []
+
         try:
-            response = requests.get(
+            # Every attempt, retries included, takes a slot in the API rate windows
+            # (blocks only when one of them is full)
+            response = http_get(
                 f"{self.newsdata_url}/latest",
                 params=params,
-                timeout=10
+                timeout=10,
+                before_attempt=self.rate_limiter.acquire
             )
             response.raise_for_status()
 
-            data = response.json()
+            with get_metrics().timer("parse", source="newsdata"):
+                data = response.json()
             if data.get("status") == "success":
-                self.credits_used += 1
+                self.ledger.commit(reservation)
+                reservation = None
+                self.response_cache.put("latest", params, data)
                 return data.get("results", [])
             else:
                 print(f"API Error: {data.get('message')}")
@@ -78,50 +122,44 @@ class NewsDataWithContent:
             print(f"Request Error: {e}")
             return []
 
-    def scrape_article_content(self, url: str, timeout: int = 5) -> Optional[str]:
+        finally:
+            self.ledger.release(reservation)
+
+    def scrape_article_content(
+        self,
+        url: str,
+        timeout: int = 5,
+        max_bytes: int = DEFAULT_MAX_HTML_BYTES
+    ) -> Optional[str]:
         """
         Attempt to scrape full article content from URL
 
         Simple extraction: Gets text from <article>, <main>, or <body> tags
+        (single streaming pass, see html_extractor.py)
         For production, use: newspaper3k, trafilatura, or Firecrawl
+
+        Non-HTML responses are skipped and at most `max_bytes` of the page are
+        downloaded. Results are cached by normalized URL, so re-runs skip links
+        already scraped.
         """
+        cached = self.content_cache.get(url, namespace="newsdata")
+        if cached is not None:
+            return cached
+
         try:
             # Set user agent to avoid blocking
             headers = {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
             }
 
-            response = requests.get(url, timeout=timeout, headers=headers)
-            response.raise_for_status()
-
-            # Simple HTML parsing
-            html = response.text
+            # Stream the page: the extractor stops reading once the first
+            # <article> is complete or 2000 characters have been collected
+            with closing(stream_html(url, timeout=timeout, max_bytes=max_bytes, headers=headers)) as chunks:
+                content = extract_article_text(chunks, max_chars=2000)
 
-            # Try to extract content from common article containers
-            import re
-
-            # Try <article> tag first
-            article_match = re.search(r'<article[^>]*>(.*?)</article>', html, re.DOTALL)
-            if article_match:
-                content = article_match.group(1)
-            else:
-                # Try <main> tag
-                main_match = re.search(r'<main[^>]*>(.*?)</main>', html, re.DOTALL)
-                if main_match:
-                    content = main_match.group(1)
-                else:
-                    # Fallback to body
-                    body_match = re.search(r'<body[^>]*>(.*?)</body>', html, re.DOTALL)
-                    content = body_match.group(1) if body_match else html
-
-            # Remove HTML tags
-            content = re.sub(r'<[^>]+>', '\n', content)
-            # Remove extra whitespace
-            content = re.sub(r'\n\s*\n', '\n', content)
-            # Clean up
-            content = content.strip()
-
-            return content[:2000] if content else None  # Return first 2000 chars
+            if content:
+                self.content_cache.put(url, content, namespace="newsdata")
+            return content
 
         except Exception as e:
             print(f"    ⚠️  Could not scrape {urlparse(url).netloc}: {type(e).__name__}")
@@ -131,7 +169,9 @@ class NewsDataWithContent:
         self,
         articles: List[Dict],
         scrape: bool = True,
-        scrape_delay: float = 1.0
+        scrape_delay: float = 1.0,
+        max_workers: int = 1,
+        dedup: bool = False
     ) -> List[Dict]:
         """
         Enrich articles with full content
@@ -139,39 +179,92 @@ class NewsDataWithContent:
         Args:
             articles: Articles from NewsData.io
             scrape: Whether to attempt scraping
-            scrape_delay: Delay between scrape requests (be respectful!)
+            scrape_delay: Minimum interval between scrape requests (be respectful!)
+            max_workers: Articles scraped concurrently. 1 = one after another with
+                         scrape_delay between any two requests; >1 = thread pool
+                         with scrape_delay applied per domain instead
+            dedup: Drop articles already enriched by this instance (same canonical
+                   link or near-identical title/description) before scraping
+
+        Returns:
+            Copies of the articles, in the same order, with full_content and
+            content_available set (minus duplicates when dedup=True)
         """
 
-        enriched = []
+        if dedup:
+            articles = self.dedup_index.filter(articles)
+
+        if not scrape:
+            copies = [article.copy() for article in articles]
+            if self.store:
+                self.store.append_many(copies)
+            return copies
+
+        total = len(articles)
+
+        if max_workers <= 1:
+            scrape_limiter = RateLimiter([(1, scrape_delay)]) if scrape_delay > 0 else None
+            enriched = []
+
+            for i, article in enumerate(articles, 1):
+                # Be respectful - only waits for whatever is left of the interval
+                if scrape_limiter and self._needs_download(article):
+                    scrape_limiter.acquire()
+                enriched.append(self._enrich_article(article, i, total))
+
+            return enriched
 
-        for i, article in enumerate(articles, 1):
-            enriched_article = article.copy()
+        # Concurrent mode: global cap = max_workers, politeness is per domain
+        throttle = DomainThrottle(scrape_delay)
 
-            if scrape and article.get("link"):
-                print(f"\n  Scraping {i}/{len(articles)}: {article.get('source_id')}")
+        def enrich(numbered: Tuple[int, Dict]) -> Dict:
+            i, article = numbered
+            if self._needs_download(article):
+                throttle.acquire(article["link"])
+            return self._enrich_article(article, i, total)
 
-                content = self.scrape_article_content(article.get("link"))
+        print(f"\n  Scraping {total} articles with {max_workers} workers "
+              f"({scrape_delay}s per domain)")
 
-                if content:
-                    enriched_article["full_content"] = content
-                    enriched_article["content_available"] = True
-                    print(f"    ✓ Got {len(content)} characters of content")
-                else:
-                    enriched_article["full_content"] = None
-                    enriched_article["content_available"] = False
-                    print(f"    ✗ Could not scrape content")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # map() yields results in input order
+            return list(executor.map(enrich, enumerate(articles, 1)))
 
-                # Be respectful - delay between requests
-                if i < len(articles):
-                    time.sleep(scrape_delay)
+    def _needs_download(self, article: Dict) -> bool:
+        """True if scraping this article will hit the network (not cached)"""
+        link = article.get("link")
+        return bool(link) and not self.content_cache.contains(link, namespace="newsdata")
+
+    def _enrich_article(self, article: Dict, number: int, total: int) -> Dict:
+        """Scrape one article and return an enriched copy"""
+        enriched_article = article.copy()
+
+        if not article.get("link"):
+            if self.store:
+                self.store.append(enriched_article)
+            return enriched_article
+
+        print(f"\n  Scraping {number}/{total}: {article.get('source_id')}")
+
+        content = self.scrape_article_content(article.get("link"))
+
+        if content:
+            enriched_article["full_content"] = content
+            enriched_article["content_available"] = True
+            print(f"    ✓ Got {len(content)} characters of content")
+        else:
+            enriched_article["full_content"] = None
+            enriched_article["content_available"] = False
+            print(f"    ✗ Could not scrape content")
 
-            enriched.append(enriched_article)
+        if self.store:
+            self.store.append(enriched_article)
 
-        return enriched
+        return enriched_article
 
     def save_enriched_articles(self, articles: List[Dict], filename: str = "articles_with_content.json"):
         """Save articles with full content"""
-        with open(filename, "w", encoding="utf-8") as f:
+        with get_metrics().timer("save", target="json"), open(filename, "w", encoding="utf-8") as f:
             json.dump(articles, f, indent=2, ensure_ascii=False)
         print(f"\n✓ Saved {len(articles)} enriched articles to {filename}")
 
@@ -203,7 +296,7 @@ def main():
     print("🚀 NewsData.io + Web Scraping Integration\n")
     print("Strategy: Discover with NewsData.io, Get full content via scraping\n")
 
-    fetcher = NewsDataWithContent()
+    fetcher = NewsDataWithContent(store=ArticleStore(name="articles_with_content"))
 
     # Step 1: Fetch from NewsData.io
     print("="*100)
@@ -217,7 +310,7 @@ def main():
     )
 
     print(f"\n✓ Got {len(articles)} articles from NewsData.io")
-    print(f"  Credits used: {fetcher.credits_used}/200")
+    print(f"  Credits used: {fetcher.credits_used}/{fetcher.credits_limit}")
 
     if not articles:
         print("No articles fetched")
@@ -231,7 +324,9 @@ def main():
     enriched_articles = fetcher.enrich_articles_with_content(
         articles,
         scrape=True,
-        scrape_delay=2.0  # 2 second delay between requests (be respectful!)
+        scrape_delay=2.0,  # 2 seconds between requests to the same site (be respectful!)
+        max_workers=8,     # Different publishers are scraped in parallel
+        dedup=True         # Don't scrape the same story twice
     )
 
     # Step 3: Display results
@@ -257,7 +352,7 @@ def main():
     print("="*100)
     print(f"Articles discovered:     {len(articles)}")
     print(f"Full content scraped:    {successful_scrapes}/{len(articles)}")
-    print(f"Credits used:            {fetcher.credits_used}/200")
+    print(f"Credits used:            {fetcher.credits_used}/{fetcher.credits_limit}")
     print(f"Efficiency:              10 articles per 1 credit (max)")
 
     print("\n" + "="*100)
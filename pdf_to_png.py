@@ -1,55 +1,285 @@
 #!/usr/bin/env python3
 """
 Convert PDF files to PNG images and organize them in subfolders.
+
+Pages are rendered in small page-range chunks on a process pool, so a whole
+pdfs/ tree uses every core, and each chunk is written straight to disk by
+pdftoppm - no page bitmaps are held in memory, however long the PDF.
+
+Conversion is incremental: a manifest (pdfs/.pdf_to_png_manifest.json)
+records each PDF's content hash, DPI and page count. Unchanged PDFs whose
+PNGs are all present are skipped, and only missing pages are re-rendered.
+Pass --force to re-render everything.
 """
 
+import hashlib
+import json
 import os
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from pdf2image import convert_from_path
+from pdf2image import convert_from_path, pdfinfo_from_path
+
+# Default pdfs/ tree next to this script (override on the command line)
+BASE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pdfs")
+
+DPI = 150
+CHUNK_PAGES = 4  # Pages rendered per task
+MANIFEST_NAME = ".pdf_to_png_manifest.json"
+
+
+def page_path(output_dir, pdf_name, page):
+    """Path of the PNG for one page (e.g. pngs/C2_page_7.png)"""
+    return os.path.join(output_dir, f"{pdf_name}_page_{page}.png")
 
-def pdf_to_png(pdf_path, output_dir):
+
+def page_count(pdf_path):
+    """Number of pages in a PDF"""
+    return int(pdfinfo_from_path(pdf_path)["Pages"])
+
+
+def render_pages(pdf_path, output_dir, first_page, last_page, dpi=DPI):
     """
-    Convert a PDF file to a series of PNG images.
+    Render a page range of a PDF to PNG files (runs in a worker process).
+
+    pdftoppm writes the pages into a temporary folder inside output_dir; they
+    are then renamed into place, so a PNG is either complete or missing.
 
     Args:
         pdf_path (str): Path to the PDF file
         output_dir (str): Directory to save PNG images
-    """
-    # Create output directory if it doesn't exist
-    os.makedirs(output_dir, exist_ok=True)
+        first_page (int): First page to render (1-based)
+        last_page (int): Last page to render (inclusive)
+        dpi (int): Render resolution
 
-    # Get the PDF filename without extension
+    Returns:
+        list: Paths of the saved PNGs, in page order
+    """
     pdf_name = Path(pdf_path).stem
+    saved = []
+
+    with tempfile.TemporaryDirectory(dir=output_dir, prefix=".render-") as tmp_dir:
+        rendered = convert_from_path(
+            pdf_path,
+            dpi=dpi,
+            first_page=first_page,
+            last_page=last_page,
+            output_folder=tmp_dir,
+            output_file="page",
+            fmt="png",
+            paths_only=True,
+        )
+
+        for page, tmp_path in enumerate(rendered, first_page):
+            output_path = page_path(output_dir, pdf_name, page)
+            os.replace(tmp_path, output_path)
+            saved.append(output_path)
+
+    return saved
+
+
+def page_chunks(pages, chunk_pages=CHUNK_PAGES):
+    """
+    Group page numbers into (first, last) ranges of at most chunk_pages
+
+    Only consecutive pages share a range, so gaps (pages already rendered)
+    are never re-rendered.
+    """
+    chunks = []
+    for page in sorted(pages):
+        if chunks and page == chunks[-1][1] + 1 and page - chunks[-1][0] < chunk_pages:
+            chunks[-1] = (chunks[-1][0], page)
+        else:
+            chunks.append((page, page))
+    return chunks
 
-    print(f"Converting {pdf_path}...")
 
+def file_sha256(path):
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_manifest(manifest_path):
+    """Manifest entries by PDF path (empty if missing or unreadable)"""
     try:
-        # Convert PDF to images
-        images = convert_from_path(pdf_path, dpi=150)
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
 
-        # Save each page as PNG
-        for i, image in enumerate(images, 1):
-            output_path = os.path.join(output_dir, f"{pdf_name}_page_{i}.png")
-            image.save(output_path, 'PNG')
-            print(f"  Saved: {output_path}")
 
-        print(f"Successfully converted {pdf_path} to {len(images)} PNG(s)\n")
+def save_manifest(manifest_path, manifest):
+    """Write the manifest atomically"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(manifest_path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, manifest_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
 
-    except Exception as e:
-        print(f"Error converting {pdf_path}: {e}\n")
 
-def main():
-    """Main function to process all PDFs in subfolders."""
-    # Base directory containing PDF subfolders
-    base_dir = "/Users/green/Desktop/Developer/goethe/pdfs"
+def plan_pages(pdf_path, output_dir, entry, dpi, force=False):
+    """
+    Work out which pages of a PDF need rendering.
 
-    if not os.path.exists(base_dir):
-        print(f"Error: Base directory {base_dir} does not exist")
-        sys.exit(1)
+    The content hash is only recomputed when the file's size or mtime differ
+    from the manifest, so an unchanged tree costs one stat() per PDF and one
+    directory listing per pngs/ folder.
+
+    Args:
+        pdf_path (str): Path to the PDF file
+        output_dir (str): Directory holding its PNGs
+        entry (dict): Manifest entry from the previous run (or None)
+        dpi (int): Render resolution
+        force (bool): Re-render every page
+
+    Returns:
+        tuple: (new manifest entry, list of page numbers to render)
+    """
+    stat = os.stat(pdf_path)
+    entry = dict(entry or {})
+
+    if entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+        sha256 = entry.get("sha256")
+    else:
+        sha256 = file_sha256(pdf_path)
+
+    changed = force or sha256 != entry.get("sha256") or dpi != entry.get("dpi") or not entry.get("pages")
+
+    if changed:
+        pages = page_count(pdf_path)
+        needed = list(range(1, pages + 1))
+    else:
+        pages = entry["pages"]
+        existing = set(os.listdir(output_dir))
+        pdf_name = Path(pdf_path).stem
+        needed = [
+            page for page in range(1, pages + 1)
+            if os.path.basename(page_path(output_dir, pdf_name, page)) not in existing
+        ]
+
+    entry.update(sha256=sha256, size=stat.st_size, mtime_ns=stat.st_mtime_ns, dpi=dpi, pages=pages)
+    return entry, needed
+
+
+def remove_stale_pages(output_dir, pdf_name, pages):
+    """Delete PNGs for pages beyond the end of a PDF that got shorter"""
+    prefix = f"{pdf_name}_page_"
+    for filename in os.listdir(output_dir):
+        if filename.startswith(prefix) and filename.endswith(".png"):
+            number = filename[len(prefix):-len(".png")]
+            if number.isdigit() and int(number) > pages:
+                os.remove(os.path.join(output_dir, filename))
 
-    # Iterate through each subfolder
-    for folder_name in os.listdir(base_dir):
+
+def convert_all(jobs, dpi=DPI, workers=None, chunk_pages=CHUNK_PAGES, manifest_path=None, force=False):
+    """
+    Rasterize many PDFs on one process pool, skipping work already done.
+
+    Args:
+        jobs (list): (pdf_path, output_dir) pairs
+        dpi (int): Render resolution
+        workers (int): Worker processes (default: one per core)
+        chunk_pages (int): Pages per task
+        manifest_path (str): Manifest file (None disables incremental mode)
+        force (bool): Re-render every page even if it looks up to date
+
+    Returns:
+        dict: pdf_path -> number of pages saved (missing if the PDF failed)
+    """
+    manifest = load_manifest(manifest_path) if manifest_path else {}
+    manifest_dir = os.path.dirname(os.path.abspath(manifest_path)) if manifest_path else ""
+
+    results = {}
+    failed = set()
+    entries = {}
+    futures = {}
+    executor = None
+
+    try:
+        for pdf_path, output_dir in jobs:
+            os.makedirs(output_dir, exist_ok=True)
+            key = os.path.relpath(os.path.abspath(pdf_path), manifest_dir) if manifest_path else pdf_path
+
+            try:
+                entry, needed = plan_pages(
+                    pdf_path, output_dir, manifest.get(key), dpi, force=force or not manifest_path
+                )
+            except Exception as e:
+                print(f"Error reading {pdf_path}: {e}\n")
+                continue
+
+            if not needed:
+                print(f"Up to date: {pdf_path} ({entry['pages']} pages)")
+                manifest[key] = entry
+                continue
+
+            print(f"Converting {pdf_path} ({len(needed)}/{entry['pages']} pages)...")
+            remove_stale_pages(output_dir, Path(pdf_path).stem, entry["pages"])
+            results[pdf_path] = 0
+            entries[pdf_path] = (key, entry)
+
+            # The pool is only started when there is something to render
+            if executor is None:
+                executor = ProcessPoolExecutor(max_workers=workers)
+
+            for first, last in page_chunks(needed, chunk_pages):
+                future = executor.submit(render_pages, pdf_path, output_dir, first, last, dpi)
+                futures[future] = pdf_path
+
+        for future in as_completed(futures):
+            pdf_path = futures[future]
+            try:
+                for output_path in future.result():
+                    print(f"  Saved: {output_path}")
+                    results[pdf_path] += 1
+            except Exception as e:
+                print(f"Error converting {pdf_path}: {e}\n")
+                failed.add(pdf_path)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    # A PDF with any failed chunk is incomplete, whatever its other chunks saved
+    results = {pdf_path: saved for pdf_path, saved in results.items() if pdf_path not in failed}
+
+    for pdf_path, saved in results.items():
+        print(f"Successfully converted {pdf_path} to {saved} PNG(s)")
+        # Only fully rendered PDFs are recorded; failures are retried next run
+        key, entry = entries[pdf_path]
+        manifest[key] = entry
+
+    if manifest_path:
+        save_manifest(manifest_path, manifest)
+
+    return results
+
+
+def pdf_to_png(pdf_path, output_dir, dpi=DPI, workers=None):
+    """
+    Convert a PDF file to a series of PNG images.
+
+    Args:
+        pdf_path (str): Path to the PDF file
+        output_dir (str): Directory to save PNG images
+        dpi (int): Render resolution
+        workers (int): Worker processes (default: one per core)
+    """
+    convert_all([(pdf_path, output_dir)], dpi=dpi, workers=workers)
+
+
+def find_pdfs(base_dir):
+    """(pdf_path, pngs_dir) for every PDF in the subfolders of base_dir"""
+    jobs = []
+
+    for folder_name in sorted(os.listdir(base_dir)):
         folder_path = os.path.join(base_dir, folder_name)
 
         # Skip if not a directory
@@ -64,11 +294,29 @@ def main():
             continue
 
         # Process each PDF (usually just one)
-        for pdf_file in pdf_files:
-            pdf_path = os.path.join(folder_path, pdf_file)
-            pngs_dir = os.path.join(folder_path, "pngs")
+        for pdf_file in sorted(pdf_files):
+            jobs.append((os.path.join(folder_path, pdf_file), os.path.join(folder_path, "pngs")))
+
+    return jobs
+
+
+def main():
+    """Main function to process all PDFs in subfolders."""
+    args = [arg for arg in sys.argv[1:] if arg != "--force"]
+    force = "--force" in sys.argv[1:]
+
+    # Base directory containing PDF subfolders
+    base_dir = args[0] if args else BASE_DIR
+
+    if not os.path.exists(base_dir):
+        print(f"Error: Base directory {base_dir} does not exist")
+        sys.exit(1)
 
-            pdf_to_png(pdf_path, pngs_dir)
+    convert_all(
+        find_pdfs(base_dir),
+        manifest_path=os.path.join(base_dir, MANIFEST_NAME),
+        force=force,
+    )
 
 if __name__ == "__main__":
     main()
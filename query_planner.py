@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+NewsData Query Coalescing
+=========================
+
+Every /latest request costs one credit, however narrow it is. Jobs that call
+fetch_latest_news once per keyword / category / country tuple spend a credit
+per tuple, even when one combined request could answer several of them:
+
+- keywords OR'ed into one `q`         ("ai", "climate" -> "ai OR climate")
+- categories comma-separated          ("business", "technology" -> "business,technology")
+- countries comma-separated           ("us", "gb" -> "us,gb")
+
+plan_queries() packs a batch of query specs into as few requests as the API
+limits allow (512 characters of `q`, 5 categories, 5 countries). It only
+merges specs that differ in a single dimension, so every combined request
+returns exactly the union of its members' results and nothing else.
+fetch_coalesced() runs the plan and splits the results back to each
+original spec on the client.
+
+A combined request still returns 10 articles per page, shared between its
+members, so `max_specs_per_request` bounds how many specs share a request.
+
+Splitting OR'ed keywords back is approximate. The API matches `q` against the
+full article text, but the client only sees title, description, keywords and
+whatever body text the response carries (`content` is "ONLY AVAILABLE IN PAID
+PLANS" on the free tier). An article that matched only in its hidden body
+text is therefore dropped, even though a separate request would have returned
+it. Callers that need every match pass merge_queries=False: categories and
+countries are still combined (always split back exactly), keywords are not.
+
+Usage:
+    from newsdata_fetcher import NewsDataFetcher
+    from query_planner import fetch_coalesced
+
+    results = fetch_coalesced(NewsDataFetcher(), [
+        {"query": "ai", "category": "technology", "country": "us"},
+        {"query": "robotics", "category": "technology", "country": "us"},
+        {"category": "business", "country": "gb"},
+        {"category": "science", "country": "gb"},
+    ])
+    # -> 2 requests (2 credits) instead of 4; results[i] belongs to spec i
+"""
+
+import re
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+MAX_QUERY_CHARS = 512   # Longest `q` the API accepts
+MAX_CATEGORIES = 5      # Categories per request
+MAX_COUNTRIES = 5       # Countries per request
+DEFAULT_MAX_SPECS = 5   # Specs sharing one request (they share its 10 results per page)
+
+# Query syntax we can't evaluate client-side; such queries are never merged
+_OPERATORS = re.compile(r'\b(AND|OR|NOT)\b|[()"]')
+_WORD = re.compile(r"\w+")
+
+# Article text searched when splitting OR'ed keywords back
+TEXT_FIELDS = ("title", "description", "content", "full_description", "full_content")
+PAID_PLAN_PREFIX = "ONLY AVAILABLE IN"  # Free-tier placeholder in `content`
+
+# Country codes -> the names NewsData returns in article["country"].
+# Countries not listed here are never combined, since results couldn't be split back.
+COUNTRY_NAMES = {
+    "at": "austria",
+    "au": "australia",
+    "be": "belgium",
+    "br": "brazil",
+    "ca": "canada",
+    "ch": "switzerland",
+    "cn": "china",
+    "de": "germany",
+    "es": "spain",
+    "fr": "france",
+    "gb": "united kingdom",
+    "ie": "ireland",
+    "in": "india",
+    "it": "italy",
+    "jp": "japan",
+    "nz": "new zealand",
+    "pl": "poland",
+    "us": "united states of america",
+    "za": "south africa",
+}
+
+
+def _split(value: Optional[str]) -> FrozenSet[str]:
+    """Comma-separated parameter -> set of lowercase values"""
+    if not value:
+        return frozenset()
+    return frozenset(part.strip().lower() for part in value.split(",") if part.strip())
+
+
+def _normalize(spec: Dict) -> Tuple:
+    """(query, categories, countries, language) of a spec"""
+    query = (spec.get("query") or "").strip() or None
+    return (
+        query,
+        _split(spec.get("category")),
+        _split(spec.get("country")),
+        (spec.get("language") or "en").lower(),
+    )
+
+
+def _mergeable_query(query: Optional[str]) -> bool:
+    return query is not None and not _OPERATORS.search(query)
+
+
+def _combined_query(queries: List[str]) -> str:
+    """OR the queries together; multi-word queries keep their AND inside brackets"""
+    if len(queries) == 1:
+        return queries[0]
+    return " OR ".join(f"({query})" if " " in query else query for query in queries)
+
+
+def plan_queries(
+    specs: List[Dict],
+    max_specs_per_request: int = DEFAULT_MAX_SPECS,
+    merge_queries: bool = True
+) -> List[Dict]:
+    """
+    Pack query specs into the fewest NewsData requests
+
+    Args:
+        specs: Dicts with optional query / category / country / language
+               (category and country may already be comma-separated)
+        max_specs_per_request: Most specs served by one request
+        merge_queries: OR different keywords together (may drop articles that
+                       only matched in body text the response doesn't include)
+
+    Returns:
+        One dict per request: {"query", "category", "country", "language"}
+        (request parameters) and "members" (indexes into `specs`)
+    """
+    # Identical specs share one slot from the start
+    slots: Dict[Tuple, List[int]] = {}
+    for index, spec in enumerate(specs):
+        slots.setdefault(_normalize(spec), []).append(index)
+
+    # Each request: [queries (tuple), categories, countries, language, members, spec count]
+    requests = []
+
+    # 1. Same filters, different keywords -> OR the keywords
+    groups: Dict[Tuple, List[Tuple]] = {}
+    for key in slots:
+        query, categories, countries, language = key
+        if merge_queries and _mergeable_query(query):
+            groups.setdefault((categories, countries, language), []).append(key)
+        else:
+            requests.append([(query,), categories, countries, language, list(slots[key]), 1])
+
+    for (categories, countries, language), keys in groups.items():
+        current = None
+        for key in keys:
+            query = key[0]
+            if current is not None and (
+                current[5] < max_specs_per_request
+                and len(_combined_query(list(current[0]) + [query])) <= MAX_QUERY_CHARS
+            ):
+                current[0] += (query,)
+                current[4].extend(slots[key])
+                current[5] += 1
+            else:
+                current = [(query,), categories, countries, language, list(slots[key]), 1]
+                requests.append(current)
+
+    # 2. Same keywords and countries, different categories -> list the categories
+    # 3. Same keywords and categories, different countries -> list the countries
+    for dimension, limit in ((1, MAX_CATEGORIES), (2, MAX_COUNTRIES)):
+        merged = []
+        open_requests: Dict[Tuple, list] = {}
+
+        for request in requests:
+            values = request[dimension]
+            mergeable = bool(values) and (
+                dimension == 1 or all(code in COUNTRY_NAMES for code in values)
+            )
+            if not mergeable:
+                merged.append(request)
+                continue
+
+            other = 2 if dimension == 1 else 1
+            key = (request[0], request[other], request[3])
+            target = open_requests.get(key)
+
+            if target is not None and (
+                len(target[dimension] | values) <= limit
+                and target[5] + request[5] <= max_specs_per_request
+            ):
+                target[dimension] = target[dimension] | values
+                target[4].extend(request[4])
+                target[5] += request[5]
+            else:
+                request = list(request)
+                open_requests[key] = request
+                merged.append(request)
+
+        requests = merged
+
+    return [
+        {
+            "query": _combined_query(list(queries)) if queries[0] is not None else None,
+            "category": ",".join(sorted(categories)) or None,
+            "country": ",".join(sorted(countries)) or None,
+            "language": language,
+            "members": sorted(members),
+        }
+        for queries, categories, countries, language, members, _ in requests
+    ]
+
+
+def _article_words(article: Dict) -> set:
+    parts = list(article.get("keywords") or [])
+    for field in TEXT_FIELDS:
+        value = article.get(field)
+        if isinstance(value, str) and not value.startswith(PAID_PLAN_PREFIX):
+            parts.append(value)
+    return set(_WORD.findall(" ".join(parts).lower()))
+
+
+def matches(article: Dict, spec: Dict, request: Dict) -> bool:
+    """
+    True if an article from a combined request answers a member spec
+
+    Only the dimensions that were widened for the combined request are
+    checked - the API already applied the rest. Keywords are looked up in the
+    text the article carries (see TEXT_FIELDS), not the full text the API
+    searched, so a body-only match is missed.
+    """
+    query, categories, countries, _ = _normalize(spec)
+    request_query, request_categories, request_countries, _ = _normalize(request)
+
+    if query and query != request_query:
+        if not set(_WORD.findall(query.lower())) <= _article_words(article):
+            return False
+
+    if categories and categories != request_categories:
+        if not categories & {c.lower() for c in article.get("category") or []}:
+            return False
+
+    if countries and countries != request_countries:
+        names = {COUNTRY_NAMES.get(code) for code in countries}
+        if not names & {c.lower() for c in article.get("country") or []}:
+            return False
+
+    return True
+
+
+def demultiplex(articles: List[Dict], specs: List[Dict], request: Dict) -> Dict[int, List[Dict]]:
+    """
+    Split a combined request's articles back to its member specs
+
+    Returns:
+        {spec index: matching articles}; an article can belong to several specs
+    """
+    members = request["members"]
+    if len({tuple(_normalize(specs[i])) for i in members}) == 1:
+        return {index: list(articles) for index in members}
+
+    return {
+        index: [article for article in articles if matches(article, specs[index], request)]
+        for index in members
+    }
+
+
+def fetch_coalesced(
+    fetcher,
+    specs: List[Dict],
+    pages: int = 1,
+    max_specs_per_request: int = DEFAULT_MAX_SPECS,
+    merge_queries: bool = True
+) -> List[List[Dict]]:
+    """
+    Answer many query specs with as few credits as possible
+
+    Args:
+        fetcher: NewsDataFetcher (anything with fetch_latest_news(query, category,
+                 country, language, page=...))
+        specs: Query specs (see plan_queries)
+        pages: Pages (credits) to fetch per combined request
+        max_specs_per_request: Most specs served by one request
+        merge_queries: OR different keywords together (see plan_queries)
+
+    Returns:
+        One list of articles per spec, in the same order as `specs`
+    """
+    plan = plan_queries(specs, max_specs_per_request, merge_queries)
+    results: List[List[Dict]] = [[] for _ in specs]
+
+    print(f"\n🧮 {len(specs)} queries -> {len(plan)} requests "
+          f"({len(specs) - len(plan)} credits saved per page)")
+
+    for request in plan:
+        articles = []
+        next_page = None
+
+        for _ in range(pages):
+            result = fetcher.fetch_latest_news(
+                query=request["query"],
+                category=request["category"],
+                country=request["country"],
+                language=request["language"],
+                page=next_page,
+            )
+            if result.get("status") != "success":
+                print(f"  → {request['query'] or request['category'] or request['country']}: "
+                      f"Error - {result.get('message')}")
+                break
+
+            articles.extend(result.get("results", []))
+            next_page = result.get("nextPage")
+            if not next_page:
+                break
+
+        for index, matched in demultiplex(articles, specs, request).items():
+            results[index].extend(matched)
+
+    return results
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Multi-Window Rate Limiter
+=========================
+
+Enforces several rate windows at once, e.g. NewsData.io's documented limits:
+- 10 credits per second
+- 30 credits per 15 minutes
+
+Each window is a sliding log of granted timestamps. acquire() returns
+immediately while every window has room, so bursts go through at full speed,
+and only blocks for exactly as long as it takes the oldest entry of a full
+window to expire. (A plain token bucket refilling at 30/15min would allow up to
+60 calls inside one 15-minute span after an initial burst, so the sliding log
+is used to stay strictly within the provider's windows.)
+
+Usage:
+    from rate_limiter import RateLimiter, NEWSDATA_RATE_LIMITER
+
+    NEWSDATA_RATE_LIMITER.acquire()      # Blocks only if a window is full
+
+    polite = RateLimiter([(1, 2.0)])     # At most 1 call every 2 seconds
+    polite.acquire()
+
+    per_host = DomainThrottle(1.0)       # At most 1 call per second per domain
+    per_host.acquire("https://www.bbc.co.uk/news/article")
+"""
+
+import bisect
+import threading
+import time
+from typing import Dict, List, Tuple
+from urllib.parse import urlparse
+
+# NewsData.io free tier: (max credits, window in seconds)
+NEWSDATA_RATE_LIMITS = [
+    (10, 1.0),
+    (30, 15 * 60.0),
+]
+
+
+class RateLimiter:
+    """
+    Thread-safe limiter over one or more (max_calls, period_seconds) windows
+    """
+
+    def __init__(self, limits: List[Tuple[int, float]]):
+        """
+        Args:
+            limits: List of (max_calls, period_seconds) windows, all enforced together
+        """
+        if not limits:
+            raise ValueError("At least one (max_calls, period) window is required")
+
+        self.limits = sorted(limits, key=lambda limit: limit[1])
+        self._max_period = max(period for _, period in self.limits)
+        self._calls: List[float] = []  # Monotonic timestamps of granted calls, oldest first
+        self._lock = threading.Lock()
+
+    def _wait_time(self, now: float, cost: int) -> float:
+        """Seconds until `cost` more calls fit in every window (0 = fits now)"""
+
+        # Forget calls that have left even the longest window
+        expired = bisect.bisect_right(self._calls, now - self._max_period)
+        if expired:
+            del self._calls[:expired]
+
+        wait = 0.0
+        for max_calls, period in self.limits:
+            start = bisect.bisect_right(self._calls, now - period)
+            excess = (len(self._calls) - start) + cost - max_calls
+            if excess > 0:
+                # The `excess` oldest calls in this window have to expire first
+                wait = max(wait, self._calls[start + excess - 1] + period - now)
+        return wait
+
+    def try_acquire(self, cost: int = 1) -> bool:
+        """Take `cost` slots if available right now, without blocking"""
+        self._check_cost(cost)
+
+        with self._lock:
+            now = time.monotonic()
+            if self._wait_time(now, cost) > 0:
+                return False
+            self._calls.extend([now] * cost)
+            return True
+
+    def acquire(self, cost: int = 1) -> float:
+        """
+        Block until `cost` slots are available in every window, then take them
+
+        Returns:
+            Seconds spent waiting
+        """
+        self._check_cost(cost)
+        waited = 0.0
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = self._wait_time(now, cost)
+                if wait <= 0:
+                    self._calls.extend([now] * cost)
+                    return waited
+
+            time.sleep(wait)
+            waited += wait
+
+    async def acquire_async(self, cost: int = 1) -> float:
+        """
+        asyncio version of acquire(): waits with asyncio.sleep instead of blocking
+
+        Shares the same windows, so sync and async callers are limited together.
+
+        Returns:
+            Seconds spent waiting
+        """
+        import asyncio  # Already loaded by the running event loop; keeps sync imports light
+
+        self._check_cost(cost)
+        waited = 0.0
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = self._wait_time(now, cost)
+                if wait <= 0:
+                    self._calls.extend([now] * cost)
+                    return waited
+
+            await asyncio.sleep(wait)
+            waited += wait
+
+    def _check_cost(self, cost: int):
+        """A request larger than the smallest window could never be granted"""
+        smallest = min(max_calls for max_calls, _ in self.limits)
+        if cost < 1 or cost > smallest:
+            raise ValueError(f"cost must be between 1 and {smallest}, got {cost}")
+
+
+class DomainThrottle:
+    """
+    Per-domain minimum interval between requests
+
+    Keeps one single-call RateLimiter per host, so concurrent workers can hit
+    many different publishers at once while each host still sees at most one
+    request every `min_interval` seconds.
+    """
+
+    def __init__(self, min_interval: float):
+        """
+        Args:
+            min_interval: Seconds between two requests to the same domain (0 = no limit)
+        """
+        self.min_interval = min_interval
+        self._limiters: Dict[str, RateLimiter] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url: str) -> float:
+        """
+        Block until the domain of `url` may be requested again
+
+        Returns:
+            Seconds spent waiting
+        """
+        if self.min_interval <= 0:
+            return 0.0
+
+        domain = urlparse(url).netloc.lower()
+        with self._lock:
+            limiter = self._limiters.get(domain)
+            if limiter is None:
+                limiter = RateLimiter([(1, self.min_interval)])
+                self._limiters[domain] = limiter
+
+        return limiter.acquire()
+
+
+# Shared by every NewsData client in this process (the limits are per API key)
+NEWSDATA_RATE_LIMITER = RateLimiter(NEWSDATA_RATE_LIMITS)
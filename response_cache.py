@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+NewsData Response Cache
+=======================
+
+Short-lived in-memory cache of NewsData.io API responses.
+
+Several jobs asking for "technology / us" within a few minutes would each
+spend a credit and a round trip on the same results. Responses are cached by
+their normalized query parameters instead, so repeats within `ttl` seconds
+are answered from memory: no credit, no request, well under a millisecond.
+
+- Key: endpoint + query parameters without `apikey`; values are trimmed,
+  lowercased and comma-separated lists sorted, so "US,gb" and "gb,us" share
+  an entry
+- Only successful responses are cached
+- Expiry: `ttl` seconds (NEWSDATA_CACHE_TTL, default 300; 0 disables)
+- Size bound: at most `max_entries` responses, least recently used evicted
+
+Shared by NewsDataFetcher (both modules) and
+NewsDataWithContent.fetch_from_newsdata through get_response_cache().
+
+Usage:
+    from response_cache import get_response_cache
+
+    cache = get_response_cache()
+    data = cache.get("latest", params)
+    if data is None:
+        data = call_api(params)
+        cache.put("latest", params, data)
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from metrics import get_metrics
+
+DEFAULT_TTL = float(os.getenv("NEWSDATA_CACHE_TTL", "300"))  # 5 minutes
+DEFAULT_MAX_ENTRIES = 512
+
+IGNORED_PARAMS = {"apikey"}
+CASE_INSENSITIVE_PARAMS = {"category", "country", "language", "domain", "prioritydomain"}
+
+
+def normalize_params(params: Dict) -> Dict[str, str]:
+    """Query parameters as compared by the cache (apikey dropped, lists sorted)"""
+    normalized = {}
+    for name, value in params.items():
+        if name in IGNORED_PARAMS or value is None:
+            continue
+        text = str(value).strip()
+        if name in CASE_INSENSITIVE_PARAMS:
+            text = ",".join(sorted(part.strip().lower() for part in text.split(",") if part.strip()))
+        normalized[name] = text
+    return normalized
+
+
+class ResponseCache:
+    """
+    Thread-safe TTL + LRU cache of API responses keyed by normalized parameters
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Args:
+            ttl: Seconds a response stays valid (0 disables caching)
+            max_entries: Most responses kept in memory
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (created, payload)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(endpoint: str, params: Dict) -> str:
+        return endpoint + "?" + json.dumps(normalize_params(params), sort_keys=True)
+
+    def get(self, endpoint: str, params: Dict) -> Optional[Dict]:
+        """
+        Return a fresh copy of the cached response, or None if missing or expired
+
+        Args:
+            endpoint: API endpoint name (e.g. "latest")
+            params: Request query parameters (apikey is ignored)
+        """
+        if self.ttl <= 0:
+            return None
+
+        key = self.key(endpoint, params)
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or now - entry[0] > self.ttl:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                hit = False
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                hit = True
+
+        get_metrics().record_cache("newsdata_response", hit=hit)
+        # Stored serialized, so callers can modify the articles they get back
+        return json.loads(entry[1]) if hit else None
+
+    def put(self, endpoint: str, params: Dict, data: Dict):
+        """Store a successful response, evicting the least recently used ones if full"""
+        if self.ttl <= 0 or data.get("status") != "success":
+            return
+
+        key = self.key(endpoint, params)
+        payload = json.dumps(data, ensure_ascii=False)
+
+        with self._lock:
+            self._entries[key] = (time.time(), payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove every entry"""
+        with self._lock:
+            self._entries.clear()
+
+
+_response_cache: Optional[ResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide NewsData response cache"""
+    global _response_cache
+
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                _response_cache = ResponseCache()
+    return _response_cache
@@ -7,9 +7,11 @@ Works directly with news publisher RSS feeds (not Google).
 No API keys, no limits, completely free.
 """
 
-import feedparser
+from http_session import fetch_feed
 import json
-from typing import List, Dict
+from typing import List, Dict, Optional
+from article_store import ArticleStore
+from metrics import get_metrics
 import time
 
 # Direct RSS feeds from news publishers (completely free, no auth)
@@ -23,8 +25,8 @@ NEWS_FEEDS = {
 }
 
 
-def fetch_news(source: str = "BBC News", limit: int = 5) -> List[Dict]:
-    """Fetch articles from RSS feed"""
+def fetch_news(source: str = "BBC News", limit: int = 5, store: Optional[ArticleStore] = None) -> List[Dict]:
+    """Fetch articles from RSS feed (appended to `store` if given)"""
 
     url = NEWS_FEEDS.get(source)
     if not url:
@@ -34,7 +36,7 @@ def fetch_news(source: str = "BBC News", limit: int = 5) -> List[Dict]:
     print(f"📰 Fetching from {source}...")
 
     try:
-        feed = feedparser.parse(url)
+        feed = fetch_feed(url)
 
         if not feed.entries:
             print(f"   ❌ No articles found")
@@ -51,6 +53,9 @@ def fetch_news(source: str = "BBC News", limit: int = 5) -> List[Dict]:
             }
             articles.append(article)
 
+        if store:
+            store.append_many(articles)
+
         print(f"   ✓ Got {len(articles)} articles\n")
         return articles
 
@@ -77,7 +82,7 @@ def show_articles(articles: List[Dict]):
 def save_json(articles: List[Dict], filename: str = "news_articles.json"):
     """Save to JSON"""
 
-    with open(filename, "w", encoding="utf-8") as f:
+    with get_metrics().timer("save", target="json"), open(filename, "w", encoding="utf-8") as f:
         json.dump(articles, f, indent=2, ensure_ascii=False)
 
     print(f"\n✓ Saved to {filename}")
@@ -102,8 +107,10 @@ def main():
     # Fetch from all sources
     all_articles = []
 
+    store = ArticleStore(name="simple_news")
+
     for source in ["BBC News", "Reuters", "CNN"]:
-        articles = fetch_news(source, limit=3)
+        articles = fetch_news(source, limit=3, store=store)
         all_articles.extend(articles)
         time.sleep(1)
 
@@ -14,15 +14,18 @@ This is the best solution for:
 - Supports 30+ languages
 """
 
-import feedparser
-from news_please.crawler import NewsPlease
+from http_session import fetch_feed, stream_html, DEFAULT_MAX_HTML_BYTES
 from typing import List, Dict, Optional
 import json
-import time
 from datetime import datetime
-import requests
-
-print("""
+from rate_limiter import RateLimiter
+from content_cache import get_content_cache
+from dedup_index import DedupIndex
+from article_store import ArticleStore
+from metrics import get_metrics
+
+# Printed by main() only, so importing this module has no side effects
+BANNER = """
 ╔══════════════════════════════════════════════════════════════════════════════╗
 ║              UNLIMITED FREE NEWS FETCHER - news-please library               ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
@@ -37,7 +40,24 @@ Features:
 ✓ Multi-language support
 
 Cost: $0/month forever
-""")
+"""
+
+_news_please = None
+
+
+def load_news_please():
+    """
+    Import news-please on first use
+
+    news_please pulls in a large dependency tree; callers that only read RSS
+    (get_rss_articles) never pay for it.
+    """
+    global _news_please
+
+    if _news_please is None:
+        from news_please.crawler import NewsPlease
+        _news_please = NewsPlease
+    return _news_please
 
 
 class UnlimitedNewsFetcher:
@@ -58,10 +78,18 @@ class UnlimitedNewsFetcher:
         "NPR News": "https://feeds.npr.org/1001/rss.xml",
     }
 
-    def __init__(self):
+    def __init__(self, store: Optional[ArticleStore] = None):
+        """
+        Args:
+            store: Optional ArticleStore that articles are appended to as they are extracted
+        """
         self.articles_fetched = 0
         self.requests_made = 0
         self.errors = 0
+        self.extract_limiter = RateLimiter([(1, 2.0)])  # At most 1 extraction every 2s
+        self.content_cache = get_content_cache()
+        self.dedup_index = DedupIndex()  # Stories returned with dedup=True, across feeds and calls
+        self.store = store
 
     def get_rss_articles(self, feed_name: str, limit: int = 10) -> List[Dict]:
         """Fetch articles from RSS feed"""
@@ -73,7 +101,7 @@ class UnlimitedNewsFetcher:
 
         try:
             print(f"\n📡 Fetching from {feed_name}...")
-            feed = feedparser.parse(url)
+            feed = fetch_feed(url)
 
             articles = []
             for entry in feed.entries[:limit]:
@@ -93,27 +121,48 @@ class UnlimitedNewsFetcher:
             print(f"   ✗ Error: {e}")
             return []
 
-    def extract_full_content(self, article: Dict, timeout: int = 10) -> Dict:
+    def extract_full_content(
+        self,
+        article: Dict,
+        timeout: int = 10,
+        max_bytes: int = DEFAULT_MAX_HTML_BYTES
+    ) -> Dict:
         """
         Extract full article content using news-please
 
         Args:
             article: Article dict with 'link' field
             timeout: Request timeout
+            max_bytes: Maximum page bytes to download (non-HTML pages are skipped)
 
         Returns:
             Article dict with full content added
+
+        Extractions are cached by normalized URL, so re-runs skip links already seen.
         """
 
         if not article.get("link"):
             return article
 
+        cached = self.content_cache.get(article["link"], namespace="newsplease")
+        if cached is not None:
+            article.update(cached)
+            article["content_available"] = True
+            print(f"   ✓ Cached content for: {article['link']}")
+            return article
+
         try:
             url = article["link"]
+
+            # Be respectful - waits only for what is left of the interval
+            self.extract_limiter.acquire()
             print(f"   Extracting content from: {url}")
 
-            # news-please extracts full article text automatically
-            article_obj = NewsPlease.from_url(url, timeout_seconds=timeout)
+            # Download through the pooled session, then let news-please
+            # extract the full article text from the HTML
+            html = "".join(stream_html(url, timeout=timeout, max_bytes=max_bytes))
+            with get_metrics().timer("extract", extractor="news_please"):
+                article_obj = load_news_please().from_html(html, url=url)
 
             if article_obj:
                 article["full_content"] = article_obj.text[:3000]  # First 3000 chars
@@ -122,6 +171,11 @@ class UnlimitedNewsFetcher:
                 article["image_url"] = article_obj.image_url
                 article["content_available"] = True
                 print(f"   ✓ Extracted {len(article['full_content'])} characters")
+
+                self.content_cache.put(url, {
+                    field: article[field]
+                    for field in ("full_content", "authors", "publish_date", "image_url")
+                }, namespace="newsplease")
             else:
                 article["content_available"] = False
                 print(f"   ✗ Could not extract content")
@@ -139,7 +193,8 @@ class UnlimitedNewsFetcher:
         self,
         feed_name: str = "BBC News",
         num_articles: int = 5,
-        scrape_content: bool = True
+        scrape_content: bool = True,
+        dedup: bool = False
     ) -> List[Dict]:
         """
         Fetch articles from RSS and extract full content
@@ -148,14 +203,23 @@ class UnlimitedNewsFetcher:
             feed_name: Name of RSS feed
             num_articles: Number of articles to fetch
             scrape_content: Whether to extract full content
+            dedup: Drop stories this instance already returned, from any feed and
+                   in any earlier call (same canonical link or near-identical
+                   title/summary) before extracting
 
         Returns:
-            List of articles with full content
+            List of articles with full content (minus duplicates when dedup=True)
         """
 
         # Step 1: Get articles from RSS feed
         articles = self.get_rss_articles(feed_name, limit=num_articles)
 
+        if dedup:
+            fetched = len(articles)
+            articles = self.dedup_index.filter(articles)
+            if len(articles) < fetched:
+                print(f"   ≈ Skipped {fetched - len(articles)} duplicate articles")
+
         if not articles:
             return []
 
@@ -168,15 +232,15 @@ class UnlimitedNewsFetcher:
                 print(f"\n[{i}/{len(articles)}]")
                 extracted = self.extract_full_content(article)
                 enriched.append(extracted)
-
-                # Be respectful - add delay between requests
-                if i < len(articles):
-                    time.sleep(2)
+                if self.store:
+                    self.store.append(extracted)
 
             self.articles_fetched = sum(1 for a in enriched if a.get("content_available"))
             return enriched
         else:
             self.articles_fetched = len(articles)
+            if self.store:
+                self.store.append_many(articles)
             return articles
 
     def display_article(self, article: Dict, number: int = 1):
@@ -201,7 +265,7 @@ class UnlimitedNewsFetcher:
     def save_to_json(self, articles: List[Dict], filename: str = "unlimited_news.json"):
         """Save articles to JSON"""
 
-        with open(filename, "w", encoding="utf-8") as f:
+        with get_metrics().timer("save", target="json"), open(filename, "w", encoding="utf-8") as f:
             json.dump(articles, f, indent=2, ensure_ascii=False)
 
         print(f"\n✓ Saved {len(articles)} articles to {filename}")
@@ -212,7 +276,9 @@ class UnlimitedNewsFetcher:
 # ============================================================================
 
 def main():
-    fetcher = UnlimitedNewsFetcher()
+    print(BANNER)
+
+    fetcher = UnlimitedNewsFetcher(store=ArticleStore(name="unlimited_news"))
 
     print("\n" + "="*100)
     print("AVAILABLE RSS FEEDS (Completely Free)")
@@ -295,32 +361,22 @@ news-please (Unlimited):
    - Most news sites have RSS feeds
    - Format: https://example.com/feed.xml or /rss.xml
 
-3. Run on a schedule (e.g., every hour):
-   - cron job (Linux/Mac)
-   - Windows Task Scheduler
-   - APScheduler (Python)
+3. Keep feeds fresh continuously:
+   - python feed_poller.py polls every feed on its own adaptive timer
+     (fast publishers often, quiet ones rarely) instead of an hourly sweep
 
 4. Store articles in database:
    - PostgreSQL (already configured in your .env)
    - MongoDB
    - Elasticsearch
 
-Example with schedule:
-
-    import schedule
-    import time
-
-    def fetch_news():
-        fetcher = UnlimitedNewsFetcher()
-        articles = fetcher.fetch_and_extract("BBC News", num_articles=10)
-        fetcher.save_to_json(articles)
+Example with the adaptive poller:
 
-    # Run every hour
-    schedule.every(1).hours.do(fetch_news)
+    from feed_poller import FeedPoller
+    from article_store import ArticleStore
 
-    while True:
-        schedule.run_pending()
-        time.sleep(60)
+    poller = FeedPoller(store=ArticleStore(name="poller"))
+    poller.run()  # Until Ctrl+C; intervals are learned per feed
     """)
 
 
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Article URL Normalization
+=========================
+
+Helpers that map the many spellings of an article link to one key:
+
+- normalize_url(): cheap syntactic cleanup (case, www., fragment, tracking params)
+- canonicalize_url(): normalize_url() plus unwrapping of redirect links such as
+  Google News RSS article URLs and google.com/url?q=... links
+
+Used as cache keys (content_cache) and for cross-source dedup (dedup_index).
+"""
+
+import base64
+import re
+from urllib.parse import parse_qs, parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track the click and never change the page
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid", "igshid",
+    "ref", "ref_src", "cmpid", "ocid", "at_medium", "at_campaign", "CMP",
+}
+
+_EMBEDDED_URL = re.compile(rb"https?://[\x21-\x7e]+")
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize an article URL so trivially different links share one key
+
+    - lowercases scheme and host, drops default ports and "www."
+    - drops the #fragment
+    - removes utm_* and other tracking parameters, sorts the rest
+    - removes a trailing slash from the path
+    """
+    parts = urlsplit(url.strip())
+
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if parts.port and not (
+        (scheme == "http" and parts.port == 80) or (scheme == "https" and parts.port == 443)
+    ):
+        host = f"{host}:{parts.port}"
+
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key not in TRACKING_PARAMS
+    ]
+    path = parts.path.rstrip("/") or "/"
+
+    return urlunsplit((scheme, host, path, urlencode(sorted(query)), ""))
+
+
+def resolve_google_news_url(url: str) -> str:
+    """
+    Return the publisher URL wrapped in a Google News link, if it can be decoded offline
+
+    Google News RSS links look like news.google.com/rss/articles/CBMi...; the
+    article id is a base64 protobuf that (in the classic format) contains the
+    target URL verbatim. Links in the newer opaque format are returned unchanged.
+    """
+    parts = urlsplit(url)
+    host = (parts.hostname or "").lower()
+
+    if host in ("google.com", "www.google.com") and parts.path == "/url":
+        target = parse_qs(parts.query).get("q") or parse_qs(parts.query).get("url")
+        return target[0] if target else url
+
+    if host != "news.google.com":
+        return url
+
+    target = parse_qs(parts.query).get("url")
+    if target:
+        return target[0]
+
+    segments = [segment for segment in parts.path.split("/") if segment]
+    if len(segments) < 2 or segments[-2] != "articles":
+        return url
+
+    article_id = segments[-1]
+    try:
+        decoded = base64.urlsafe_b64decode(article_id + "=" * (-len(article_id) % 4))
+    except (ValueError, TypeError):
+        return url
+
+    match = _EMBEDDED_URL.search(decoded)
+    if not match:
+        return url
+
+    # The URL is protobuf field 4 (tag byte 0x22) with a 1- or 2-byte varint
+    # length; prefer that length over the regex end, since the next field's
+    # tag byte may be printable
+    start = match.start()
+    length = None
+    if start >= 2 and decoded[start - 2] == 0x22:
+        length = decoded[start - 1]
+    elif start >= 3 and decoded[start - 3] == 0x22 and decoded[start - 2] >= 0x80:
+        length = (decoded[start - 2] & 0x7F) | (decoded[start - 1] << 7)
+
+    if length and start + length <= len(decoded):
+        return decoded[start:start + length].decode("ascii", errors="ignore")
+    return match.group(0).decode("ascii")
+
+
+def canonicalize_url(url: str) -> str:
+    """Unwrap redirect links, then normalize"""
+    return normalize_url(resolve_google_news_url(url))